@@ -0,0 +1,171 @@
+"""
+Benchmark suite for the fastapi_dishka request hot path.
+
+Scenarios:
+    bare            route without dependencies, no middlewares
+    from_dishka     route with an APP- and a REQUEST-scoped FromDishka parameter
+    middleware_N    bare route behind N pass-through `Middleware` subclasses (N = 1, 5, 10)
+    get_dependency  bare route behind one `Middleware` calling get_dependency() per request
+
+For each scenario prints requests/sec, peak traced bytes per request and retained
+allocation blocks per request. Save the results as a baseline and compare later runs
+(e.g. after upgrading fastapi_dishka, dishka or starlette) against it.
+
+Usage:
+    python benchmarks/bench_hot_path.py [--requests 5000] [--repeat 3] [--only bare,from_dishka]
+    python benchmarks/bench_hot_path.py --save baseline.json
+    python benchmarks/bench_hot_path.py --compare baseline.json [--threshold 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from dishka import FromDishka, Provider, Scope, provide
+from harness import Result, measure
+
+from fastapi_dishka import APIRouter, App, Middleware, provide_middleware, provide_router
+from fastapi_dishka.providers import ProviderMeta
+
+
+class Settings:
+    """APP-scoped dependency."""
+
+    value = "1"
+
+
+class RequestService:
+    """REQUEST-scoped dependency."""
+
+
+router = APIRouter()
+
+
+@router.get("/bare")
+async def bare() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@router.get("/from-dishka")
+async def from_dishka(settings: FromDishka[Settings], service: FromDishka[RequestService]) -> dict[str, str]:
+    return {"status": settings.value}
+
+
+def make_pass_through_middleware(index: int) -> type[Middleware]:
+    return type(f"PassThroughMiddleware{index}", (Middleware,), {})
+
+
+class GetDependencyMiddleware(Middleware):
+    async def dispatch(self, request, call_next):
+        await self.get_dependency(request, Settings)
+        return await call_next(request)
+
+
+async def build_app(*middlewares: type[Middleware]) -> App:
+    class BenchProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        settings = provide(Settings, scope=Scope.APP)
+        service = provide(RequestService, scope=Scope.REQUEST)
+        bench_router = provide_router(router)
+        middleware_providers = [provide_middleware(middleware) for middleware in middlewares]
+
+    app = App("bench", "0.0.0", BenchProvider())
+    await app._resolve_container()
+    return app
+
+
+def scenarios() -> dict[str, tuple[Callable[[], Awaitable[App]], str]]:
+    def middlewares(count: int) -> Callable[[], Awaitable[App]]:
+        return lambda: build_app(*(make_pass_through_middleware(index) for index in range(count)))
+
+    return {
+        "bare": (build_app, "/bare"),
+        "from_dishka": (build_app, "/from-dishka"),
+        "middleware_1": (middlewares(1), "/bare"),
+        "middleware_5": (middlewares(5), "/bare"),
+        "middleware_10": (middlewares(10), "/bare"),
+        "get_dependency": (lambda: build_app(GetDependencyMiddleware), "/bare"),
+    }
+
+
+def environment() -> dict[str, str]:
+    versions = {"python": platform.python_version()}
+    for package in ("fastapi-dishka", "dishka", "fastapi", "starlette"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            # e.g. running from a source checkout that is not installed
+            versions[package] = "unknown"
+    return versions
+
+
+def compare(results: list[Result], baseline_path: Path, threshold: float) -> bool:
+    """Print the change against a baseline; return False if any scenario regressed beyond the threshold."""
+    baseline = json.loads(baseline_path.read_text())
+    previous = {entry["name"]: entry for entry in baseline["results"]}
+    ok = True
+
+    print(f"\nCompared to {baseline_path} ({baseline['environment']}):")
+    for result in results:
+        entry = previous.get(result.name)
+        if entry is None:
+            print(f"  {result.name:<16} (not in baseline)")
+            continue
+
+        change = result.requests_per_second / entry["requests_per_second"] - 1
+        memory_change = result.peak_bytes_per_request - entry["peak_bytes_per_request"]
+        regressed = change < -threshold
+        ok = ok and not regressed
+        marker = "REGRESSION" if regressed else ""
+        print(f"  {result.name:<16} {change:>+8.1%} req/s  {memory_change:>+10.0f} B/request  {marker}")
+
+    return ok
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario; the best one is kept")
+    parser.add_argument("--only", help="Comma-separated scenario names to run")
+    parser.add_argument("--save", type=Path, help="Write the results to this baseline JSON file")
+    parser.add_argument("--compare", type=Path, help="Compare the results with this baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Allowed req/s drop before failing (0.1 = 10%%)")
+    args = parser.parse_args()
+
+    selected = scenarios()
+    if args.only:
+        names = args.only.split(",")
+        unknown = set(names) - set(selected)
+        if unknown:
+            parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+        selected = {name: selected[name] for name in names}
+
+    results: list[Result] = []
+    print(f"{'scenario':<16} {'req/s':>10} {'peak B/req':>12} {'retained blocks/req':>20}")
+    for name, (factory, path) in selected.items():
+        app = await factory()
+        result = await measure(name, app.app, path, args.requests, args.repeat)
+        await app.close()
+        results.append(result)
+        print(
+            f"{name:<16} {result.requests_per_second:>10.0f} {result.peak_bytes_per_request:>12.0f} "
+            f"{result.retained_blocks_per_request:>20.2f}"
+        )
+
+    if args.save:
+        payload = {"environment": environment(), "results": [result.as_dict() for result in results]}
+        args.save.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
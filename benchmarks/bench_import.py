@@ -0,0 +1,71 @@
+"""
+Benchmark the import time of fastapi_dishka with `python -X importtime`.
+
+Each statement runs in a fresh interpreter, several times; the best cumulative time of the
+top-level import is reported. With --max-ms the script fails when a statement is slower, and
+with --forbid it fails when a statement loads one of the given modules (e.g. uvicorn).
+
+Usage:
+    python benchmarks/bench_import.py [--runs 5]
+    python benchmarks/bench_import.py --max-ms 1000 --forbid uvicorn,multiprocessing
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import fastapi_dishka",
+    "from fastapi_dishka import Provider, provide_router",
+    "from fastapi_dishka import App",
+]
+
+
+def measure(statement: str) -> tuple[float, set[str]]:
+    """Return the cumulative import time (ms) of the statement and the modules it loaded."""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], check=True, capture_output=True, text=True, env=env
+    )
+
+    # Lines look like "import time:   self [us] |   cumulative | module"; nesting is indented
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit() and not module.startswith("  "):
+            total_us += int(cumulative)
+
+    return total_us / 1000, {module.split(".")[0] for module in result.stdout.split()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per statement; the best run is kept")
+    parser.add_argument("--max-ms", type=float, help="Fail if a statement takes longer than this")
+    parser.add_argument("--forbid", default="", help="Comma-separated modules no statement may import")
+    args = parser.parse_args()
+
+    # Imports done by every interpreter (site, encodings, ...) are part of the baseline
+    baseline = min(measure("pass")[0] for _ in range(args.runs))
+    forbidden = {module for module in args.forbid.split(",") if module}
+    ok = True
+
+    print(f"{'statement':<52} {'ms':>8}  forbidden modules loaded")
+    for statement in STATEMENTS:
+        runs = [measure(statement) for _ in range(args.runs)]
+        elapsed = min(run[0] for run in runs) - baseline
+        loaded = sorted(forbidden & runs[0][1])
+        too_slow = args.max_ms is not None and elapsed > args.max_ms
+        ok = ok and not loaded and not too_slow
+        marker = "TOO SLOW" if too_slow else ""
+        print(f"{statement:<52} {elapsed:>8.1f}  {', '.join(loaded) or '-'}  {marker}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Benchmark: BaseHTTPMiddleware-derived `Middleware` (separate or fused layers) vs pure ASGI `AsgiMiddleware`.
+
+Drives the ASGI application in-process (no network, no server) with a stack of
+DI-aware middlewares that each resolve an APP-scoped dependency per request.
+
+Usage:
+    python benchmarks/bench_middleware.py [--requests 5000] [--middlewares 3]
+"""
+
+import argparse
+import asyncio
+
+from dishka import Provider, Scope, provide
+from harness import measure
+
+from fastapi_dishka import APIRouter, App, AsgiMiddleware, Middleware, provide_middleware, provide_router
+from fastapi_dishka.providers import ProviderMeta
+
+
+class Settings:
+    """APP-scoped dependency resolved by every middleware."""
+
+    header_value = "1"
+
+
+router = APIRouter()
+
+
+@router.get("/ping")
+async def ping() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+def make_dispatch_middleware(index: int) -> type[Middleware]:
+    class DispatchMiddleware(Middleware):
+        async def dispatch(self, request, call_next):
+            settings = await self.get_dependency(request, Settings)
+            response = await call_next(request)
+            response.headers[f"x-mw-{index}"] = settings.header_value
+            return response
+
+    return DispatchMiddleware
+
+
+def make_asgi_middleware(index: int) -> type[AsgiMiddleware]:
+    header = f"x-mw-{index}".encode()
+
+    class PureAsgiMiddleware(AsgiMiddleware):
+        async def __call__(self, scope, receive, send):
+            if scope["type"] != "http":
+                await self.app(scope, receive, send)
+                return
+
+            settings = await self.get_dependency(scope, Settings)
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    message["headers"] = [*message["headers"], (header, settings.header_value.encode())]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+    return PureAsgiMiddleware
+
+
+async def build_app(factory, count: int, fuse: bool = False) -> App:
+    class BenchProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        settings = provide(Settings, scope=Scope.APP)
+        ping_router = provide_router(router)
+        middlewares = [provide_middleware(factory(index)) for index in range(count)]
+
+    app = App("bench", "0.0.0", BenchProvider(), fuse_middlewares=fuse)
+    await app._resolve_container()
+    return app
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--middlewares", type=int, default=3)
+    args = parser.parse_args()
+
+    variants = (
+        ("Middleware", make_dispatch_middleware, False),
+        ("Middleware fused", make_dispatch_middleware, True),
+        ("AsgiMiddleware", make_asgi_middleware, False),
+    )
+    for name, factory, fuse in variants:
+        app = await build_app(factory, args.middlewares, fuse)
+        result = await measure(name, app.app, "/ping", args.requests)
+        await app.close()
+        print(f"{name:<18} {args.middlewares} middlewares: {result.requests_per_second:>10.0f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
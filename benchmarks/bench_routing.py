@@ -0,0 +1,80 @@
+"""
+Benchmark route matching with ~1k routes, with and without `frozen_routing`.
+
+40 routers of 25 routes each (half static, half parameterized) are registered through
+`provide_router`. Scenarios hit the first and the last static route, the last parameterized
+route, and an unknown path (404, which also pays the trailing-slash redirect check).
+
+Usage:
+    python benchmarks/bench_routing.py [--requests 2000] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+
+from dishka import Provider, Scope
+from harness import measure
+
+from fastapi_dishka import APIRouter, App, provide_router
+from fastapi_dishka.providers import ProviderMeta
+
+ROUTERS = 40
+ROUTES_PER_ROUTER = 25  # odd, so the last route is static
+
+
+def make_router(index: int) -> APIRouter:
+    router = APIRouter(prefix=f"/service{index}")
+
+    async def endpoint() -> dict[str, str]:
+        return {"status": "ok"}
+
+    for route in range(ROUTES_PER_ROUTER):
+        if route % 2:
+            router.add_api_route(f"/resource{route}/{{item_id}}", endpoint, methods=["GET"])
+        else:
+            router.add_api_route(f"/resource{route}", endpoint, methods=["GET"])
+    return router
+
+
+async def build_app(frozen_routing: bool) -> App:
+    class RoutingBenchProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        routers = [provide_router(make_router(index)) for index in range(ROUTERS)]
+
+    app = App("bench", "0.0.0", RoutingBenchProvider(), frozen_routing=frozen_routing)
+    await app._resolve_container()
+    return app
+
+
+SCENARIOS = {
+    "first_static": ("/service0/resource0", 200),
+    # Even routes are static, odd ones parameterized
+    "last_static": (f"/service{ROUTERS - 1}/resource{ROUTES_PER_ROUTER - 1}", 200),
+    "last_param": (f"/service{ROUTERS - 1}/resource{ROUTES_PER_ROUTER - 2}/42", 200),
+    "not_found": ("/missing", 404),
+}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario; the best one is kept")
+    args = parser.parse_args()
+
+    linear = await build_app(frozen_routing=False)
+    frozen = await build_app(frozen_routing=True)
+
+    print(f"{len(linear.app.routes)} routes")
+    print(f"{'scenario':<14} {'linear req/s':>14} {'frozen req/s':>14} {'speedup':>9}")
+    for name, (path, status) in SCENARIOS.items():
+        before = await measure(name, linear.app, path, args.requests, args.repeat, expected_status=status)
+        after = await measure(name, frozen.app, path, args.requests, args.repeat, expected_status=status)
+        speedup = after.requests_per_second / before.requests_per_second
+        print(f"{name:<14} {before.requests_per_second:>14.0f} {after.requests_per_second:>14.0f} {speedup:>8.1f}x")
+
+    await linear.close()
+    await frozen.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+Shared helpers for the benchmarks: drive an ASGI app in-process and measure it.
+
+No network and no server are involved; requests are fed straight into the ASGI callable,
+so the numbers only reflect the framework + DI hot path.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+from starlette.types import ASGIApp, Message
+
+
+@dataclass
+class Result:
+    """Measurements of one benchmark scenario."""
+
+    name: str
+    requests_per_second: float
+    peak_bytes_per_request: float
+    retained_blocks_per_request: float
+
+    def as_dict(self) -> dict[str, object]:
+        return asdict(self)
+
+
+def http_scope(path: str) -> dict[str, object]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def call(app: ASGIApp, path: str) -> int:
+    """Send one GET request through the app and return the response status."""
+    status = 0
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(http_scope(path), _receive, send)
+    return status
+
+
+async def measure(
+    name: str,
+    app: ASGIApp,
+    path: str,
+    requests: int,
+    repeat: int = 3,
+    memory_requests: int = 200,
+    expected_status: int = 200,
+) -> Result:
+    """
+    Measure throughput and memory of one scenario.
+
+    Throughput is measured with tracing off, as the best of `repeat` runs to reduce noise.
+    Memory is measured in a second pass with tracemalloc on: the peak traced memory per
+    request, and the number of allocated blocks still alive afterwards (a leak indicator,
+    ideally 0).
+    """
+    # Warm up so the middleware stack and dishka's compiled resolvers are built outside the measured loop
+    for _ in range(10):
+        status = await call(app, path)
+    if status != expected_status:
+        raise RuntimeError(f"{name}: GET {path} returned {status}")
+
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(requests):
+            await call(app, path)
+        elapsed = min(elapsed, time.perf_counter() - started)
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    peak = 0
+    for _ in range(memory_requests):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        await call(app, path)
+        _, request_peak = tracemalloc.get_traced_memory()
+        peak += request_peak - baseline
+    tracemalloc.stop()
+    gc.collect()
+    retained = sys.getallocatedblocks() - blocks_before
+
+    return Result(
+        name=name,
+        requests_per_second=requests / elapsed,
+        peak_bytes_per_request=peak / memory_requests,
+        retained_blocks_per_request=max(retained, 0) / memory_requests,
+    )
@@ -3,49 +3,103 @@
 # Testing utilities
 import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
-
-from .app import App
-from .middleware import Middleware
-from .providers import Provider, provide_middleware, provide_router
-from .router import APIRouter
-
-
-async def start_test(app: App, host: str = "127.0.0.1", port: int = 8000) -> App:
+from importlib import import_module
+from typing import TYPE_CHECKING, AsyncGenerator
+
+if TYPE_CHECKING:
+    from .app import App
+    from .draining import DrainConfig, DrainReport
+    from .executors import ExecutorConfig, ExecutorProvider, run_in_process
+    from .instrumentation import HistogramSink, Instrumentation, StructlogSink
+    from .middleware import AppDependency, AsgiMiddleware, Middleware
+    from .providers import Provider, provide_cached, provide_middleware, provide_pool, provide_router
+    from .response_cache import ResponseCacheMiddleware, ResponseCacheStore, cache_response
+    from .router import APIRouter, coalesce_requests
+    from .server import ServerConfig
+    from .validation import DependencyValidationError
+
+# Public names and the submodule defining them. They are imported on first access, so that
+# `import fastapi_dishka` (or importing one submodule) doesn't pull in FastAPI, dishka and uvicorn.
+_LAZY_ATTRIBUTES = {
+    "App": ".app",
+    "DrainConfig": ".draining",
+    "DrainReport": ".draining",
+    "ExecutorConfig": ".executors",
+    "ExecutorProvider": ".executors",
+    "run_in_process": ".executors",
+    "HistogramSink": ".instrumentation",
+    "Instrumentation": ".instrumentation",
+    "StructlogSink": ".instrumentation",
+    "AppDependency": ".middleware",
+    "AsgiMiddleware": ".middleware",
+    "Middleware": ".middleware",
+    "Provider": ".providers",
+    "provide_cached": ".providers",
+    "provide_middleware": ".providers",
+    "provide_pool": ".providers",
+    "provide_router": ".providers",
+    "ResponseCacheMiddleware": ".response_cache",
+    "ResponseCacheStore": ".response_cache",
+    "cache_response": ".response_cache",
+    "APIRouter": ".router",
+    "coalesce_requests": ".router",
+    "ServerConfig": ".server",
+    "DependencyValidationError": ".validation",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value: object = getattr(import_module(module_name, __name__), name)
+    # Cache it, so later lookups don't go through __getattr__ again
+    globals()[name] = value  # type: ignore[misc]
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})  # type: ignore[misc]
+
+
+async def start_test(app: "App", host: str = "127.0.0.1", port: int = 8000, timeout: float = 10.0) -> "App":
     """
-    Start an app in test mode with proper async handling.
+    Start an app in test mode and wait until it accepts connections.
 
     Args:
         app: The App instance to start
         host: Host to bind to (default: 127.0.0.1)
-        port: Port to bind to (default: 8000)
+        port: Port to bind to (default: 8000); pass 0 for a free port picked by the OS, read from `app.port`
+        timeout: Seconds to wait for the server to start
 
     Returns:
         The same App instance for chaining
+
+    Raises:
+        TimeoutError: If the server did not start in time
+        RuntimeError: If the server exited before it started
     """
-    await app.start(blocking=False, host=host, port=port)
+    ready = await app.start(blocking=False, host=host, port=port)
+    assert ready is not None
 
-    # Give the server a moment to start up
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(asyncio.wrap_future(ready), timeout)
 
     return app
 
 
-async def stop_test(app: App) -> None:
+async def stop_test(app: "App") -> None:
     """
-    Stop an app started with start_test().
+    Stop an app started with start_test() and wait until it has shut down.
 
     Args:
         app: The App instance to stop
     """
-    app.stop()
-
-    # Give the server a moment to clean up
-    await asyncio.sleep(0.1)
+    await asyncio.to_thread(app.stop)
 
 
 @asynccontextmanager
-async def test(app: App, host: str = "127.0.0.1", port: int = 8000) -> AsyncGenerator[App, None]:
+async def test(app: "App", host: str = "127.0.0.1", port: int = 8000) -> AsyncGenerator["App", None]:
     """
     Context manager for testing apps with automatic cleanup.
 
@@ -75,11 +129,29 @@ async def test(app: App, host: str = "127.0.0.1", port: int = 8000) -> AsyncGene
 
 __all__ = [
     "App",
+    "AppDependency",
     "APIRouter",
+    "AsgiMiddleware",
+    "DependencyValidationError",
+    "DrainConfig",
+    "DrainReport",
+    "ExecutorConfig",
+    "ExecutorProvider",
+    "HistogramSink",
+    "Instrumentation",
     "Middleware",
     "Provider",
+    "ResponseCacheMiddleware",
+    "ResponseCacheStore",
+    "ServerConfig",
+    "StructlogSink",
     "provide_router",
     "provide_middleware",
+    "provide_cached",
+    "provide_pool",
+    "cache_response",
+    "coalesce_requests",
+    "run_in_process",
     "start_test",
     "stop_test",
     "test",
@@ -0,0 +1,26 @@
+"""
+Command line tools.
+
+Usage:
+    python -m fastapi_dishka openapi my_service.main:app openapi.json
+"""
+
+import sys
+from typing import Callable, Optional, Sequence
+
+from fastapi_dishka.openapi import main as openapi_main
+
+COMMANDS: dict[str, Callable[[Optional[Sequence[str]]], int]] = {
+    "openapi": openapi_main,
+}
+
+
+def main(argv: Sequence[str]) -> int:
+    if not argv or argv[0] not in COMMANDS:
+        print(f"usage: python -m fastapi_dishka {{{','.join(COMMANDS)}}} ...", file=sys.stderr)
+        return 2
+    return COMMANDS[argv[0]](argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,25 +1,76 @@
 import asyncio
+import socket
 import threading
+import warnings
+from concurrent.futures import Future
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional, Type
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Optional, Type, Union
 
-import uvicorn
-from dishka import AsyncContainer, Provider, Scope, from_context, make_async_container
-from dishka.integrations.fastapi import setup_dishka
+from dishka import AsyncContainer, Provider, Scope, from_context, make_async_container, provide
 from fastapi import FastAPI
 from starlette.datastructures import State
-
-from fastapi_dishka.middleware import Middleware
+from starlette.types import ASGIApp
+
+from fastapi_dishka.coalescing import instrument_coalesced_routes
+from fastapi_dishka.container import RequestContainerMiddleware, install_lazy_request_scope
+from fastapi_dishka.draining import DrainConfig, DrainController, DrainMiddleware, DrainReport
+from fastapi_dishka.filtering import FilteredMiddleware, MiddlewareFilter
+from fastapi_dishka.instrumentation import Instrumentation
+from fastapi_dishka.lifecycle import ContainerLifecycle
+from fastapi_dishka.middleware import (
+    AppDependencyBinder,
+    FusedMiddleware,
+    Middleware,
+    MiddlewareType,
+    get_app_dependencies,
+)
 from fastapi_dishka.providers import MiddlewareCollectorProvider, RouterCollectorProvider
+from fastapi_dishka.response_cache import InMemoryResponseCacheStore, ResponseCacheStore
 from fastapi_dishka.router import APIRouter
+from fastapi_dishka.routing import freeze_routes
+from fastapi_dishka.server import ServerConfig
+from fastapi_dishka.validation import (
+    collect_middleware_dependencies,
+    collect_route_dependencies,
+    validate_dependencies,
+    warmup_container,
+)
+
+if TYPE_CHECKING:
+    import uvicorn
+
+    from fastapi_dishka.workers import WorkerSupervisor
+
+
+def __getattr__(name: str) -> object:
+    # uvicorn is only imported by the start paths; `fastapi_dishka.app.uvicorn` still resolves (e.g. for patching)
+    if name == "uvicorn":
+        import uvicorn
+
+        return uvicorn
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _bound_port(server: "uvicorn.Server", default: int) -> int:
+    """Return the TCP port a started uvicorn server listens on (useful with port 0)."""
+    for listener in server.servers:
+        for sock in listener.sockets:
+            address: object = sock.getsockname()
+            if isinstance(address, tuple):
+                port: int = address[1]
+                return port
+    return default
 
 
 @asynccontextmanager
 async def default_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
-    Default lifespan context manager for FastAPI applications.
+    Lifespan that closes the container of a FastAPI application on shutdown.
 
-    Handles container cleanup on application shutdown.
+    Deprecated: `App` installs its own lifespan, which also builds the container on the serving
+    loop; this one is no longer used and will be removed.
 
     Args:
         app: FastAPI application instance
@@ -27,6 +78,11 @@ async def default_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Yields:
         None during application lifespan
     """
+    warnings.warn(
+        "default_lifespan is deprecated: App builds and closes its container in its own lifespan",
+        DeprecationWarning,
+        stacklevel=3,
+    )
     yield
     # Clean up dishka container on shutdown
     app_state: State = app.state
@@ -44,41 +100,183 @@ class App:
         *providers: Provider,
         summary: str = "",
         description: str = "",
+        fuse_middlewares: bool = False,
+        lazy_request_scope: bool = False,
+        validate: bool = False,
+        warmup: bool = False,
+        concurrent_lifecycle: bool = False,
+        frozen_routing: bool = False,
+        precompute_openapi: bool = False,
+        openapi_file: Union[str, Path, None] = None,
+        server_config: Optional[ServerConfig] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        drain: Optional[DrainConfig] = None,
     ) -> None:
+        """
+        Create a FastAPI application wired to the given providers.
+
+        Args:
+            title: Application title
+            version: Application version
+            *providers: Providers supplying routers, middlewares and dependencies
+            summary: Short application summary for the OpenAPI schema
+            description: Application description for the OpenAPI schema
+            fuse_middlewares: If True, run each run of consecutive `Middleware` subclasses inside one
+                `FusedMiddleware` layer instead of one Starlette layer per middleware
+            lazy_request_scope: If True, only open a REQUEST-scope container for routes that declare
+                dishka dependencies (and middlewares with `needs_request_container`) instead of for
+                every request; routes whose dependencies are all APP-scoped use the app container
+            validate: If True, check at startup that every `FromDishka[...]` dependency of the collected
+                routes and every declared middleware dependency has a provider
+            warmup: If True, instantiate all APP-scoped dependencies and compile the resolvers of
+                every scope before the server accepts traffic
+            concurrent_lifecycle: If True, build the APP-scoped dependencies at startup, concurrently
+                along their dependency graph (see `ContainerLifecycle`; timings in `app.lifecycle.report`).
+                The app container is then created without dishka's lock, which would serialize the builds
+            frozen_routing: If True, match requests through an index of the registered routes (exact
+                paths hashed, parameterized paths in a prefix trie) instead of trying every route in turn
+            precompute_openapi: If True, build the OpenAPI schema at startup instead of on the first
+                request, and serve it as pre-encoded bytes with an ETag
+            openapi_file: Serve the OpenAPI schema from this file, written at build time with
+                `python -m fastapi_dishka openapi` (see `dump_openapi`), instead of computing it
+            server_config: uvicorn tuning options used by every start mode (see `ServerConfig`
+                and its presets); validated here
+            instrumentation: Records dependency resolution, container and middleware timings
+                and forwards them to its sinks (see `Instrumentation`)
+            drain: Stop gracefully: fail readiness first, wait for the in-flight requests up to a
+                deadline, then close the container with bounded finalizers (see `DrainConfig`)
+
+        Raises:
+            ValueError: If the server configuration selects an implementation that is not installed
+        """
         self.app = FastAPI(
             title=title,
             version=version,
             summary=summary,
             description=description,
-            lifespan=default_lifespan,
+            lifespan=self._lifespan,
         )
 
         self.providers = providers
+        self.fuse_middlewares = fuse_middlewares
+        self.lazy_request_scope = lazy_request_scope
+        self.validate = validate
+        self.warmup = warmup
+        self.concurrent_lifecycle = concurrent_lifecycle
+        self.lifecycle: Optional[ContainerLifecycle] = None
+        self.frozen_routing = frozen_routing
+        self.precompute_openapi = precompute_openapi
+        self.openapi_file = openapi_file
+        self.server_config = server_config or ServerConfig()
+        self.server_config.check_available()
+        self.instrumentation = instrumentation
+        self.drain_controller = DrainController(drain) if drain is not None else None
         self.routers: list[APIRouter] = []
-        self.middlewares: list[Type[Middleware]] = []
-        self._server: Optional[uvicorn.Server] = None
+        self.middlewares: list[MiddlewareType] = []
+        self.middleware_filters: dict[MiddlewareType, MiddlewareFilter] = {}
+        self._server: "Optional[uvicorn.Server]" = None
         self._thread: Optional[threading.Thread] = None
+        self._supervisor: "Optional[WorkerSupervisor]" = None
+        # Set by the non-blocking mode: resolved with the bound port once the server has started
+        self.ready: "Optional[Future[int]]" = None
+        self.port: Optional[int] = None
+        self._configured = False
+        self._openapi_installed = False
         self._container_resolved = False
+        self._app_dependency_binder = AppDependencyBinder()
 
-    async def _resolve_container(self) -> None:
-        """Resolve the container and register routers and middlewares."""
-        if self._container_resolved:
+        # Starlette refuses new middlewares once it has built its stack, i.e. once anything started
+        # `self.app` (a server, a TestClient), so the app is wired before it is handed out
+        self._configure()
+
+    def _configure(self) -> None:
+        """
+        Register the collected routers and middlewares on the FastAPI app.
+
+        This only touches the routing table and the middleware stack, so it needs neither the
+        container nor an event loop and runs when the App is created, before the serving loop
+        exists (or before forking).
+        """
+        if self._configured:
             return
 
         # Import here to avoid circular imports
-        from fastapi_dishka.providers import _collect_middlewares_from_providers, _collect_routers_from_providers
+        from fastapi_dishka.providers import ProvidedComponents
 
         # Collect routers and middlewares directly from the provider classes
-        collected_routers = _collect_routers_from_providers(self.providers)
-        collected_middlewares = _collect_middlewares_from_providers(self.providers)
+        components = ProvidedComponents.of_providers(self.providers)
+        self.routers = components.routers
+        self.middlewares = components.middlewares
+        self.middleware_filters = components.middleware_filters
+
+        # Same wiring as dishka's setup_dishka(), with a re-entrant container middleware
+        if not self.lazy_request_scope:
+            self.app.add_middleware(RequestContainerMiddleware, instrumentation=self.instrumentation)
+
+        # Register middlewares first (they need to be added before routes)
+        self._register_middlewares()
+
+        # Register routers
+        for router in self.routers:
+            self.app.include_router(router)
+
+        if self.instrumentation is not None:
+            # Coalesced routes open their own REQUEST container for the shared execution
+            instrument_coalesced_routes(self.app.router.routes, self.instrumentation)
+
+        if self.lazy_request_scope:
+            # Only routes that declare dishka dependencies enter the REQUEST scope
+            install_lazy_request_scope(self.app.router.routes, self.instrumentation)
+
+        if self.frozen_routing:
+            freeze_routes(self.app.router)
+
+        if self.drain_controller is not None:
+            # Outermost layer: counts every request and answers readiness before any other middleware
+            self.app.add_middleware(DrainMiddleware, controller=self.drain_controller)
+
+        self._configured = True
+
+    def _install_openapi(self) -> None:
+        """Serve the precomputed or dumped OpenAPI document, if requested (once)."""
+        if self._openapi_installed or (self.openapi_file is None and not self.precompute_openapi):
+            return
+
+        from fastapi_dishka.openapi import OpenAPIDocument, install_openapi
+
+        if self.openapi_file is not None:
+            install_openapi(self.app, OpenAPIDocument.from_file(self.openapi_file))
+        else:
+            install_openapi(self.app, OpenAPIDocument.from_schema(self.app.openapi()))  # type: ignore[misc]
+        self._openapi_installed = True
+
+    async def _resolve_container(self) -> None:
+        """
+        Build the container on the running event loop, registering routers and middlewares first.
+
+        The server calls this from the ASGI lifespan, so APP-scoped resources (connection pools,
+        clients, locks) are created on the loop that serves the requests.
+        """
+        if self._container_resolved:
+            return
+
+        # At startup rather than on creation: `python -m fastapi_dishka openapi` imports the App
+        # to write the very file it may be configured to serve
+        self._install_openapi()
 
         class AppProvider(Provider):
             scope = Scope.APP
             app = from_context(provides=App)
 
+            def provide_response_cache_store(self) -> ResponseCacheStore:
+                """Default store of ResponseCacheMiddleware, replaced by any provider of ResponseCacheStore."""
+                return InMemoryResponseCacheStore()
+
+            response_cache_store = provide(source=provide_response_cache_store)
+
         # Create collector providers with the collected routers and middlewares
-        router_collector = RouterCollectorProvider(collected_routers)
-        middleware_collector = MiddlewareCollectorProvider(collected_middlewares)
+        router_collector = RouterCollectorProvider(self.routers)
+        middleware_collector = MiddlewareCollectorProvider(self.middlewares)
 
         # Always include the collectors to collect routers and middlewares
         all_providers = (
@@ -96,52 +294,184 @@ class App:
         container = make_async_container(
             *all_providers,
             context=context,
+            # The lock would serialize the concurrent builds of the lifecycle
+            lock_factory=None if self.concurrent_lifecycle else asyncio.Lock,
         )
 
-        setup_dishka(container=container, app=self.app)
-
+        self.app.state.dishka_container = container
         self.app.state.container = container
 
-        # Get the collected routers and middlewares
-        self.routers = await container.get(list[APIRouter])
-        self.middlewares = await container.get(list[Type[Middleware]], component="middlewares")
+        try:
+            if self.validate:
+                # Fail fast instead of on the first request that needs a missing provider
+                routes = [route for router in self.routers for route in router.routes]
+                validate_dependencies(
+                    container,
+                    [*collect_route_dependencies(routes), *collect_middleware_dependencies(self.middlewares)],
+                )
+
+            if self.concurrent_lifecycle:
+                self.lifecycle = ContainerLifecycle(container, self.instrumentation)
+                await self.lifecycle.start()
+
+            # Resolve AppDependency attributes once; instances created later get them on creation
+            bind_container = container
+            if self.instrumentation is not None:
+                bind_container = self.instrumentation.wrap_container(container)
+            await self._app_dependency_binder.bind(bind_container, self.middlewares)
+
+            if self.warmup:
+                await warmup_container(container)
+        except BaseException:
+            # Release the APP resources built before the failure; the lifespan only re-raises
+            await self.close()
+            raise
 
-        # Register middlewares first (they need to be added before routes)
+        self._container_resolved = True
+
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncGenerator[None, None]:
+        """Build the container on the serving loop at startup and close it on shutdown."""
+        try:
+            await self._resolve_container()
+        except Exception as error:
+            # uvicorn only logs startup failures; hand the actual error to a non-blocking caller
+            if self.ready is not None and not self.ready.done():
+                self.ready.set_exception(error)
+            raise
+
+        if self.drain_controller is not None:
+            self.drain_controller.reset()
+        yield
+
+        if self.drain_controller is not None:
+            await self.drain_controller.finalize(self.close())
+        else:
+            await self.close()
+        # The container is closed: a later start builds a new one on its own loop
+        self._container_resolved = False
+
+    def _register_middlewares(self) -> None:
+        """Add the collected middlewares to the FastAPI app, fusing them if requested."""
+        # Contiguous runs of Middleware subclasses are fused into one layer each. An AsgiMiddleware or a
+        # filtered middleware (which keeps its own layer to be skipped at the ASGI level) ends a run, so
+        # that every middleware keeps its position in the onion.
+        run: list[Type[Middleware]] = []
         for middleware_class in self.middlewares:
+            if (
+                self.fuse_middlewares
+                and issubclass(middleware_class, Middleware)
+                and middleware_class not in self.middleware_filters
+            ):
+                run.append(middleware_class)
+                continue
+
+            self._add_fused_middlewares(run)
+            run = []
+
             # Add the middleware class to the FastAPI app
             # Starlette will instantiate it and the middleware can access
             # dependencies through app.state.container
-            self.app.add_middleware(middleware_class)
+            middleware: Callable[[ASGIApp], ASGIApp] = middleware_class
+            if self.instrumentation is not None:
+                factory = self._app_dependency_binder.factory(middleware_class)
+                middleware = self.instrumentation.middleware_factory(middleware_class.__name__, factory)
+            elif get_app_dependencies(middleware_class):
+                middleware = self._app_dependency_binder.factory(middleware_class)
+
+            middleware_filter = self.middleware_filters.get(middleware_class)
+            self._add_middleware(middleware, middleware_filter)
+
+            # Added after (so outside) the middleware: the REQUEST container is open when it runs
+            if middleware_class.needs_request_container:
+                self._add_middleware(
+                    RequestContainerMiddleware, middleware_filter, instrumentation=self.instrumentation
+                )
+        self._add_fused_middlewares(run)
+
+    def _add_fused_middlewares(self, middlewares: list[Type[Middleware]]) -> None:
+        """Add one layer running a run of Middleware subclasses, if any."""
+        if not middlewares:
+            return
+        if self.instrumentation is not None:
+            fused_factory = partial(FusedMiddleware, middlewares=middlewares, binder=self._app_dependency_binder)
+            self.app.add_middleware(self.instrumentation.middleware_factory("FusedMiddleware", fused_factory))
+        else:
+            self.app.add_middleware(FusedMiddleware, middlewares=middlewares, binder=self._app_dependency_binder)
+        if any(middleware_class.needs_request_container for middleware_class in middlewares):
+            self.app.add_middleware(RequestContainerMiddleware, instrumentation=self.instrumentation)
 
-        # Register routers
-        for router in self.routers:
-            self.app.include_router(router)
+    def _add_middleware(
+        self,
+        middleware: Callable[[ASGIApp], ASGIApp],
+        middleware_filter: Optional[MiddlewareFilter],
+        **options: object,
+    ) -> None:
+        """Add a middleware layer, bypassed at the ASGI level for requests its filter doesn't select."""
+        if middleware_filter is None:
+            self.app.add_middleware(middleware, **options)
+            return
 
-        self._container_resolved = True
+        self.app.add_middleware(
+            FilteredMiddleware,
+            middleware=partial(middleware, **options),
+            middleware_filter=middleware_filter,
+            routes=self.app.router.routes,
+        )
 
-    async def start(self, blocking: bool = True, host: str = "127.0.0.1", port: int = 8000) -> None:
+    async def start(
+        self,
+        blocking: bool = True,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int = 1,
+        server_config: Optional[ServerConfig] = None,
+    ) -> "Optional[Future[int]]":
         """
         Start the FastAPI application using uvicorn.
 
-        This method automatically resolves the container and registers all routers and middlewares.
+        The container is built by the ASGI lifespan on the serving event loop.
 
         Args:
             blocking: If True, blocks until the server stops. If False, starts in a separate thread.
             host: Host to bind to
             port: Port to bind to
+            workers: Number of worker processes; only 1 is supported here, use `start_sync()` for more
+            server_config: uvicorn tuning options overriding the ones given to the App
+
+        Returns:
+            In non-blocking mode, a future resolved with the bound port once the server accepts
+            connections; None otherwise
+
+        Raises:
+            ValueError: If `workers` is more than 1
         """
-        # Ensure container is resolved before starting
-        await self._resolve_container()
+        server_config = self._get_server_config(server_config)
+
+        if workers > 1:
+            # The supervisor forwards SIGINT/SIGTERM to the workers, which needs the main thread, and
+            # forked workers must not inherit this running event loop
+            raise ValueError("workers > 1 is only supported by start_sync(), outside of an event loop")
 
         if not blocking:
-            self._start_non_blocking(host, port)
-        else:
-            # For blocking mode, we need to use uvicorn server directly to avoid event loop conflicts
-            config = uvicorn.Config(self.app, host=host, port=port)
-            server = uvicorn.Server(config)
-            await server.serve()
+            return self._start_non_blocking(host, port, server_config)
+
+        import uvicorn
+
+        # For blocking mode, we need to use uvicorn server directly to avoid event loop conflicts
+        config = uvicorn.Config(self.app, host=host, port=port, **server_config.to_uvicorn_kwargs())
+        server = self._make_server(config)
+        await server.serve()
+        return None
 
-    def start_sync(self, blocking: bool = True, host: str = "127.0.0.1", port: int = 8000) -> None:
+    def start_sync(
+        self,
+        blocking: bool = True,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int = 1,
+        server_config: Optional[ServerConfig] = None,
+    ) -> "Optional[Future[int]]":
         """
         Synchronous version of start() for backwards compatibility.
 
@@ -149,40 +479,166 @@ class App:
             blocking: If True, blocks until the server stops. If False, starts in a separate thread.
             host: Host to bind to
             port: Port to bind to
+            workers: Number of worker processes. With more than one, the listening socket is bound
+                here and shared by forked workers that each build their own container.
+            server_config: uvicorn tuning options overriding the ones given to the App
+
+        Returns:
+            In non-blocking mode, a future resolved with the bound port once the server accepts
+            connections; None otherwise
         """
-        # Resolve container in a new event loop if not already resolved
-        if not self._container_resolved:
-            asyncio.run(self._resolve_container())
+        server_config = self._get_server_config(server_config)
+
+        if workers > 1:
+            self._check_workers_mode(blocking)
+            self._start_workers(host, port, workers, server_config)
+            return None
 
+        # No throwaway loop here: the lifespan builds the container on uvicorn's loop
         if not blocking:
-            self._start_non_blocking(host, port)
+            return self._start_non_blocking(host, port, server_config)
+
+        import uvicorn
+
+        if self.drain_controller is None:
+            uvicorn.run(self.app, host=host, port=port, **server_config.to_uvicorn_kwargs())
         else:
-            uvicorn.run(self.app, host=host, port=port)
+            # uvicorn.run() creates its own server; ours drains on SIGTERM
+            config = uvicorn.Config(self.app, host=host, port=port, **server_config.to_uvicorn_kwargs())
+            self._make_server(config).run()
+        return None
+
+    def _get_server_config(self, server_config: Optional[ServerConfig]) -> ServerConfig:
+        """Return the server configuration for a start call, validating an override."""
+        if server_config is None:
+            return self.server_config
+        server_config.check_available()
+        return server_config
+
+    def _check_workers_mode(self, blocking: bool) -> None:
+        """Make sure the app can be served by forked workers."""
+        if not blocking:
+            raise ValueError("workers > 1 is only supported in blocking mode")
+        if self._container_resolved:
+            # The async container is not fork-safe; every worker must build its own
+            raise RuntimeError(
+                "Cannot start worker processes after the container was resolved. "
+                "Each worker builds its own container, so don't resolve it before start()."
+            )
+
+    def _start_workers(self, host: str, port: int, workers: int, server_config: ServerConfig) -> None:
+        """Bind the listening socket and serve it from forked worker processes until shutdown."""
+        # Routes, middlewares and the OpenAPI document are inherited by the workers; only the
+        # container is per-worker
+        self._install_openapi()
+        import uvicorn
+
+        from fastapi_dishka.workers import WorkerSupervisor
+
+        config = uvicorn.Config(self.app, host=host, port=port, **server_config.to_uvicorn_kwargs())
+        self._supervisor = WorkerSupervisor(partial(self._run_worker, config), config.bind_socket(), workers)
+        self._supervisor.run()
+
+    def _run_worker(self, config: "uvicorn.Config", sock: socket.socket) -> None:
+        """Serve the shared socket (runs in the forked process)."""
+        server = self._make_server(config)
+
+        # The lifespan builds this worker's container at startup and closes it on shutdown
+        with asyncio.Runner(loop_factory=config.get_loop_factory()) as runner:
+            runner.run(server.serve(sockets=[sock]))
+
+    def _make_server(self, config: "uvicorn.Config") -> "uvicorn.Server":
+        """Create the uvicorn server, draining on SIGTERM/SIGINT if the App has a `DrainConfig`."""
+        import uvicorn
+
+        server = uvicorn.Server(config)
+        if self.drain_controller is not None:
+            self.drain_controller.install_signal_handler(server)
+        return server
+
+    def _start_non_blocking(self, host: str, port: int, server_config: Optional[ServerConfig] = None) -> "Future[int]":
+        """
+        Start the server in a separate thread.
 
-    def _start_non_blocking(self, host: str, port: int) -> None:
-        """Start the server in a separate thread."""
+        Returns:
+            A future resolved with the bound port once uvicorn has started (use port 0 to let the
+            OS pick a free one), or failed if the server exits before starting
+        """
+        import uvicorn
+
+        options = (server_config or self.server_config).to_uvicorn_kwargs()
+        ready: "Future[int]" = Future()
+        self.ready = ready
 
         def run_server() -> None:
             # Create a new event loop for this thread
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
-            config = uvicorn.Config(self.app, host=host, port=port)
-            self._server = uvicorn.Server(config)
-            loop.run_until_complete(self._server.serve())
+            config = uvicorn.Config(self.app, host=host, port=port, **options)
+            server = self._make_server(config)
+            self._server = server
+
+            def watch_started() -> None:
+                # Polls uvicorn's `started` flag from the serving loop; no extra thread needed
+                if ready.done() or server.should_exit:
+                    return
+                if not server.started:
+                    loop.call_later(0.005, watch_started)
+                    return
+                self.port = _bound_port(server, port)
+                ready.set_result(self.port)
+
+            loop.call_soon(watch_started)
+            try:
+                loop.run_until_complete(server.serve())
+            except SystemExit:
+                # uvicorn exits when startup fails (e.g. port in use); it logs why and `ready` reports it
+                pass
+            finally:
+                if not ready.done():
+                    ready.set_exception(RuntimeError("The server exited before it started"))
 
         self._thread = threading.Thread(target=run_server, daemon=True)
         self._thread.start()
+        return ready
+
+    def stop(self) -> Optional[DrainReport]:
+        """
+        Stop the non-blocking server, or the worker processes, and wait for the shutdown to finish.
+
+        With a `DrainConfig`, the non-blocking server drains first: readiness fails for
+        `readiness_delay`, then the in-flight requests get up to `timeout` to complete before the
+        container is closed.
 
-    def stop(self) -> None:
-        """Stop the non-blocking server."""
-        if self._server:
-            self._server.should_exit = True
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=10)
+        Returns:
+            With a `DrainConfig`, the report of the non-blocking server's draining shutdown; None otherwise
+        """
+        if self._supervisor:
+            self._supervisor.shutdown()
+
+        server = self._server
+        thread = self._thread
+        if server is not None and thread is not None and thread.is_alive() and self.drain_controller is not None:
+
+            def stop_server() -> None:
+                server.should_exit = True
+
+            self.drain_controller.drain(server, stop_server)
+            thread.join(timeout=10 + self.drain_controller.config.max_duration)
+            return self.drain_controller.report()
+
+        if server:
+            server.should_exit = True
+        if thread and thread.is_alive():
+            thread.join(timeout=10)
+        return None
 
     async def close(self) -> None:
         """Close the dishka container and cleanup resources."""
+        if self.lifecycle is not None:
+            await self.lifecycle.close()
+            return
         if hasattr(self.app.state, "container"):
             container: AsyncContainer = self.app.state.container
             if container is not None:
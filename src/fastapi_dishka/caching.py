@@ -0,0 +1,143 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar, Union
+
+logger = logging.getLogger("fastapi_dishka.caching")
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    expires_at: float
+    refresh: "Optional[asyncio.Task[None]]" = None
+
+
+class _LoadAbandoned(Exception):
+    """Set on a pending load whose caller was cancelled: a waiter loads the key again."""
+
+
+class TTLCache(Generic[T]):
+    """
+    Async cache with expiry, LRU eviction and single-flight loading.
+
+    - A missing key is loaded once, in the task of its first caller: concurrent callers await the
+      same load. If that caller is cancelled, so is the load, and a waiting caller starts over.
+    - An expired key is refreshed by the first caller that finds it expired, in that caller's task,
+      so `load` may use resources that only live as long as the caller (e.g. REQUEST-scoped
+      dependencies). Concurrent callers keep getting the stale value meanwhile. If the refresh
+      fails, the error is logged, the stale value returned and the next caller retries.
+    - Beyond `max_size` keys, the least recently used key is evicted.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a loaded value is fresh
+            max_size: Maximum number of cached keys
+
+        Raises:
+            ValueError: If ttl is negative or max_size is not positive
+        """
+        if ttl < 0:
+            raise ValueError(f"ttl must be >= 0, got {ttl}")
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, _Entry[T]] = OrderedDict()
+        self._loading: dict[Hashable, asyncio.Future[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the cached value of a key, loading or refreshing it with `load` when needed.
+
+        Args:
+            key: The cache key
+            load: Loads the value of the key
+
+        Returns:
+            The fresh value, or the stale one while another caller refreshes it
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if entry.expires_at > monotonic() or _running_here(entry.refresh):
+                return entry.value
+            # Awaited here: cancelling this caller cancels the refresh, so `load` never outlives it
+            refresh = asyncio.ensure_future(self._refresh(key, load))
+            entry.refresh = refresh
+            await refresh
+            refreshed = self._entries.get(key)
+            return entry.value if refreshed is None else refreshed.value
+
+        loading = self._loading.get(key)
+        if loading is None or not _running_here(loading):
+            return await self._load(key, load)
+        try:
+            # A cancelled waiter must not cancel the load the other callers are waiting for
+            return await asyncio.shield(loading)
+        except _LoadAbandoned:
+            return await self.get(key, load)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Forget one key, or every key."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def _load(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        loading: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._loading[key] = loading
+        try:
+            value = await load()
+        except asyncio.CancelledError:
+            _abandon(loading, _LoadAbandoned())
+            raise
+        except BaseException as error:
+            _abandon(loading, error)
+            raise
+        else:
+            self._store(key, value)
+            loading.set_result(value)
+            return value
+        finally:
+            if self._loading.get(key) is loading:
+                del self._loading[key]
+
+    async def _refresh(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> None:
+        try:
+            self._store(key, await load())
+        except Exception:
+            logger.exception("Refreshing cached value %r failed, serving the stale value", key)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refresh = None
+
+    def _store(self, key: Hashable, value: T) -> None:
+        self._entries[key] = _Entry(value, monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+def _abandon(loading: "asyncio.Future[T]", error: BaseException) -> None:
+    """Fail a pending load for its waiters, without logging it when there are none."""
+    loading.set_exception(error)
+    loading.exception()
+
+
+def _running_here(future: "Optional[Union[asyncio.Future[T], asyncio.Task[None]]]") -> bool:
+    """Whether a load is in progress on the running loop (a load from another loop is ignored)."""
+    return future is not None and not future.done() and future.get_loop() is asyncio.get_running_loop()
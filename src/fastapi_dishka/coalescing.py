@@ -0,0 +1,159 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fastapi_dishka.container import RequestContainerMiddleware
+from fastapi_dishka.instrumentation import Instrumentation
+from fastapi_dishka.middleware import DEPENDENCY_CACHE_SCOPE_KEY
+from fastapi_dishka.router import EndpointDependency
+
+# Only requests without side effects can share a response
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+CoalescingKey = tuple[str, str, bytes, tuple[Optional[bytes], ...]]
+
+
+@dataclass
+class _Flight:
+    """One in-flight execution shared by identical requests."""
+
+    task: "asyncio.Task[list[Message]]"
+    waiters: int = field(default=0)
+
+
+class CoalescingMiddleware:
+    """
+    Route-level ASGI layer running identical concurrent requests through one handler execution.
+
+    Requests are identical when their method, path, query string and the selected headers match.
+    The first one starts the execution in a task of its own, with its own REQUEST container, and
+    every identical request arriving before it finishes waits for the same task. The response is
+    buffered and replayed to each of them.
+
+    A waiter that goes away (client disconnect, cancellation) doesn't affect the others, the leader
+    included: the execution only gets cancelled once nobody waits for it anymore.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        vary_headers: Sequence[str] = (),
+        dependencies: Optional[Sequence[EndpointDependency]] = None,
+    ) -> None:
+        """
+        Initialize the layer.
+
+        Args:
+            app: The route application to share
+            vary_headers: Request headers that must match for requests to be coalesced
+            dependencies: Dependencies of the route, to skip the REQUEST container when possible
+        """
+        self.app = app
+        self.vary_headers = tuple(header.lower().encode("latin-1") for header in vary_headers)
+        self._shared_app = RequestContainerMiddleware(app, dependencies)
+        self._flights: dict[CoalescingKey, _Flight] = {}
+
+    def instrument(self, instrumentation: Instrumentation) -> None:
+        """Record the container and resolution timings of the shared executions."""
+        self._shared_app.instrumentation = instrumentation
+
+    def coalescing_key(self, scope: Scope) -> CoalescingKey:
+        """Return the key under which identical requests are grouped."""
+        method: str = scope["method"]
+        path: str = scope["path"]
+        query_string: bytes = scope.get("query_string", b"")
+        headers: tuple[Optional[bytes], ...] = ()
+        if self.vary_headers:
+            raw_headers: list[tuple[bytes, bytes]] = scope["headers"]
+            values = dict(raw_headers)
+            headers = tuple(values.get(name) for name in self.vary_headers)
+        return method, path, query_string, headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope_type: str = scope["type"]
+        method: Optional[str] = scope.get("method")
+        if scope_type != "http" or method not in COALESCED_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        key = self.coalescing_key(scope)
+        flight = self._flights.get(key)
+        if flight is None or flight.task.get_loop() is not asyncio.get_running_loop():
+            flight = _Flight(asyncio.create_task(self._execute(scope)))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+
+        flight.waiters += 1
+        try:
+            messages = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                # Nobody else waits for this response: stop producing it
+                self._land(key, flight)
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+        for message in messages:
+            await send(message)
+
+    def _land(self, key: CoalescingKey, flight: _Flight) -> None:
+        """Stop routing requests to a flight once it finished or was abandoned."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    async def _execute(self, scope: Scope) -> list[Message]:
+        """Run the route for a copy of the leader's connection, recording the response."""
+        shared_scope: Scope = dict(scope)
+        shared_scope.pop(DEPENDENCY_CACHE_SCOPE_KEY, None)
+        state: Optional[dict[str, object]] = scope.get("state")
+        # The leader's REQUEST container closes when the leader goes away; open our own
+        shared_state = dict(state or {})
+        shared_state.pop("dishka_container", None)
+        shared_scope["state"] = shared_state
+        messages: list[Message] = []
+        request_sent = False
+
+        async def receive() -> Message:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # The shared execution has no client that could disconnect: wait until it's done
+            never: asyncio.Future[Message] = asyncio.get_running_loop().create_future()
+            return await never
+
+        async def send(message: Message) -> None:
+            messages.append(message)
+
+        await self._shared_app(shared_scope, receive, send)
+        return messages
+
+
+def instrument_coalesced_routes(routes: Sequence[BaseRoute], instrumentation: Instrumentation) -> int:
+    """
+    Hand the App's instrumentation to the coalescing layers of its routes.
+
+    Routes are created before the App exists, so their coalescing layers learn about the
+    instrumentation when the App registers them.
+
+    Args:
+        routes: The routes of the application router
+        instrumentation: Records container and resolution timings
+
+    Returns:
+        The number of instrumented routes
+    """
+    instrumented = 0
+
+    for route in routes:
+        route_app: object = getattr(route, "app", None)
+        if isinstance(route_app, CoalescingMiddleware):
+            route_app.instrument(instrumentation)
+            instrumented += 1
+
+    return instrumented
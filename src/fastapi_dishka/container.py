@@ -0,0 +1,164 @@
+from typing import Optional, Sequence, Union
+
+from dishka import AsyncContainer, DependencyKey
+from dishka import Scope as DIScope
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.routing import APIRoute as FastAPIRoute
+from starlette.routing import BaseRoute, Route
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from fastapi_dishka.instrumentation import Instrumentation
+from fastapi_dishka.router import APIRoute, EndpointDependency
+
+
+class RequestContainerMiddleware:
+    """
+    Pure ASGI layer that opens the REQUEST (HTTP) or SESSION (WebSocket) container for a connection.
+
+    This is equivalent to dishka's `ContainerMiddleware`, but re-entrant: if an outer layer already
+    opened a container for the connection it is reused. That lets the same layer be installed once
+    for the whole app, around middlewares that need REQUEST-scoped dependencies, or around
+    individual routes when the REQUEST scope is entered lazily.
+
+    When constructed with the dependencies of a route, the layer checks (once, against the
+    container registry) whether all of them are APP-scoped. If so, the route is served straight
+    from the app container and no REQUEST container is created at all.
+
+    With an `Instrumentation`, the container stored for the connection times every resolution
+    and the time to enter and exit the container is recorded.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        dependencies: Optional[Sequence[EndpointDependency]] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> None:
+        """
+        Initialize the layer.
+
+        Args:
+            app: The ASGI application to wrap
+            dependencies: Dependencies of the wrapped route, if known
+            instrumentation: Records container and resolution timings, if given
+        """
+        self.app = app
+        self.dependencies = dependencies
+        self.instrumentation = instrumentation
+        self._app_scoped: Optional[bool] = None
+
+    def _is_app_scoped(self, container: AsyncContainer) -> bool:
+        """Whether every known dependency can be resolved by the app container itself."""
+        if self._app_scoped is None:
+            if self.dependencies is None:
+                self._app_scoped = False
+            else:
+                registry = container.registry
+                self._app_scoped = all(
+                    registry.get_factory(DependencyKey(type_hint, component)) is not None  # type: ignore[misc]
+                    for type_hint, component in self.dependencies
+                )
+        return self._app_scoped
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope_type: str = scope["type"]
+        if scope_type not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        state: dict[str, object] = scope.setdefault("state", dict[str, object]())
+        if "dishka_container" in state:
+            # An outer layer already opened the container for this connection
+            await self.app(scope, receive, send)
+            return
+
+        app: FastAPI = scope["app"]
+        app_container: AsyncContainer = app.state.dishka_container
+        app_scoped = self._is_app_scoped(app_container)
+        if self.instrumentation is not None:
+            # Times every resolution, and entering and exiting the connection's container
+            app_container = self.instrumentation.wrap_container(app_container)
+
+        if app_scoped:
+            state["dishka_container"] = app_container
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                del state["dishka_container"]
+            return
+
+        connection: Union[Request, WebSocket]
+        context: dict[type[Union[Request, WebSocket]], Union[Request, WebSocket]]
+        if scope_type == "http":
+            connection = Request(scope, receive, send)
+            context = {Request: connection}
+            di_scope = DIScope.REQUEST
+        else:
+            connection = WebSocket(scope, receive, send)
+            context = {WebSocket: connection}
+            di_scope = DIScope.SESSION
+
+        async with app_container(context, scope=di_scope) as request_container:
+            state["dishka_container"] = request_container
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                # Don't leave a closed container behind for outer layers
+                del state["dishka_container"]
+
+
+def route_needs_request_container(route: BaseRoute) -> bool:
+    """
+    Decide at startup whether a route may need the REQUEST-scope container.
+
+    Routes created by fastapi_dishka's `APIRoute` know their dishka dependencies exactly.
+    Other routes are treated conservatively: plain Starlette routes only need the container
+    if their endpoint was injected by dishka, everything else (other route classes, websockets,
+    mounts) is assumed to need it.
+
+    Args:
+        route: The route to analyse
+
+    Returns:
+        True if the route should be wrapped with a `RequestContainerMiddleware`
+    """
+    if isinstance(route, APIRoute):  # type: ignore[misc]
+        return bool(route.dishka_dependencies)
+
+    if isinstance(route, Route) and not isinstance(route, FastAPIRoute):  # type: ignore[misc]
+        return hasattr(route.endpoint, "__dishka_injected__")  # type: ignore[misc]
+
+    return True
+
+
+def install_lazy_request_scope(routes: Sequence[BaseRoute], instrumentation: Optional[Instrumentation] = None) -> int:
+    """
+    Wrap the routes that need dishka with a `RequestContainerMiddleware`.
+
+    Routes without dishka dependencies (health checks, metrics, docs, ...) are left untouched
+    and never open a REQUEST-scope container. Neither are coalesced routes: their shared execution
+    opens its own container, and the requests waiting for it don't use one.
+
+    Args:
+        routes: The routes of the application router
+        instrumentation: Records container and resolution timings, if given
+
+    Returns:
+        The number of wrapped routes
+    """
+    from fastapi_dishka.coalescing import CoalescingMiddleware
+
+    wrapped = 0
+
+    for route in routes:
+        if not route_needs_request_container(route) or not hasattr(route, "app"):
+            continue
+        route_app: ASGIApp = route.app
+        if isinstance(route_app, CoalescingMiddleware):
+            continue
+
+        dependencies = route.dishka_dependencies if isinstance(route, APIRoute) else None  # type: ignore[misc]
+        route.app = RequestContainerMiddleware(route_app, dependencies, instrumentation)
+        wrapped += 1
+
+    return wrapped
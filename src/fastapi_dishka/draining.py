@@ -0,0 +1,262 @@
+"""
+Graceful draining shutdown: readiness flip, in-flight tracking and bounded finalization.
+
+With a `DrainConfig` given to the App, stopping it (`App.stop()` or SIGTERM/SIGINT in the blocking
+modes) goes through these steps:
+
+1. Readiness flips: the readiness endpoint answers 503 so the load balancer stops routing new
+   requests here, while requests keep being served for `readiness_delay` seconds.
+2. The server stops accepting connections and waits up to `timeout` seconds for the in-flight
+   requests; the ones still running after that are cancelled (cut off).
+3. The container is closed, its finalizers bounded by `finalize_timeout` seconds.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+from types import FrameType
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+if TYPE_CHECKING:
+    import uvicorn
+
+logger = logging.getLogger("fastapi_dishka.draining")
+
+
+@dataclass(frozen=True)
+class DrainConfig:
+    """
+    Steps of the draining shutdown of an App.
+
+    Attributes:
+        readiness_path: Path of the readiness endpoint (200 while serving, 503 while draining),
+            or None to only expose the state as `app.drain_controller.draining` to your own health checks
+        readiness_delay: Seconds to keep serving after readiness flipped, so that the load
+            balancer notices before the server stops accepting connections
+        timeout: Seconds to wait for the in-flight requests before cutting them off
+        finalize_timeout: Seconds allowed to the container finalizers, or None for no limit
+    """
+
+    readiness_path: Optional[str] = "/ready"
+    readiness_delay: float = 0.0
+    timeout: float = 30.0
+    finalize_timeout: Optional[float] = 10.0
+
+    def __post_init__(self) -> None:
+        for name in ("readiness_delay", "timeout", "finalize_timeout"):
+            value: Optional[float] = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative, got {value}")
+
+    @property
+    def max_duration(self) -> float:
+        """Upper bound of the draining steps, in seconds."""
+        return self.readiness_delay + self.timeout + (self.finalize_timeout or 0.0)
+
+
+@dataclass(frozen=True)
+class DrainReport:
+    """
+    Outcome of a draining shutdown.
+
+    Attributes:
+        drained: Requests that completed after draining started
+        cut_off: Requests cancelled at the deadline or still running when the server stopped
+        finalized: Whether the container finalizers completed within `finalize_timeout`
+    """
+
+    drained: int
+    cut_off: int
+    finalized: bool
+
+
+class DrainController:
+    """
+    Tracks the in-flight requests of an App and runs its draining shutdown.
+
+    Counters are updated from the serving loop and read from the thread stopping the server,
+    so they are guarded by a lock.
+    """
+
+    def __init__(self, config: DrainConfig) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            config: Steps of the draining shutdown
+        """
+        self.config = config
+        self._lock = threading.Lock()
+        self._draining = False
+        self._in_flight = 0
+        self._drained = 0
+        self._cut_off = 0
+        self._finalized = True
+        # The server whose graceful shutdown timeout was overridden by drain(), and its own value
+        self._server_timeout: Optional[tuple["uvicorn.Config", Optional[int]]] = None
+
+    @property
+    def draining(self) -> bool:
+        """Whether draining started, i.e. the app must report itself as not ready."""
+        return self._draining
+
+    @property
+    def in_flight(self) -> int:
+        """Requests being handled."""
+        return self._in_flight
+
+    def reset(self) -> None:
+        """Forget a previous shutdown, for an App started again."""
+        with self._lock:
+            self._draining = False
+            self._drained = 0
+            self._cut_off = 0
+            self._finalized = True
+        # A forced exit skips the lifespan shutdown, and finalize() with it
+        self._restore_server_timeout()
+
+    def request_started(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self, cancelled: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if self._draining:
+                if cancelled:
+                    self._cut_off += 1
+                else:
+                    self._drained += 1
+
+    def report(self) -> DrainReport:
+        """Summarize the last shutdown; requests still in flight count as cut off."""
+        with self._lock:
+            return DrainReport(
+                drained=self._drained, cut_off=self._cut_off + self._in_flight, finalized=self._finalized
+            )
+
+    def drain(self, server: "uvicorn.Server", stop: Callable[[], None]) -> None:
+        """
+        Flip readiness, keep serving for `readiness_delay`, then stop the server with the drain timeout.
+
+        Blocks the calling thread (not the serving loop) during the readiness delay.
+
+        Args:
+            server: The uvicorn server to stop
+            stop: Makes the server stop accepting connections and shut down
+        """
+        with self._lock:
+            self._draining = True
+        logger.info("Draining: readiness is failing, %d request(s) in flight", self._in_flight)
+        time.sleep(self.config.readiness_delay)
+
+        # uvicorn waits this long for the running requests, then cancels them (asyncio.wait_for takes floats);
+        # read once the server stops accepting connections, it is restored by finalize()
+        config = server.config
+        if self._server_timeout is None:
+            self._server_timeout = (config, config.timeout_graceful_shutdown)
+        config.timeout_graceful_shutdown = self.config.timeout  # type: ignore[assignment]
+        if not server.should_exit:
+            # Already stopping if a second signal cut the readiness delay short
+            stop()
+
+    def install_signal_handler(self, server: "uvicorn.Server") -> None:
+        """
+        Drain on the first SIGTERM/SIGINT received by the server; a second one stops it right away.
+
+        Args:
+            server: The uvicorn server, before it starts serving
+        """
+        handle_exit = server.handle_exit
+
+        def drain_on_signal(sig: int, frame: Optional[FrameType]) -> None:
+            if self._draining:
+                handle_exit(sig, frame)
+                return
+            # Signal handlers must return quickly: the readiness delay runs in its own thread
+            thread = threading.Thread(target=self.drain, args=(server, partial(handle_exit, sig, frame)))
+            thread.daemon = True
+            thread.start()
+
+        # uvicorn installs `server.handle_exit` as the handler of the signals it captures
+        server.handle_exit = drain_on_signal  # type: ignore[method-assign]
+
+    async def finalize(self, closing: Awaitable[None]) -> None:
+        """
+        Close the container, giving up on its finalizers after `finalize_timeout`.
+
+        Runs in the lifespan shutdown, after the server waited for the in-flight requests, so the
+        server's own graceful shutdown timeout is restored first.
+
+        Args:
+            closing: The closing of the app container, e.g. `container.close()`
+        """
+        self._restore_server_timeout()
+        try:
+            await asyncio.wait_for(closing, self.config.finalize_timeout)
+        except TimeoutError:
+            self._finalized = False
+            logger.warning("Container finalizers did not complete within %ss", self.config.finalize_timeout)
+
+    def _restore_server_timeout(self) -> None:
+        if self._server_timeout is not None:
+            config, timeout = self._server_timeout
+            config.timeout_graceful_shutdown = timeout
+            self._server_timeout = None
+
+
+class DrainMiddleware:
+    """
+    Outermost ASGI layer counting in-flight HTTP requests and answering the readiness endpoint.
+    """
+
+    def __init__(self, app: ASGIApp, controller: DrainController) -> None:
+        """
+        Initialize the layer.
+
+        Args:
+            app: The ASGI application to wrap
+            controller: The App's drain controller
+        """
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope_type: str = scope["type"]
+        if scope_type != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+        if path == self.controller.config.readiness_path:
+            await self._send_readiness(send)
+            return
+
+        cancelled = False
+        self.controller.request_started()
+        try:
+            await self.app(scope, receive, send)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            self.controller.request_finished(cancelled)
+
+    async def _send_readiness(self, send: Send) -> None:
+        draining = self.controller.draining
+        status: dict[str, str] = {"status": "draining" if draining else "ready"}
+        body = json.dumps(status).encode()
+        headers: list[tuple[bytes, bytes]] = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        start: Message = {"type": "http.response.start", "status": 503 if draining else 200, "headers": headers}
+        message: Message = {"type": "http.response.body", "body": body}
+        await send(start)
+        await send(message)
@@ -0,0 +1,204 @@
+"""
+Thread and process pool executors for CPU-bound work, provided by the dishka container.
+
+`ExecutorProvider` provides an APP-scoped `ThreadPoolExecutor` and `ProcessPoolExecutor`, shut
+down when the App closes its container. Worker processes build their own container from the
+provider classes given to the provider, and `run_in_process()` injects `FromDishka[...]`
+parameters of the offloaded function from it.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from inspect import signature
+from multiprocessing.util import Finalize
+from typing import AsyncIterator, Callable, Optional, Sequence, TypeVar, cast, get_type_hints
+
+from dishka import Container, Scope, make_container, provide
+from dishka.integrations.base import default_parse_dependency
+from dishka.provider import Provider as DishkaProvider
+
+T = TypeVar("T")
+
+# Functions offloaded to worker processes: positional arguments plus injected keyword arguments
+WorkerFunction = Callable[..., T]  # type: ignore[explicit-any]
+
+# Container of the current worker process, built by _initialize_worker()
+_worker_container: Optional[Container] = None
+
+
+@dataclass(frozen=True)
+class ExecutorConfig:
+    """
+    Sizes of the executors provided by `ExecutorProvider`.
+
+    Options left as None keep the `concurrent.futures` defaults (`min(32, cpu_count + 4)` threads,
+    `cpu_count` processes).
+
+    Attributes:
+        thread_workers: Maximum number of threads
+        process_workers: Number of worker processes
+        thread_name_prefix: Name prefix of the threads
+        start_method: multiprocessing start method of the workers ("fork", "spawn", "forkserver")
+        max_tasks_per_child: Tasks a worker process runs before being replaced
+    """
+
+    thread_workers: Optional[int] = None
+    process_workers: Optional[int] = None
+    thread_name_prefix: str = "fastapi-dishka"
+    start_method: Optional[str] = None
+    max_tasks_per_child: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        for name in ("thread_workers", "process_workers", "max_tasks_per_child"):
+            value: Optional[int] = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be positive, got {value}")
+        if self.start_method is not None and self.start_method not in multiprocessing.get_all_start_methods():
+            raise ValueError(f"Unknown multiprocessing start method {self.start_method!r}")
+
+
+class ExecutorProvider(DishkaProvider):
+    """
+    Provides an APP-scoped `ThreadPoolExecutor` and `ProcessPoolExecutor`.
+
+    Both executors are created on first use and shut down (cancelling pending work) when the
+    container closes, i.e. in the App's lifespan shutdown. The wait for running work happens in a
+    thread, so other shutdown steps keep running on the event loop meanwhile.
+
+    Example:
+        ```python
+        app = App(
+            "Pricing", "1.0.0", PricingProvider(),
+            ExecutorProvider(ExecutorConfig(process_workers=4), process_providers=[PricingModelProvider]),
+        )
+        ```
+    """
+
+    scope = Scope.APP
+
+    def __init__(
+        self,
+        config: Optional[ExecutorConfig] = None,
+        process_providers: Sequence[type[DishkaProvider]] = (),
+    ) -> None:
+        """
+        Initialize the provider.
+
+        Args:
+            config: Sizes of the executors (defaults to `ExecutorConfig()`)
+            process_providers: Provider classes instantiated in each worker process to build its
+                container; they must be importable (defined at module level) and take no arguments
+        """
+        super().__init__()
+        self.config = config or ExecutorConfig()
+        self.process_providers = tuple(process_providers)
+
+    async def provide_thread_pool(self) -> AsyncIterator[ThreadPoolExecutor]:
+        """Provide the thread pool, shut down with the container."""
+        executor = ThreadPoolExecutor(self.config.thread_workers, thread_name_prefix=self.config.thread_name_prefix)
+        try:
+            yield executor
+        finally:
+            await _shutdown(executor)
+
+    async def provide_process_pool(self) -> AsyncIterator[ProcessPoolExecutor]:
+        """Provide the process pool, shut down with the container."""
+        context = multiprocessing.get_context(self.config.start_method)
+        executor = ProcessPoolExecutor(
+            self.config.process_workers,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(self.process_providers,),
+            max_tasks_per_child=self.config.max_tasks_per_child,
+        )
+        try:
+            yield executor
+        finally:
+            await _shutdown(executor)
+
+    thread_pool = provide(source=provide_thread_pool)
+    process_pool = provide(source=provide_process_pool)
+
+
+async def _shutdown(executor: Executor) -> None:
+    """Shut an executor down, waiting for its running work in a thread so that the event loop keeps serving."""
+    await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+
+def _initialize_worker(provider_classes: tuple[type[DishkaProvider], ...]) -> None:
+    """Build the container of a worker process, closed when the process exits."""
+    global _worker_container
+
+    _worker_container = make_container(*(provider_class() for provider_class in provider_classes))
+    Finalize(None, _worker_container.close, exitpriority=10)
+
+
+def get_worker_container() -> Container:
+    """
+    Return the container of the current worker process.
+
+    Raises:
+        RuntimeError: If not called in a worker of an `ExecutorProvider` process pool
+    """
+    if _worker_container is None:
+        raise RuntimeError("No worker container: not running in an ExecutorProvider process pool")
+    return _worker_container
+
+
+def _call_injected(function: WorkerFunction[T], args: tuple[object, ...]) -> T:
+    """Run a function in a worker process, resolving its `FromDishka[...]` parameters."""
+    hints = cast(dict[str, object], get_type_hints(function, include_extras=True))
+    with get_worker_container()() as container:
+        injected: dict[str, object] = {}
+        for name, parameter in signature(function).parameters.items():
+            dependency = default_parse_dependency(parameter, hints.get(name))  # type: ignore[misc]
+            if dependency is not None:  # type: ignore[misc]
+                injected[name] = container.get(
+                    cast(type[object], dependency.type_hint), component=dependency.component  # type: ignore[misc]
+                )
+        return function(*args, **injected)
+
+
+async def run_in_process(executor: ProcessPoolExecutor, function: WorkerFunction[T], *args: object) -> T:
+    """
+    Run a function in a worker process of an `ExecutorProvider` process pool.
+
+    Parameters annotated with `FromDishka[...]` are resolved from the worker's container (in a
+    REQUEST scope opened for the call); the other ones receive `args`. The function and the
+    arguments must be picklable, i.e. the function must be defined at module level.
+
+    Example:
+        ```python
+        def price(ticket: Ticket, model: FromDishka[PricingModel]) -> Decimal: ...
+
+        @router.post("/price")
+        async def quote(ticket: Ticket, pool: FromDishka[ProcessPoolExecutor]) -> Decimal:
+            return await run_in_process(pool, price, ticket)
+        ```
+
+    Args:
+        executor: The process pool, usually injected as `FromDishka[ProcessPoolExecutor]`
+        function: The module-level function to run
+        *args: Positional arguments of the function
+
+    Returns:
+        The function's result
+    """
+    return await run_in_executor(executor, partial(_call_injected, function, args))
+
+
+async def run_in_executor(executor: Executor, function: Callable[[], T]) -> T:
+    """
+    Run a callable in an executor from async code, e.g. `ThreadPoolExecutor` work.
+
+    Args:
+        executor: The executor, usually injected as `FromDishka[ThreadPoolExecutor]`
+        function: The callable, without arguments (use `functools.partial`)
+
+    Returns:
+        The callable's result
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, function)
@@ -0,0 +1,151 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Sequence
+
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from fastapi_dishka.routing import RouteIndex, get_route_path
+
+
+@dataclass(frozen=True)
+class MiddlewareFilter:
+    """
+    Which requests a middleware registered with `provide_middleware()` runs for.
+
+    Prefixes match whole path segments: "/static" matches "/static" and "/static/app.js", but
+    not "/statics". Paths are taken relative to the root path. Empty criteria match everything.
+
+    Attributes:
+        include: Run only for paths under one of these prefixes
+        exclude: Never run for paths under one of these prefixes (wins over `include`)
+        methods: Run only for these HTTP methods (websocket connections have none)
+        tags: Run only for requests matching a route tagged with one of these tags
+    """
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    methods: frozenset[str] = frozenset()
+    tags: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        for prefix in (*self.include, *self.exclude):
+            if not prefix.startswith("/"):
+                raise ValueError(f"Middleware path prefixes must start with '/', got {prefix!r}")
+
+
+class _PrefixNode:
+    """One path segment of a `PathPrefixTrie`."""
+
+    __slots__ = ("children", "terminal")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixNode] = {}
+        self.terminal = False
+
+
+class PathPrefixTrie:
+    """Segment trie answering whether a path lies under any of a set of prefixes."""
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        """
+        Build the trie.
+
+        Args:
+            prefixes: Path prefixes starting with "/"
+        """
+        self._root = _PrefixNode()
+        for prefix in prefixes:
+            node = self._root
+            for segment in _segments(prefix):
+                node = node.children.setdefault(segment, _PrefixNode())
+            node.terminal = True
+
+    def matches(self, path: str) -> bool:
+        """Return True if the path equals one of the prefixes or lies below one."""
+        node = self._root
+        for segment in _segments(path):
+            if node.terminal:
+                return True
+            child = node.children.get(segment)
+            if child is None:
+                return False
+            node = child
+        return node.terminal
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+class FilteredMiddleware:
+    """
+    Runs a middleware only for the requests selected by a `MiddlewareFilter`.
+
+    Other requests go straight to the next app at the ASGI level, so a skipped `Middleware`
+    (a `BaseHTTPMiddleware`) doesn't even set up its task group and streams. Tags are resolved
+    when the middleware stack is built, i.e. once all routers have been included.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        middleware: Callable[[ASGIApp], ASGIApp],
+        middleware_filter: MiddlewareFilter,
+        routes: Sequence[BaseRoute] = (),
+    ) -> None:
+        """
+        Initialize the filtered middleware.
+
+        Args:
+            app: The next ASGI app
+            middleware: Callable creating the middleware around the next app (a class or factory)
+            middleware_filter: The requests to run the middleware for
+            routes: The app's routes, searched for the filter's tags
+        """
+        self.app = app
+        self.middleware = middleware(app)
+        self._methods = middleware_filter.methods
+        self._include = PathPrefixTrie(middleware_filter.include) if middleware_filter.include else None
+        self._exclude = PathPrefixTrie(middleware_filter.exclude) if middleware_filter.exclude else None
+        self._tagged: Optional[RouteIndex] = None
+        if middleware_filter.tags:
+            self._tagged = RouteIndex([route for route in routes if _has_tag(route, middleware_filter.tags)])
+
+    def should_run(self, scope: Scope) -> bool:
+        """Return True if the middleware should handle this connection."""
+        if self._methods:
+            method: Optional[str] = scope.get("method")
+            if method not in self._methods:
+                return False
+
+        path = get_route_path(scope)
+        if self._exclude is not None and self._exclude.matches(path):
+            return False
+        if self._include is not None and not self._include.matches(path):
+            return False
+
+        if self._tagged is not None:
+            for route in self._tagged.candidates(path):
+                match, _ = route.matches(scope)
+                if match == Match.FULL:
+                    return True
+            return False
+
+        return True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope_type: str = scope["type"]
+        if scope_type in ("http", "websocket") and not self.should_run(scope):
+            await self.app(scope, receive, send)
+            return
+        await self.middleware(scope, receive, send)
+
+
+def _has_tag(route: BaseRoute, tags: frozenset[str]) -> bool:
+    route_tags: Optional[Sequence[object]] = getattr(route, "tags", None)
+    for tag in route_tags or ():
+        # FastAPI accepts str and Enum tags
+        name: object = getattr(tag, "value", tag)
+        if name in tags:
+            return True
+    return False
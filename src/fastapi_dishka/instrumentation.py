@@ -0,0 +1,368 @@
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from time import perf_counter
+from types import TracebackType
+from typing import Callable, Literal, Optional, Protocol, Self, Sequence, cast
+
+from dishka import DEFAULT_COMPONENT, AsyncContainer, Component, DependencyKey
+from dishka.entities.scope import BaseScope
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+TimingKind = Literal["resolve", "container_enter", "container_exit", "middleware", "build", "finalize"]
+
+# Key of the per-connection stack used to separate a middleware's own time from the layers below it
+MIDDLEWARE_TIMERS_SCOPE_KEY = "fastapi_dishka.middleware_timers"
+
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+@dataclass(frozen=True)
+class Timing:
+    """
+    One measurement taken by the instrumentation layer.
+
+    Attributes:
+        kind: What was measured: a dependency resolution, entering or exiting a container,
+            the time a middleware spent in its own code (excluding the layers below it), or
+            building and finalizing an APP-scoped dependency at startup and shutdown
+        name: The dependency type, container scope or middleware class name
+        scope: The dishka scope of the resolved dependency or container ("" for middlewares)
+        seconds: The measured duration
+    """
+
+    kind: TimingKind
+    name: str
+    scope: str
+    seconds: float
+
+
+# A sink receives every measurement, synchronously, on the request path
+TimingSink = Callable[[Timing], None]
+
+
+def _type_name(dependency_type: object) -> str:
+    if isinstance(dependency_type, type):  # type: ignore[misc]
+        return dependency_type.__qualname__
+    return repr(dependency_type)
+
+
+class Instrumentation:
+    """
+    Records dishka timings for requests and forwards them to the configured sinks.
+
+    Pass an instance to `App(instrumentation=...)`. The App then measures:
+
+    - the resolution time of every dependency requested from a REQUEST/SESSION container
+      (by routes or middlewares), or from the app container for routes served by it directly,
+      labelled with the scope of its factory (APP, REQUEST, ...)
+    - the resolution time of the `AppDependency` attributes bound onto middlewares at startup
+    - the time to enter and to exit (finalize) the per-request containers, including child
+      containers entered from a container obtained through the request
+    - the dispatch time of every registered middleware, excluding the layers below it
+    - with `concurrent_lifecycle=True`, the time to build every APP-scoped dependency at startup
+      and to close the app container at shutdown
+
+    Example:
+        ```python
+        histogram = HistogramSink()
+        app = App("My API", "1.0.0", MyProvider(), instrumentation=Instrumentation(histogram, StructlogSink()))
+        app.app.add_route("/metrics", histogram.prometheus_endpoint)
+        ```
+    """
+
+    def __init__(self, *sinks: TimingSink) -> None:
+        """
+        Initialize the instrumentation.
+
+        Args:
+            *sinks: Callables receiving every `Timing`
+        """
+        self.sinks = sinks
+        self._scopes: dict[tuple[object, Component], str] = {}
+
+    def record(self, kind: TimingKind, name: str, scope: str, seconds: float) -> None:
+        """Forward one measurement to every sink."""
+        timing = Timing(kind, name, scope, seconds)
+        for sink in self.sinks:
+            sink(timing)
+
+    def factory_scope(self, container: AsyncContainer, dependency_type: object, component: Component) -> str:
+        """Find (and cache) the scope of the factory providing a dependency."""
+        cache_key = (dependency_type, component)
+        cached = self._scopes.get(cache_key)
+        if cached is not None:
+            return cached
+
+        key = DependencyKey(dependency_type, component)  # type: ignore[misc]
+        scope = ""
+        current: Optional[AsyncContainer] = container
+        while current is not None:
+            if current.registry.get_factory(key) is not None:  # type: ignore[misc]
+                registry_scope: BaseScope = current.registry.scope
+                scope = registry_scope.name
+                break
+            current = current.parent_container
+
+        self._scopes[cache_key] = scope
+        return scope
+
+    def wrap_container(self, container: AsyncContainer) -> AsyncContainer:
+        """Wrap a container so that every `get()` is timed."""
+        return cast(AsyncContainer, InstrumentedContainer(container, self))
+
+    def middleware_factory(self, name: str, factory: Callable[[ASGIApp], ASGIApp]) -> Callable[[ASGIApp], ASGIApp]:
+        """
+        Wrap a middleware factory so that the middleware's own dispatch time is recorded.
+
+        Args:
+            name: The name to report the middleware under
+            factory: Callable creating the middleware around the next ASGI app
+
+        Returns:
+            A callable suitable for `FastAPI.add_middleware()`
+        """
+
+        def create(app: ASGIApp) -> ASGIApp:
+            return _TimedMiddleware(factory(_TimedBoundary(app)), name, self)
+
+        return create
+
+
+class InstrumentedContainer:
+    """
+    Container proxy that times `get()` and delegates everything else.
+
+    Child containers entered through the proxy (`async with container(context) as child`) are
+    wrapped too, and the time to enter and to exit them is recorded.
+    """
+
+    def __init__(self, container: AsyncContainer, instrumentation: Instrumentation) -> None:
+        self._container = container
+        self._instrumentation = instrumentation
+        self._entering: Optional[float] = None
+
+    async def get(self, dependency_type: object, component: Optional[Component] = DEFAULT_COMPONENT) -> object:
+        component = component or DEFAULT_COMPONENT
+        started = perf_counter()
+        result: object = await self._container.get(dependency_type, component=component)  # type: ignore[misc]
+        elapsed = perf_counter() - started
+
+        scope = self._instrumentation.factory_scope(self._container, dependency_type, component)
+        self._instrumentation.record("resolve", _type_name(dependency_type), scope, elapsed)
+        return result
+
+    def __call__(
+        self,
+        context: Optional[dict[object, object]] = None,
+        lock_factory: Optional[Callable[[], AbstractAsyncContextManager[object]]] = None,
+        scope: Optional[BaseScope] = None,
+    ) -> "InstrumentedContainer":
+        # Special methods are looked up on the type, so `__getattr__` can't forward this one
+        started = perf_counter()
+        child = InstrumentedContainer(
+            self._container(context, lock_factory=lock_factory, scope=scope),
+            self._instrumentation,
+        )
+        child._entering = started
+        return child
+
+    async def __aenter__(self) -> Self:
+        started = perf_counter() if self._entering is None else self._entering
+        await self._container.__aenter__()
+        scope: BaseScope = self._container.scope
+        self._instrumentation.record("container_enter", scope.name, scope.name, perf_counter() - started)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exception: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        started = perf_counter()
+        try:
+            await self._container.__aexit__(exc_type, exception, traceback)
+        finally:
+            scope: BaseScope = self._container.scope
+            self._instrumentation.record("container_exit", scope.name, scope.name, perf_counter() - started)
+
+    def __getattr__(self, name: str) -> object:
+        attribute: object = getattr(self._container, name)
+        return attribute
+
+
+class _TimedMiddleware:
+    """Outer half of a middleware timer: total time minus the time spent below the middleware."""
+
+    def __init__(self, app: ASGIApp, name: str, instrumentation: Instrumentation) -> None:
+        self.app = app
+        self.name = name
+        self.instrumentation = instrumentation
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope_type: str = scope["type"]
+        if scope_type not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        timers: list[float] = scope.setdefault(MIDDLEWARE_TIMERS_SCOPE_KEY, list[float]())
+        timers.append(0.0)
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            elapsed = perf_counter() - started
+            below = timers.pop()
+            self.instrumentation.record("middleware", self.name, "", elapsed - below)
+
+
+class _TimedBoundary:
+    """Inner half of a middleware timer: measures the layers below the middleware."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        timers: Optional[list[float]] = scope.get(MIDDLEWARE_TIMERS_SCOPE_KEY)
+        if not timers:
+            await self.app(scope, receive, send)
+            return
+
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            timers[-1] += perf_counter() - started
+
+
+@dataclass
+class HistogramSeries:
+    """Bucket counts, total and count of one histogram series."""
+
+    counts: list[int]
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, buckets: Sequence[float], seconds: float) -> None:
+        self.total += seconds
+        self.count += 1
+        for index, bound in enumerate(buckets):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+
+
+class HistogramSink:
+    """
+    In-memory histogram of all timings, renderable in the Prometheus text format.
+
+    Mount `prometheus_endpoint` as a route to expose it.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets: Upper bounds (in seconds) of the histogram buckets, in increasing order
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[TimingKind, str, str], HistogramSeries] = {}
+
+    def __call__(self, timing: Timing) -> None:
+        key = (timing.kind, timing.name, timing.scope)
+        series = self._series.get(key)
+        if series is None:
+            series = HistogramSeries([0] * len(self.buckets))
+            self._series[key] = series
+        series.observe(self.buckets, timing.seconds)
+
+    def snapshot(self) -> dict[tuple[TimingKind, str, str], HistogramSeries]:
+        """Return the series recorded so far, keyed by (kind, name, scope)."""
+        return dict(self._series)
+
+    def reset(self) -> None:
+        """Forget all recorded timings."""
+        self._series.clear()
+
+    def render_prometheus(self) -> str:
+        """Render all series in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        for kind in ("resolve", "container_enter", "container_exit", "middleware", "build", "finalize"):
+            metric = f"fastapi_dishka_{kind}_seconds"
+            keys = sorted(key for key in self._series if key[0] == kind)
+            if not keys:
+                continue
+
+            lines.append(f"# HELP {metric} {_PROMETHEUS_HELP[kind]}")
+            lines.append(f"# TYPE {metric} histogram")
+            for key in keys:
+                _, name, scope = key
+                values = self._series[key]
+                labels = _prometheus_labels(kind, name, scope)
+                cumulative = 0
+                for bound, count in zip(self.buckets, values.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {values.count}')
+                lines.append(f"{metric}_sum{{{labels}}} {values.total}")
+                lines.append(f"{metric}_count{{{labels}}} {values.count}")
+
+        return "\n".join(lines) + "\n"
+
+    async def prometheus_endpoint(self, request: Request) -> PlainTextResponse:
+        """Starlette endpoint serving `render_prometheus()`."""
+        return PlainTextResponse(self.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+_PROMETHEUS_HELP: dict[str, str] = {
+    "resolve": "Time to resolve a dependency from the dishka container",
+    "container_enter": "Time to enter a per-connection dishka container",
+    "container_exit": "Time to exit (finalize) a per-connection dishka container",
+    "middleware": "Time spent in a middleware, excluding the layers below it",
+    "build": "Time to build an APP-scoped dependency at startup",
+    "finalize": "Time to finalize the APP-scoped dependencies at shutdown",
+}
+
+
+def _prometheus_labels(kind: str, name: str, scope: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    if kind in ("resolve", "build", "finalize"):
+        return f'dependency="{escape(name)}",scope="{escape(scope)}"'
+    if kind == "middleware":
+        return f'middleware="{escape(name)}"'
+    return f'scope="{escape(scope)}"'
+
+
+class TimingLogger(Protocol):
+    """The part of a structlog logger used by `StructlogSink`."""
+
+    def debug(self, event: str, **kw: object) -> object: ...
+
+
+class StructlogSink:
+    """Emit every timing as a structlog event."""
+
+    def __init__(self, logger: Optional[TimingLogger] = None, event: str = "dishka.timing") -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            logger: The structlog logger to use (defaults to `structlog.get_logger("fastapi_dishka")`)
+            event: The event name of the emitted log lines
+        """
+        if logger is None:
+            import structlog
+
+            logger = cast(TimingLogger, structlog.get_logger("fastapi_dishka"))
+
+        self.logger = logger
+        self.event = event
+
+    def __call__(self, timing: Timing) -> None:
+        self.logger.debug(self.event, kind=timing.kind, name=timing.name, scope=timing.scope, seconds=timing.seconds)
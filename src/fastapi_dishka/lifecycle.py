@@ -0,0 +1,227 @@
+"""
+Concurrent building of the APP-scoped dependencies.
+
+dishka builds APP-scoped dependencies one after another, on first use. `ContainerLifecycle` uses
+the dependency graph of the APP registry instead: dependencies are grouped into levels (level 0
+depends on no other APP-scoped dependency, level n only on lower levels) and each level is built
+concurrently at startup. At shutdown dishka finalizes them in reverse creation order, as usual.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Iterator, Optional, cast
+
+from dishka import AsyncContainer, DependencyKey
+from dishka.entities.factory_type import FactoryType
+from dishka.entities.marker import BoolMarker
+from dishka.exceptions import ExitError
+from dishka.registry import Registry
+
+from fastapi_dishka.instrumentation import Instrumentation, TimingKind, _type_name
+
+logger = logging.getLogger("fastapi_dishka.lifecycle")
+
+# A dishka `DependencyKey`; its type hint is typed as Any, so keys are handled as plain objects here
+DependencyNode = object
+
+
+@dataclass(frozen=True)
+class DependencyTiming:
+    """
+    Time taken to build one APP-scoped dependency.
+
+    Attributes:
+        name: The dependency type (and component, if any)
+        level: Its level in the dependency graph (0 for dependencies without APP-scoped dependencies)
+        seconds: The measured duration
+    """
+
+    name: str
+    level: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class LifecycleReport:
+    """
+    Timings of the last startup and shutdown of a `ContainerLifecycle`.
+
+    Attributes:
+        build: Per-dependency build timings, by level
+        build_seconds: Wall time of the startup
+        finalize_seconds: Wall time of the shutdown (closing the container)
+    """
+
+    build: tuple[DependencyTiming, ...] = ()
+    build_seconds: float = 0.0
+    finalize_seconds: float = 0.0
+
+
+def _graph_nodes(registry: Registry) -> dict[DependencyNode, list[DependencyNode]]:
+    """Map each cached APP-scoped dependency to the APP-scoped dependencies it needs."""
+    nodes: list[DependencyNode] = []
+    for key, factory in registry.factories.items():  # type: ignore[misc]
+        # Skip aliases registered for generic origins, decorated (inner) factories and context values
+        if key != factory.provides or key.depth or factory.type is FactoryType.CONTEXT:  # type: ignore[misc]
+            continue
+        if not factory.cache or factory.when_active != BoolMarker(True):
+            continue
+        nodes.append(key)  # type: ignore[misc]
+
+    known = set(nodes)
+
+    def edges(key: DependencyNode, seen: set[DependencyNode]) -> Iterator[DependencyNode]:
+        factory = registry.factories[cast(DependencyKey, key)]  # type: ignore[explicit-any, misc]
+        for dependency in [*factory.dependencies, *factory.kw_dependencies.values()]:  # type: ignore[misc]
+            dependency_factory = registry.factories.get(dependency)  # type: ignore[misc]
+            if dependency_factory is None:
+                # Provided by another scope or by the context
+                continue
+            target: DependencyNode = dependency_factory.provides
+            if target in known:
+                yield target
+            elif target not in seen:
+                # Inner decorated or uncached factories: their own dependencies count
+                seen.add(target)
+                yield from edges(target, seen)
+
+    return {key: sorted(set(edges(key, set())), key=str) for key in nodes}
+
+
+def dependency_levels(registry: Registry) -> list[list[DependencyNode]]:
+    """
+    Group the cached APP-scoped dependencies of a registry by level in the dependency graph.
+
+    Args:
+        registry: The APP registry
+
+    Returns:
+        The levels (lists of `DependencyKey`), each of which only depends on the previous ones
+    """
+    graph = _graph_nodes(registry)
+    levels: dict[DependencyNode, int] = {}
+
+    def level_of(key: DependencyNode) -> int:
+        level = levels.get(key)
+        if level is None:
+            level = 1 + max((level_of(dependency) for dependency in graph[key]), default=-1)
+            levels[key] = level
+        return level
+
+    grouped: list[list[DependencyNode]] = []
+    for key in graph:
+        level = level_of(key)
+        while len(grouped) <= level:
+            grouped.append([])
+        grouped[level].append(key)
+    return grouped
+
+
+def _dependency_name(node: DependencyNode) -> str:
+    key = cast(DependencyKey, node)  # type: ignore[explicit-any, misc]
+    name = _type_name(key.type_hint)  # type: ignore[misc]
+    component: str = key.component or ""  # type: ignore[misc]
+    return f"{name} (component {component!r})" if component else name
+
+
+class ContainerLifecycle:
+    """
+    Builds the APP-scoped dependencies of a container concurrently, along the dependency graph.
+
+    - `start()` builds every cached APP-scoped dependency with `container.get()`, one level of the
+      dependency graph at a time, all dependencies of a level concurrently.
+    - `close()` closes the container: dishka finalizes the dependencies in reverse creation order.
+
+    dishka's container lock serializes every `get()`, so builds only overlap for a container created
+    without one (`make_async_container(..., lock_factory=None)`); the App does so with
+    `concurrent_lifecycle=True`. Sync factories still run on the event loop, so only async ones overlap.
+    Timings are kept in `report` and forwarded to an `Instrumentation` if given.
+    """
+
+    def __init__(self, container: AsyncContainer, instrumentation: Optional[Instrumentation] = None) -> None:
+        """
+        Initialize the lifecycle manager.
+
+        Args:
+            container: The APP container
+            instrumentation: Receives the build and finalize timings, if given
+        """
+        self.container = container
+        self.instrumentation = instrumentation
+        self.report = LifecycleReport()
+        self._levels: list[list[DependencyNode]] = []
+
+    async def start(self) -> int:
+        """
+        Build the APP-scoped dependencies, level by level.
+
+        Returns:
+            The number of dependencies built
+
+        Raises:
+            Exception: The first error raised by a factory, once the other factories of its level are done;
+                the container is closed, finalizing the dependencies built until then, before it is raised
+        """
+        self._levels = dependency_levels(self.container.registry)
+
+        timings: list[DependencyTiming] = []
+        started = perf_counter()
+        try:
+            for level, keys in enumerate(self._levels):
+                results = await asyncio.gather(*(self._build(key, level) for key in keys), return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                    timings.append(result)
+        except BaseException:
+            await self._unwind()
+            raise
+
+        self.report = LifecycleReport(build=tuple(timings), build_seconds=perf_counter() - started)
+        logger.info(
+            "Built %d APP-scoped dependencies in %d levels in %.3fs",
+            len(timings),
+            len(self._levels),
+            self.report.build_seconds,
+        )
+        return len(timings)
+
+    async def _unwind(self) -> None:
+        """Finalize the dependencies built by a failed startup."""
+        try:
+            await self.container.close()
+        except ExitError as error:
+            for exception in error.exceptions:
+                logger.error("Finalizer failed after a failed startup", exc_info=exception)
+
+    async def _build(self, key: DependencyNode, level: int) -> DependencyTiming:
+        dependency = cast(DependencyKey, key)  # type: ignore[explicit-any, misc]
+        started = perf_counter()
+        await self.container.get(dependency.type_hint, dependency.component)  # type: ignore[misc]
+        timing = DependencyTiming(_dependency_name(key), level, perf_counter() - started)
+        self._record("build", timing)
+        return timing
+
+    async def close(self) -> None:
+        """
+        Close the container, finalizing the APP-scoped dependencies.
+
+        Raises:
+            ExitError: If finalizers raised (after all finalizers ran)
+        """
+        started = perf_counter()
+        try:
+            await self.container.close()
+        finally:
+            seconds = perf_counter() - started
+            self.report = LifecycleReport(
+                build=self.report.build, build_seconds=self.report.build_seconds, finalize_seconds=seconds
+            )
+            if self.instrumentation is not None:
+                self.instrumentation.record("finalize", "APP", "APP", seconds)
+
+    def _record(self, kind: TimingKind, timing: DependencyTiming) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.record(kind, timing.name, "APP", timing.seconds)
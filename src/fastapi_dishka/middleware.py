@@ -1,13 +1,100 @@
-from typing import Awaitable, Callable, Optional, TypeVar
+from typing import Awaitable, Callable, Generic, Optional, Sequence, Type, TypeVar, Union, cast, overload
 
-from dishka import AsyncContainer
+from dishka import DEFAULT_COMPONENT, AsyncContainer, Component
 from fastapi import FastAPI, Request
 from starlette.datastructures import State
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware, DispatchFunction, RequestResponseEndpoint
 from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 T = TypeVar("T")
+A = TypeVar("A")
+B = TypeVar("B")
+C = TypeVar("C")
+
+# Key of the per-request resolution cache stored in the ASGI scope
+DEPENDENCY_CACHE_SCOPE_KEY = "fastapi_dishka.dependency_cache"
+
+DependencyCache = dict[tuple[object, Component], object]
+
+
+def _get_container(scope: Scope) -> AsyncContainer:
+    """
+    Find the dishka container for an ASGI connection.
+
+    The request-scoped container (which can access both REQUEST and APP scoped dependencies)
+    is preferred, falling back to the app-scoped container if the request container is not available.
+    """
+    container: AsyncContainer
+
+    # Read the raw state dict instead of probing starlette's State wrapper
+    request_state: Optional[dict[str, object]] = scope.get("state")
+
+    # Try to get from request container first (can access REQUEST + APP scopes)
+    if request_state is not None and "dishka_container" in request_state:
+        container = cast(AsyncContainer, request_state["dishka_container"])
+        assert container is not None
+        return container
+
+    # Fallback to app container (APP scope only)
+    app: FastAPI = scope["app"]
+    app_state: State = app.state
+    if hasattr(app_state, "container"):
+        container = app_state.container
+        assert container is not None
+        return container
+
+    raise AttributeError("No dishka container found. Make sure dishka is properly set up with the app.")
+
+
+def _get_dependency_cache(scope: Scope) -> DependencyCache:
+    """Return the resolution cache shared by all DI-aware middlewares handling this connection."""
+    cache: Optional[DependencyCache] = scope.get(DEPENDENCY_CACHE_SCOPE_KEY)
+    if cache is None:
+        cache = DependencyCache()
+        scope[DEPENDENCY_CACHE_SCOPE_KEY] = cache
+    return cache
+
+
+async def resolve_dependencies(
+    scope: Scope, *dependency_types: type[object], component: Component = DEFAULT_COMPONENT
+) -> list[object]:
+    """
+    Resolve dependencies for an ASGI connection through its request-scoped resolution cache.
+
+    Every type is looked up in the cache stored in the ASGI scope first, so several middlewares
+    asking for the same service in one request only hit the container once. The container itself
+    is located at most once per call.
+
+    Args:
+        scope: The ASGI connection scope
+        *dependency_types: The types of dependencies to resolve
+        component: The dishka component to resolve from
+
+    Returns:
+        The resolved dependency instances, in the order of `dependency_types`
+
+    Raises:
+        AttributeError: If no container is available
+    """
+    cache = _get_dependency_cache(scope)
+    container: Optional[AsyncContainer] = None
+    results: list[object] = []
+
+    for dependency_type in dependency_types:
+        key = (dependency_type, component)
+        if key in cache:
+            results.append(cache[key])
+            continue
+
+        if container is None:
+            container = _get_container(scope)
+
+        result: object = await container.get(dependency_type, component=component)
+        cache[key] = result
+        results.append(result)
+
+    return results
 
 
 class Middleware(BaseHTTPMiddleware):
@@ -18,8 +105,17 @@ class Middleware(BaseHTTPMiddleware):
     injected through the dishka container.
 
     Use the `get_dependency()` method to resolve dependencies from the container.
+
+    Set `needs_request_container = True` if `dispatch` resolves REQUEST-scoped dependencies
+    before calling the next layer; the App then opens the REQUEST container outside this middleware.
     """
 
+    # Whether a REQUEST-scope container must already be open when dispatch() runs
+    needs_request_container: bool = False
+
+    # Types resolved through get_dependency(), checked at startup by App(validate=True)
+    dishka_dependencies: tuple[type[object], ...] = ()
+
     def __init__(
         self,
         app: ASGIApp,
@@ -34,7 +130,9 @@ class Middleware(BaseHTTPMiddleware):
         """
         super().__init__(app, dispatch=dispatch)
 
-    async def get_dependency(self, request: Request, dependency_type: type[T]) -> T:
+    async def get_dependency(
+        self, request: Request, dependency_type: type[T], component: Component = DEFAULT_COMPONENT
+    ) -> T:
         """
         Get a dependency from the dishka container.
 
@@ -42,9 +140,13 @@ class Middleware(BaseHTTPMiddleware):
         (which can access both REQUEST and APP scoped dependencies), and falls back
         to the app-scoped container if the request container is not available.
 
+        Resolved instances are cached in the ASGI scope for the rest of the request, and the
+        cache is shared by every `Middleware` and `AsgiMiddleware` handling that request.
+
         Args:
             request: The current request (used to access the container)
             dependency_type: The type of dependency to resolve
+            component: The dishka component to resolve from
 
         Returns:
             The resolved dependency instance
@@ -52,33 +154,40 @@ class Middleware(BaseHTTPMiddleware):
         Raises:
             AttributeError: If no container is available
         """
+        (result,) = await resolve_dependencies(request.scope, dependency_type, component=component)
+        return cast(T, result)
 
-        container: AsyncContainer
-
-        app: FastAPI = request.app
-        request_state: State = request.state
-        app_state: State = app.state
+    @overload
+    async def get_dependencies(self, request: Request, type_a: type[A], type_b: type[B], /) -> tuple[A, B]: ...
 
-        # Try to get from request container first (can access REQUEST + APP scopes)
-        if hasattr(request_state, "dishka_container"):
-            container = request_state.dishka_container
-            assert container is not None
+    @overload
+    async def get_dependencies(
+        self, request: Request, type_a: type[A], type_b: type[B], type_c: type[C], /
+    ) -> tuple[A, B, C]: ...
 
-            result = await container.get(dependency_type)
+    @overload
+    async def get_dependencies(self, request: Request, /, *dependency_types: type[object]) -> tuple[object, ...]: ...
 
-            return result
+    async def get_dependencies(self, request: Request, /, *dependency_types: type[object]) -> tuple[object, ...]:
+        """
+        Get several dependencies from the dishka container in one pass.
 
-        # Fallback to app container (APP scope only)
-        elif hasattr(app_state, "container"):
-            container = app_state.container
-            assert container is not None
+        Example:
+            ```python
+            auth, settings = await self.get_dependencies(request, AuthService, Settings)
+            ```
 
-            result = await container.get(dependency_type)
+        Args:
+            request: The current request (used to access the container)
+            *dependency_types: The types of dependencies to resolve
 
-            return result
+        Returns:
+            The resolved dependency instances, in the requested order
 
-        else:
-            raise AttributeError("No dishka container found. Make sure dishka is properly set up with the app.")
+        Raises:
+            AttributeError: If no container is available
+        """
+        return tuple(await resolve_dependencies(request.scope, *dependency_types))
 
     async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
         """
@@ -96,3 +205,314 @@ class Middleware(BaseHTTPMiddleware):
         """
         # Default implementation just passes through
         return await call_next(request)
+
+
+class AsgiMiddleware:
+    """
+    Pure ASGI base middleware class that supports dependency injection.
+
+    Unlike `Middleware`, this class does not derive from Starlette's `BaseHTTPMiddleware`,
+    so no task group, memory streams or Request/Response wrappers are created per request
+    and streaming responses pass through untouched.
+
+    Override `__call__` to implement custom logic and use
+    `await self.get_dependency(scope, SomeClass)` to resolve dependencies.
+
+    Example:
+        ```python
+        class TimingMiddleware(AsgiMiddleware):
+            async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+                if scope["type"] == "http":
+                    metrics = await self.get_dependency(scope, Metrics)
+                    metrics.requests += 1
+                await self.app(scope, receive, send)
+        ```
+
+    Set `needs_request_container = True` to resolve REQUEST-scoped dependencies before calling
+    `self.app`; the App then opens the REQUEST container outside this middleware.
+    """
+
+    # Whether a REQUEST-scope container must already be open when __call__() runs
+    needs_request_container: bool = False
+
+    # Types resolved through get_dependency(), checked at startup by App(validate=True)
+    dishka_dependencies: tuple[type[object], ...] = ()
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The next ASGI application in the stack
+        """
+        self.app = app
+
+    async def get_dependency(
+        self, scope: Scope, dependency_type: type[T], component: Component = DEFAULT_COMPONENT
+    ) -> T:
+        """
+        Get a dependency from the dishka container.
+
+        This method first tries to get the dependency from the request-scoped container
+        (which can access both REQUEST and APP scoped dependencies), and falls back
+        to the app-scoped container if the request container is not available.
+
+        Resolved instances are cached in the ASGI scope for the rest of the request, and the
+        cache is shared by every `Middleware` and `AsgiMiddleware` handling that request.
+
+        Args:
+            scope: The ASGI connection scope (used to access the container)
+            dependency_type: The type of dependency to resolve
+            component: The dishka component to resolve from
+
+        Returns:
+            The resolved dependency instance
+
+        Raises:
+            AttributeError: If no container is available
+        """
+        (result,) = await resolve_dependencies(scope, dependency_type, component=component)
+        return cast(T, result)
+
+    @overload
+    async def get_dependencies(self, scope: Scope, type_a: type[A], type_b: type[B], /) -> tuple[A, B]: ...
+
+    @overload
+    async def get_dependencies(
+        self, scope: Scope, type_a: type[A], type_b: type[B], type_c: type[C], /
+    ) -> tuple[A, B, C]: ...
+
+    @overload
+    async def get_dependencies(self, scope: Scope, /, *dependency_types: type[object]) -> tuple[object, ...]: ...
+
+    async def get_dependencies(self, scope: Scope, /, *dependency_types: type[object]) -> tuple[object, ...]:
+        """
+        Get several dependencies from the dishka container in one pass.
+
+        Args:
+            scope: The ASGI connection scope (used to access the container)
+            *dependency_types: The types of dependencies to resolve
+
+        Returns:
+            The resolved dependency instances, in the requested order
+
+        Raises:
+            AttributeError: If no container is available
+        """
+        return tuple(await resolve_dependencies(scope, *dependency_types))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process the ASGI connection.
+
+        Override this method in your middleware to implement custom logic.
+        Call `await self.app(scope, receive, send)` to pass control down the stack.
+
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        # Default implementation just passes through
+        await self.app(scope, receive, send)
+
+
+# Any middleware class that can be registered through provide_middleware()
+MiddlewareType = Union[Type[Middleware], Type[AsgiMiddleware]]
+
+
+class AppDependency(Generic[T]):
+    """
+    Declare a middleware attribute that is resolved once from the APP-scope container.
+
+    The `App` resolves every declared attribute right after the container is built and binds the
+    instance onto each middleware object, so reading it on the hot path is a plain attribute
+    access instead of an awaited `get_dependency()` call. Only APP-scoped dependencies can be
+    declared this way; REQUEST-scoped ones still go through `get_dependency()`.
+
+    Example:
+        ```python
+        class RateLimitMiddleware(AsgiMiddleware):
+            settings = AppDependency(Settings)
+
+            async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+                limit = self.settings.rate_limit
+                ...
+        ```
+    """
+
+    def __init__(self, dependency_type: type[T], component: Component = DEFAULT_COMPONENT) -> None:
+        """
+        Initialize the declaration.
+
+        Args:
+            dependency_type: The APP-scoped type to resolve
+            component: The dishka component to resolve from
+        """
+        self.dependency_type = dependency_type
+        self.component = component
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "AppDependency[T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> T: ...
+
+    def __get__(self, instance: Optional[object], owner: type) -> "Union[AppDependency[T], T]":
+        # Bound values live in the instance __dict__ and shadow this (non-data) descriptor,
+        # so this is only reached for class access or before the container was resolved.
+        if instance is None:
+            return self
+
+        raise AttributeError(
+            f"APP dependency '{self.name}' of {owner.__name__} is not bound yet. "
+            "Make sure the middleware is registered through provide_middleware() and the app container is resolved."
+        )
+
+
+def get_app_dependencies(middleware_class: type) -> dict[str, AppDependency[object]]:
+    """
+    Collect the `AppDependency` declarations of a middleware class, including inherited ones.
+
+    Args:
+        middleware_class: The middleware class to inspect
+
+    Returns:
+        Mapping of attribute name to declaration
+    """
+    declarations: dict[str, AppDependency[object]] = {}
+
+    for klass in reversed(middleware_class.__mro__):
+        namespace = cast(dict[str, object], vars(klass))
+        for name, value in namespace.items():
+            if isinstance(value, AppDependency):
+                declarations[name] = value
+
+    return declarations
+
+
+class AppDependencyBinder:
+    """
+    Binds `AppDependency` declarations onto middleware instances.
+
+    Starlette instantiates middlewares lazily when it builds its middleware stack, so instances
+    are registered here as they are created and receive their values as soon as `bind()` has
+    resolved them (immediately, if it already ran).
+    """
+
+    def __init__(self) -> None:
+        self._instances: list[object] = []
+        self._values: dict[type, dict[str, object]] = {}
+        self._bound = False
+
+    def factory(self, middleware_class: MiddlewareType) -> Callable[[ASGIApp], ASGIApp]:
+        """
+        Create a middleware factory that registers every instance it creates.
+
+        Args:
+            middleware_class: The middleware class to instantiate
+
+        Returns:
+            A callable suitable for `FastAPI.add_middleware()`
+        """
+
+        def create(app: ASGIApp) -> ASGIApp:
+            instance = middleware_class(app)
+            self.register(instance)
+            return instance
+
+        return create
+
+    def register(self, instance: object) -> None:
+        """
+        Track a middleware instance, binding its dependencies right away if they are resolved.
+
+        Args:
+            instance: The middleware instance
+        """
+        self._instances.append(instance)
+        if self._bound:
+            self._apply(instance)
+
+    async def bind(self, container: AsyncContainer, middleware_classes: Sequence[type]) -> None:
+        """
+        Resolve the declared dependencies of the given classes and bind them to all instances.
+
+        Args:
+            container: The APP-scope container
+            middleware_classes: The middleware classes whose declarations should be resolved
+        """
+        for middleware_class in middleware_classes:
+            values: dict[str, object] = {}
+            for name, declaration in get_app_dependencies(middleware_class).items():
+                values[name] = await container.get(declaration.dependency_type, component=declaration.component)
+            self._values[middleware_class] = values
+
+        self._bound = True
+        for instance in self._instances:
+            self._apply(instance)
+
+    def _apply(self, instance: object) -> None:
+        for klass in type(instance).__mro__:
+            for name, value in self._values.get(klass, {}).items():
+                setattr(instance, name, value)
+
+
+class FusedMiddleware(BaseHTTPMiddleware):
+    """
+    Single ASGI layer that runs a whole chain of `Middleware` subclasses.
+
+    Registering N `Middleware` subclasses with Starlette builds N nested apps, each with its own
+    task group, memory streams and Request/Response wrappers. This layer instantiates every
+    middleware once at construction, pre-binds their `dispatch` hooks and runs them in a loop
+    inside one `BaseHTTPMiddleware`, so the per-request setup is paid only once.
+
+    Middlewares run in the same order Starlette would use: the last registered one is the outermost.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        middlewares: Sequence[Type[Middleware]],
+        binder: Optional[AppDependencyBinder] = None,
+    ) -> None:
+        """
+        Initialize the fused chain.
+
+        Args:
+            app: The ASGI application wrapped by the chain
+            middlewares: Middleware classes in registration order
+            binder: Optional binder that receives the created instances to inject `AppDependency` attributes
+        """
+        super().__init__(app)
+        # Outermost first, mirroring Starlette's add_middleware() onion
+        self.middlewares: list[Middleware] = [middleware_class(app) for middleware_class in reversed(middlewares)]
+        if binder is not None:
+            for middleware in self.middlewares:
+                binder.register(middleware)
+        self._dispatchers: tuple[DispatchFunction, ...] = tuple(middleware.dispatch for middleware in self.middlewares)
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        """
+        Run the pre-bound dispatch hooks, ending with the wrapped application.
+
+        Args:
+            request: The incoming request
+            call_next: Function to call the wrapped application
+
+        Returns:
+            The response object
+        """
+        dispatchers = self._dispatchers
+        last = len(dispatchers)
+
+        async def call_at(index: int, request: Request) -> Response:
+            if index == last:
+                return await call_next(request)
+            return await dispatchers[index](request, lambda next_request: call_at(index + 1, next_request))
+
+        return await call_at(0, request)
@@ -0,0 +1,169 @@
+"""
+Pre-serialized OpenAPI schemas.
+
+Dump the schema of an App at build time:
+
+    python -m fastapi_dishka openapi my_service.main:app openapi.json
+
+and serve it with `App(..., openapi_file="openapi.json")`, or let the App build it at startup
+with `App(..., precompute_openapi=True)`.
+"""
+
+import argparse
+import hashlib
+import json
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Mapping, Optional, Sequence, Union
+
+from fastapi import FastAPI
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route, request_response
+
+if TYPE_CHECKING:
+    from fastapi_dishka.app import App
+
+
+class OpenAPIDocument:
+    """An OpenAPI schema encoded once and served as bytes with an ETag."""
+
+    def __init__(self, body: bytes) -> None:
+        """
+        Initialize the document.
+
+        Args:
+            body: The JSON-encoded schema
+        """
+        self.body = body
+        self.schema: dict[str, object] = json.loads(body)
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self._by_root_path: dict[str, OpenAPIDocument] = {}
+
+    @classmethod
+    def from_schema(cls, schema: Mapping[str, object]) -> "OpenAPIDocument":
+        """Encode a schema the way FastAPI's `JSONResponse` does."""
+        body = json.dumps(schema, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"))
+        return cls(body.encode("utf-8"))
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "OpenAPIDocument":
+        """Load a schema written by `dump_openapi()`."""
+        return cls(Path(path).read_bytes())
+
+    def with_root_path(self, root_path: str) -> "OpenAPIDocument":
+        """
+        Get the document as served under a root path, encoded once per root path.
+
+        Like FastAPI's own OpenAPI route, the root path is listed first in `servers` unless a
+        server already has that URL.
+        """
+        document = self._by_root_path.get(root_path)
+        if document is None:
+            servers = self.schema.get("servers")
+            listed: list[object] = list(servers) if isinstance(servers, list) else []
+            urls = {server.get("url") for server in listed if isinstance(server, dict)}
+            if root_path in urls:
+                document = self
+            else:
+                document = self.from_schema({**self.schema, "servers": [{"url": root_path}, *listed]})
+            self._by_root_path[root_path] = document
+        return document
+
+    async def endpoint(self, request: Request) -> Response:
+        """Starlette endpoint serving the document, answering conditional requests with 304."""
+        headers = {"ETag": self.etag}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if self.etag in tags or "*" in tags:
+                return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+def install_openapi(app: FastAPI, document: OpenAPIDocument) -> None:
+    """
+    Serve a precomputed document from the app's OpenAPI route.
+
+    `FastAPI.openapi()` returns the document's schema too, so the docs pages and any other
+    caller never trigger route introspection. A request's `root_path` is added to `servers` as
+    FastAPI's own route does, with one encoding kept per root path.
+
+    Args:
+        app: The FastAPI application
+        document: The document to serve
+    """
+    app.openapi_schema = document.schema
+
+    async def endpoint(request: Request) -> Response:
+        root_path: str = request.scope.get("root_path", "").rstrip("/")
+        served = document.with_root_path(root_path) if root_path and app.root_path_in_servers else document
+        return await served.endpoint(request)
+
+    for route in app.router.routes:
+        if isinstance(route, Route) and route.path == app.openapi_url:  # type: ignore[misc]
+            # Replaced in place so that the route keeps its position (and any routing index stays valid)
+            route.endpoint = endpoint
+            route.app = request_response(endpoint)
+
+
+def build_openapi(app: "App") -> OpenAPIDocument:
+    """
+    Build the OpenAPI document of an App from its routes.
+
+    No container is created and no server is started. The document is always generated from the
+    registered routes: the App's `openapi_file` (typically the file being written) and a schema
+    cached by an earlier call are ignored.
+
+    Args:
+        app: The App to document
+
+    Returns:
+        The encoded document
+    """
+    fastapi_app = app.app
+    cached: Optional[dict[str, object]] = fastapi_app.openapi_schema
+    fastapi_app.openapi_schema = None
+    try:
+        return OpenAPIDocument.from_schema(fastapi_app.openapi())  # type: ignore[misc]
+    finally:
+        fastapi_app.openapi_schema = cached
+
+
+def dump_openapi(app: "App", path: Union[str, Path]) -> OpenAPIDocument:
+    """
+    Write the OpenAPI document of an App to a file, to be loaded with `App(openapi_file=...)`.
+
+    Args:
+        app: The App to document
+        path: The file to write
+
+    Returns:
+        The written document
+    """
+    document = build_openapi(app)
+    Path(path).write_bytes(document.body)
+    return document
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point: dump the OpenAPI document of `module:attribute` to a file."""
+    from fastapi_dishka.app import App
+
+    parser = argparse.ArgumentParser(
+        prog="python -m fastapi_dishka openapi", description="Dump the OpenAPI schema of a fastapi_dishka App"
+    )
+    parser.add_argument("app", help="Import path of the App instance, e.g. my_service.main:app")
+    parser.add_argument("output", type=Path, help="File to write the schema to")
+    args = parser.parse_args(argv)
+
+    target: str = args.app
+    module_name, _, attribute = target.partition(":")
+    app: object = getattr(import_module(module_name), attribute or "app")
+    if not isinstance(app, App):
+        parser.error(f"{target} is not a fastapi_dishka App")
+
+    output: Path = args.output
+    document = dump_openapi(app, output)
+    print(f"Wrote {len(document.body)} bytes to {output} (ETag {document.etag})")
+    return 0
@@ -0,0 +1,300 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from time import monotonic
+from typing import AsyncIterator, Awaitable, Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger("fastapi_dishka.pooling")
+
+T = TypeVar("T")
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no pooled resource became available within the acquire timeout."""
+
+
+class PoolClosedError(RuntimeError):
+    """Raised when acquiring from a pool that was closed."""
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Point-in-time statistics of a `ResourcePool`.
+
+    Attributes:
+        size: Open resources, idle or leased
+        idle: Resources waiting in the pool
+        in_use: Leased resources
+        waiting: Callers waiting for a resource
+        max_size: Maximum number of open resources
+        created: Resources opened since the pool started
+        closed: Resources closed since the pool started (reaped, unhealthy or at shutdown)
+        acquire_timeouts: Acquisitions that timed out
+    """
+
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    max_size: int
+    created: int
+    closed: int
+    acquire_timeouts: int
+
+
+@dataclass
+class _Idle(Generic[T]):
+    resource: T
+    since: float
+
+
+class ResourcePool(Generic[T]):
+    """
+    Async pool of reusable resources (database connections, HTTP or cache clients).
+
+    - `start()` opens `min_size` resources; more are opened on demand, up to `max_size`.
+    - `acquire()` waits at most `acquire_timeout` seconds for a resource when all are leased.
+    - Idle resources are checked with `health_check` before being handed out; unhealthy ones
+      are closed and replaced.
+    - Resources idle for more than `idle_timeout` seconds are closed in the background, down
+      to `min_size`.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], Awaitable[T]],
+        *,
+        close: Optional[Callable[[T], Awaitable[None]]] = None,
+        health_check: Optional[Callable[[T], Awaitable[bool]]] = None,
+        min_size: int = 0,
+        max_size: int = 10,
+        acquire_timeout: Optional[float] = 10.0,
+        idle_timeout: Optional[float] = 300.0,
+    ) -> None:
+        """
+        Initialize the pool (no resource is opened before `start()` or `acquire()`).
+
+        Args:
+            create: Opens a new resource
+            close: Closes a resource, if it needs closing
+            health_check: Returns whether an idle resource can still be used
+            min_size: Resources opened at startup and kept open by the idle reaper
+            max_size: Maximum number of open resources
+            acquire_timeout: Seconds to wait for a resource, or None to wait indefinitely
+            idle_timeout: Seconds after which idle resources beyond `min_size` are closed, or None
+
+        Raises:
+            ValueError: If the sizes are inconsistent
+        """
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError(f"Expected 0 <= min_size <= max_size and max_size >= 1, got {min_size} and {max_size}")
+
+        self._create = create
+        self._close = close
+        self._health_check = health_check
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.idle_timeout = idle_timeout
+
+        self._idle: deque[_Idle[T]] = deque()
+        self._size = 0
+        self._waiting = 0
+        self._created = 0
+        self._closed = 0
+        self._acquire_timeouts = 0
+        self._is_closed = False
+        self._available: Optional[asyncio.Condition] = None
+        self._reaper: Optional[asyncio.Task[None]] = None
+
+    @property
+    def stats(self) -> PoolStats:
+        """The current pool statistics, for monitoring."""
+        return PoolStats(
+            size=self._size,
+            idle=len(self._idle),
+            in_use=self._size - len(self._idle),
+            waiting=self._waiting,
+            max_size=self.max_size,
+            created=self._created,
+            closed=self._closed,
+            acquire_timeouts=self._acquire_timeouts,
+        )
+
+    @property
+    def available(self) -> asyncio.Condition:
+        """Condition notified whenever a resource or a slot becomes available."""
+        # Created lazily so that it belongs to the loop using the pool
+        if self._available is None:
+            self._available = asyncio.Condition()
+        return self._available
+
+    async def start(self) -> None:
+        """Open `min_size` resources and start the idle reaper."""
+        while self._size < self.min_size:
+            self._size += 1
+            try:
+                resource = await self._open()
+            except BaseException:
+                self._size -= 1
+                raise
+            self._idle.append(_Idle(resource, monotonic()))
+
+        if self.idle_timeout is not None and self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap_forever(self.idle_timeout))
+
+    async def acquire(self) -> T:
+        """
+        Take a resource from the pool, opening one if none is idle and the pool isn't full.
+
+        Returns:
+            The resource, to be given back with `release()`
+
+        Raises:
+            PoolTimeoutError: If no resource became available within `acquire_timeout`
+            PoolClosedError: If the pool is closed
+        """
+        try:
+            return await asyncio.wait_for(self._acquire(), self.acquire_timeout)
+        except TimeoutError:
+            self._acquire_timeouts += 1
+            raise PoolTimeoutError(
+                f"No resource available within {self.acquire_timeout}s ({self._size}/{self.max_size} in use)"
+            ) from None
+
+    async def _acquire(self) -> T:
+        while True:
+            idle: Optional[_Idle[T]] = None
+            async with self.available:
+                while True:
+                    if self._is_closed:
+                        raise PoolClosedError("The pool is closed")
+                    if self._idle:
+                        idle = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    self._waiting += 1
+                    try:
+                        await self.available.wait()
+                    finally:
+                        self._waiting -= 1
+
+            # Opening and checking resources happens outside the lock, so slow ones don't block releases
+            if idle is None:
+                try:
+                    return await self._open()
+                except BaseException:
+                    await self._forget()
+                    raise
+
+            try:
+                healthy = await self._is_healthy(idle.resource)
+            except BaseException:
+                # Cancelled (e.g. timed out) during the check: the resource goes back untouched
+                await self.release(idle.resource)
+                raise
+            if healthy:
+                return idle.resource
+            await self._forget()
+            await self._discard(idle.resource)
+
+    async def release(self, resource: T) -> None:
+        """
+        Give a resource back to the pool.
+
+        Args:
+            resource: A resource obtained from `acquire()`
+        """
+        async with self.available:
+            if not self._is_closed:
+                self._idle.append(_Idle(resource, monotonic()))
+                self.available.notify()
+                return
+        await self._forget()
+        await self._discard(resource)
+
+    async def _forget(self) -> None:
+        """Free the slot of a resource that won't come back, waking up a waiter to open a new one."""
+        async with self.available:
+            self._size -= 1
+            self.available.notify()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[T]:
+        """Acquire a resource for the duration of the `async with` block."""
+        resource = await self.acquire()
+        try:
+            yield resource
+        finally:
+            await self.release(resource)
+
+    async def reap(self) -> int:
+        """
+        Close the resources idle for longer than `idle_timeout`, keeping `min_size` open.
+
+        Returns:
+            The number of closed resources
+        """
+        if self.idle_timeout is None:
+            return 0
+
+        expired: list[T] = []
+        async with self.available:
+            deadline = monotonic() - self.idle_timeout
+            # Least recently used first: acquire() takes from the right end
+            while self._idle and self._size > self.min_size and self._idle[0].since <= deadline:
+                expired.append(self._idle.popleft().resource)
+                self._size -= 1
+
+        for resource in expired:
+            await self._discard(resource)
+        return len(expired)
+
+    async def close(self) -> None:
+        """Close the idle resources and stop the reaper; leased resources are closed on release."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
+        async with self.available:
+            self._is_closed = True
+            idle = [entry.resource for entry in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self.available.notify_all()
+
+        for resource in idle:
+            await self._discard(resource)
+
+    async def _open(self) -> T:
+        resource = await self._create()
+        self._created += 1
+        return resource
+
+    async def _is_healthy(self, resource: T) -> bool:
+        if self._health_check is None:
+            return True
+        try:
+            return await self._health_check(resource)
+        except Exception:
+            logger.warning("Health check of pooled resource %r failed", resource, exc_info=True)
+            return False
+
+    async def _discard(self, resource: T) -> None:
+        self._closed += 1
+        if self._close is None:
+            return
+        try:
+            await self._close(resource)
+        except Exception:
+            logger.warning("Closing pooled resource %r failed", resource, exc_info=True)
+
+    async def _reap_forever(self, idle_timeout: float) -> None:
+        while True:
+            await asyncio.sleep(max(idle_timeout / 2, 0.01))
+            await self.reap()
@@ -1,10 +1,27 @@
-from typing import Callable, Protocol, Type
+import inspect
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    cast,
+    get_type_hints,
+)
 
 from dishka import Provider as DishkaProvider
 from dishka import Scope, provide
 from dishka.dependency_source import CompositeDependencySource
 
-from fastapi_dishka.middleware import Middleware
+from fastapi_dishka.caching import TTLCache
+from fastapi_dishka.filtering import MiddlewareFilter
+from fastapi_dishka.middleware import Middleware, MiddlewareType
+from fastapi_dishka.pooling import ResourcePool
 from fastapi_dishka.router import APIRouter
 
 
@@ -14,9 +31,18 @@ class MiddlewareClass(Protocol):
     def __call__(self, app: object, **kwargs: object) -> Middleware: ...
 
 
+T = TypeVar("T")
+
+# Factories registered with provide_cached(): sync or async, with any injected parameters
+CachedFactory = Callable[..., object]  # type: ignore[explicit-any]
+
+# Keyword-only parameter through which dishka injects the APP-scoped cache into a cached factory
+_CACHE_PARAMETER = "fastapi_dishka_cache"
+
 # Temporary storage for routers and middlewares during class creation
 _current_class_routers: list[APIRouter] = []
-_current_class_middlewares: list[Type[Middleware]] = []
+_current_class_middlewares: list[MiddlewareType] = []
+_current_class_middleware_filters: dict[MiddlewareType, MiddlewareFilter] = {}
 
 # Track if we're currently inside a Provider class definition
 _inside_provider_class: bool = False
@@ -26,36 +52,93 @@ def _clear_all_registries() -> None:
     """Clear all registries for testing purposes."""
     _current_class_routers.clear()
     _current_class_middlewares.clear()
+    _current_class_middleware_filters.clear()
 
 
-def _collect_routers_from_providers(providers: tuple[DishkaProvider, ...]) -> list[APIRouter]:
-    """Collect routers from specific provider instances."""
-    routers: list[APIRouter] = []
+class ProvidedComponents:
+    """
+    Ordered, identity-keyed registry of the routers and middlewares declared by provider classes.
 
-    for provider in providers:
-        provider_class = provider.__class__
-        if hasattr(provider_class, "_provided_routers"):
-            provided_routers: list[APIRouter] = getattr(provider_class, "_provided_routers", [])
-            for router in provided_routers:
-                if not any(router is r for r in routers):
-                    routers.append(router)
+    `ProviderMeta` builds one per class, including the declarations of its base classes (bases
+    first, following the MRO), so collecting the components of a set of providers is a single
+    linear merge. The first declaration of a router or middleware wins; a middleware declared
+    again must use the same filter.
+    """
 
-    return routers
+    def __init__(self) -> None:
+        # Keyed by id(): Starlette routers define __eq__ and are unhashable
+        self._routers: dict[int, APIRouter] = {}
+        # Middleware classes map to their request filter, or None if they run for every request
+        self._middlewares: dict[MiddlewareType, Optional[MiddlewareFilter]] = {}
 
+    @classmethod
+    def of_providers(cls, providers: Iterable[object]) -> "ProvidedComponents":
+        """
+        Merge the components of the given provider instances, in order.
+
+        Args:
+            providers: Provider instances; those without `ProviderMeta` declare nothing
+
+        Returns:
+            The merged registry
+        """
+        components = cls()
+        for provider in providers:
+            provided: Optional[ProvidedComponents] = getattr(provider.__class__, "_provided_components", None)
+            if provided is not None:
+                components.update(provided)
+        return components
+
+    def add_router(self, router: APIRouter) -> None:
+        self._routers.setdefault(id(router), router)
+
+    def add_middleware(self, middleware_class: MiddlewareType, middleware_filter: Optional[MiddlewareFilter]) -> None:
+        registered = self._middlewares.setdefault(middleware_class, middleware_filter)
+        _check_middleware_filter(middleware_class, registered, middleware_filter)
+
+    def update(self, other: "ProvidedComponents") -> None:
+        """Add the components of another registry that are not registered yet."""
+        for router in other._routers.values():
+            self.add_router(router)
+        for middleware_class, middleware_filter in other._middlewares.items():
+            self.add_middleware(middleware_class, middleware_filter)
+
+    @property
+    def routers(self) -> list[APIRouter]:
+        return list(self._routers.values())
+
+    @property
+    def middlewares(self) -> list[MiddlewareType]:
+        return list(self._middlewares)
+
+    @property
+    def middleware_filters(self) -> dict[MiddlewareType, MiddlewareFilter]:
+        filters: dict[MiddlewareType, MiddlewareFilter] = {}
+        for middleware_class, middleware_filter in self._middlewares.items():
+            if middleware_filter is not None:
+                filters[middleware_class] = middleware_filter
+        return filters
+
+
+def _check_middleware_filter(
+    middleware_class: MiddlewareType, registered: Optional[MiddlewareFilter], declared: Optional[MiddlewareFilter]
+) -> None:
+    """Refuse a middleware declared again with another filter: which one applies would depend on the order."""
+    if registered != declared:
+        raise ValueError(
+            f"Middleware {middleware_class.__qualname__} is registered with conflicting filters: "
+            f"{registered or MiddlewareFilter()} and {declared or MiddlewareFilter()}"
+        )
 
-def _collect_middlewares_from_providers(providers: tuple[DishkaProvider, ...]) -> list[Type[Middleware]]:
-    """Collect middlewares from specific provider instances."""
-    middlewares: list[Type[Middleware]] = []
 
-    for provider in providers:
-        provider_class = provider.__class__
-        if hasattr(provider_class, "_provided_middlewares"):
-            provided_middlewares: list[Type[Middleware]] = getattr(provider_class, "_provided_middlewares", [])
-            for middleware_class in provided_middlewares:
-                if not any(middleware_class is m for m in middlewares):
-                    middlewares.append(middleware_class)
+def _collect_routers_from_providers(providers: tuple[DishkaProvider, ...]) -> list[APIRouter]:
+    """Collect routers from specific provider instances."""
+    return ProvidedComponents.of_providers(providers).routers
+
 
-    return middlewares
+def _collect_middlewares_from_providers(providers: tuple[DishkaProvider, ...]) -> list[MiddlewareType]:
+    """Collect middlewares from specific provider instances."""
+    return ProvidedComponents.of_providers(providers).middlewares
 
 
 def wrap_router(router: APIRouter) -> Callable[[], APIRouter]:
@@ -81,8 +164,6 @@ def provide_router(router: APIRouter) -> CompositeDependencySource:
     Raises:
         RuntimeError: If called outside a Provider class definition
     """
-    global _inside_provider_class
-
     if not _inside_provider_class:
         raise RuntimeError(
             "provide_router() can only be called within a Provider class definition. "
@@ -96,10 +177,10 @@ def provide_router(router: APIRouter) -> CompositeDependencySource:
 
 # Type alias for middleware wrapper protocol
 class MiddlewareWrapper(Protocol):
-    def __call__(self, middleware_class: Type[Middleware]) -> Type[Middleware]: ...
+    def __call__(self, middleware_class: MiddlewareType) -> MiddlewareType: ...
 
 
-def wrap_middleware(middleware_class: Type[Middleware]) -> Callable[[], Type[Middleware]]:
+def wrap_middleware(middleware_class: MiddlewareType) -> Callable[[], MiddlewareType]:
     """
     Wrapper function for middleware classes to ensure compatibility.
 
@@ -111,27 +192,42 @@ def wrap_middleware(middleware_class: Type[Middleware]) -> Callable[[], Type[Mid
     """
 
     @staticmethod  # type: ignore[misc]
-    def factory() -> Type[Middleware]:
+    def factory() -> MiddlewareType:
         return middleware_class
 
     return factory
 
 
-def provide_middleware(middleware_class: Type[Middleware]) -> CompositeDependencySource:
+def provide_middleware(
+    middleware_class: MiddlewareType,
+    *,
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+    methods: Iterable[str] = (),
+    tags: Iterable[str] = (),
+) -> CompositeDependencySource:
     """
     Register a middleware class with dependency injection support and return a provider source.
 
+    Both `Middleware` (dispatch based) and `AsgiMiddleware` (pure ASGI) subclasses are accepted.
+    By default the middleware runs for every request; the filters below restrict it, and other
+    requests skip it at the ASGI level (see `MiddlewareFilter`).
+
     Args:
         middleware_class: Middleware class to register
+        include: Only run for paths under these prefixes (e.g. "/api")
+        exclude: Never run for paths under these prefixes (e.g. "/healthz", "/static")
+        methods: Only run for these HTTP methods
+        tags: Only run for requests to routes with one of these tags
 
     Returns:
         CompositeDependencySource for dependency injection
 
     Raises:
         RuntimeError: If called outside a Provider class definition
+        ValueError: If a path prefix doesn't start with "/", or if the middleware class was already
+            registered in this class with other filters
     """
-    global _inside_provider_class
-
     if not _inside_provider_class:
         raise RuntimeError(
             "provide_middleware() can only be called within a Provider class definition. "
@@ -139,10 +235,205 @@ def provide_middleware(middleware_class: Type[Middleware]) -> CompositeDependenc
             "Make sure your Provider class uses ProviderMeta as metaclass."
         )
 
+    middleware_filter = MiddlewareFilter(
+        include=tuple(include),
+        exclude=tuple(exclude),
+        methods=frozenset(method.upper() for method in methods),
+        tags=frozenset(tags),
+    )
+    declared = None if middleware_filter == MiddlewareFilter() else middleware_filter
+    if middleware_class in _current_class_middlewares:
+        _check_middleware_filter(middleware_class, _current_class_middleware_filters.get(middleware_class), declared)
     _current_class_middlewares.append(middleware_class)
+    if declared is not None:
+        _current_class_middleware_filters[middleware_class] = declared
     return provide(source=wrap_middleware(middleware_class), scope=Scope.APP, provides=Type[Middleware])
 
 
+def _compose(*sources: CompositeDependencySource) -> CompositeDependencySource:
+    """Declare several factories with one class attribute, the way dishka's provide_all() does."""
+    composite = CompositeDependencySource(None)
+    for source in sources:
+        composite.dependency_sources.extend(source.dependency_sources)
+    return composite
+
+
+def wrap_cached(factory: "CachedFactory", cache_type: object) -> "CachedFactory":
+    """
+    Wrap a factory so that its results are served from a cache, keyed by its resolved arguments.
+
+    The wrapper is always async and takes the factory's signature and (resolved) type hints, so
+    dishka injects the same dependencies into it, plus the cache itself as a keyword-only
+    dependency of type `cache_type`.
+
+    Args:
+        factory: The sync or async factory to cache
+        cache_type: Dependency type of the `TTLCache` to serve results from
+
+    Returns:
+        The async factory to register with dishka
+
+    Raises:
+        TypeError: If the factory takes **kwargs
+    """
+    signature = inspect.signature(factory)
+    parameters = list(signature.parameters.values())
+    if any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters):
+        raise TypeError(f"provide_cached() can't inject the cache into {factory!r}, which takes **kwargs")
+    hints = get_type_hints(factory, include_extras=True)  # type: ignore[misc]
+    name: str = getattr(factory, "__name__", "cached_factory")
+    is_async = inspect.iscoroutinefunction(factory)
+
+    async def factory_wrapper(*args: object, **kwargs: object) -> object:
+        cache = cast(TTLCache[object], kwargs.pop(_CACHE_PARAMETER))
+
+        async def load() -> object:
+            value = factory(*args, **kwargs)
+            return await cast(Awaitable[object], value) if is_async else value
+
+        arguments: dict[str, object] = signature.bind(*args, **kwargs).arguments
+        return await cache.get(tuple(arguments.items()), load)
+
+    keyword_only = inspect.Parameter.KEYWORD_ONLY  # type: ignore[misc]
+    cache_parameter = inspect.Parameter(_CACHE_PARAMETER, keyword_only, annotation=cache_type)
+    # Not functools.wraps: dishka unwraps __wrapped__ and would treat a sync factory's wrapper as sync
+    wrapper_signature = signature.replace(parameters=[*parameters, cache_parameter])
+    factory_wrapper.__signature__ = wrapper_signature  # type: ignore[attr-defined]
+    factory_wrapper.__annotations__ = {**hints, _CACHE_PARAMETER: cache_type}  # type: ignore[misc]
+    factory_wrapper.__name__ = factory_wrapper.__qualname__ = name
+    return factory_wrapper
+
+
+def provide_cached(
+    factory: "CachedFactory",
+    *,
+    ttl: float,
+    max_size: int = 128,
+    scope: Scope = Scope.REQUEST,
+    provides: Optional[object] = None,
+) -> CompositeDependencySource:
+    """
+    Register a factory whose results are cached across requests (and containers) for `ttl` seconds.
+
+    Meant for slowly changing values such as feature flags, tenant configuration or JWKS keys:
+    the factory keeps a short scope but only runs when the cached value expires. The cache itself
+    is APP-scoped (`TTLCache[<provided type>]`), so it lives and dies with the app container.
+
+    Results are cached per combination of the factory's arguments, up to `max_size` combinations,
+    least recently used first out; arguments must be hashable and compare equal across requests
+    for the cache to hit (APP-scoped dependencies, or e.g. frozen dataclasses). Concurrent requests
+    share a single load. Once a value expired, the next request reloads it with its own
+    dependencies while concurrent requests keep getting the stale value.
+
+    Args:
+        factory: Sync or async function returning the value; its parameters are injected
+        ttl: Seconds a value is served before it gets refreshed
+        max_size: Maximum number of cached argument combinations
+        scope: Scope of the provided dependency
+        provides: Dependency type to provide, defaults to the factory's return annotation
+
+    Returns:
+        CompositeDependencySource for dependency injection
+
+    Raises:
+        TypeError: If the factory is a generator (cached values can't be finalized), takes **kwargs,
+            or has no return annotation and no `provides`
+        ValueError: If ttl is negative or max_size is not positive
+    """
+    if inspect.isgeneratorfunction(factory) or inspect.isasyncgenfunction(factory):
+        raise TypeError(f"provide_cached() can't cache generator factories, got {factory!r}")  # type: ignore[misc]
+
+    # Fail at declaration time rather than at startup
+    TTLCache[object](ttl=ttl, max_size=max_size)
+    hints: dict[str, object] = get_type_hints(factory)
+    provided = provides if provides is not None else hints.get("return")
+    if provided is None:
+        raise TypeError(f"provide_cached() needs a return annotation or `provides` for {factory!r}")
+    cache_type: object = TTLCache[provided]  # type: ignore[valid-type]
+
+    def cache_factory() -> Iterator[TTLCache[object]]:
+        cache = TTLCache[object](ttl=ttl, max_size=max_size)
+        yield cache
+        cache.invalidate()
+
+    cache_source = provide(source=staticmethod(cache_factory), scope=Scope.APP, provides=cache_type)
+    cached_source = provide(source=staticmethod(wrap_cached(factory, cache_type)), scope=scope, provides=provided)
+
+    return _compose(cache_source, cached_source)
+
+
+def provide_pool(
+    resource_type: type[T],
+    create: Callable[[], Awaitable[T]],
+    *,
+    close: Optional[Callable[[T], Awaitable[None]]] = None,
+    health_check: Optional[Callable[[T], Awaitable[bool]]] = None,
+    min_size: int = 0,
+    max_size: int = 10,
+    acquire_timeout: Optional[float] = 10.0,
+    idle_timeout: Optional[float] = 300.0,
+) -> CompositeDependencySource:
+    """
+    Register a pool of resources: the pool itself in APP scope and a leased resource in REQUEST scope.
+
+    The pool (`ResourcePool[resource_type]`) is opened with the app container and closed with it.
+    Requests asking for `resource_type` lease one resource from it, which goes back to the pool
+    when the REQUEST container closes. Resolve `ResourcePool[resource_type]` to read its `stats`.
+
+    Example:
+        ```python
+        class DatabaseProvider(Provider):
+            connections = provide_pool(Connection, open_connection, close=Connection.close, max_size=20)
+        ```
+
+    Args:
+        resource_type: The type requests depend on
+        create: Opens a new resource
+        close: Closes a resource, if it needs closing
+        health_check: Returns whether an idle resource can still be used
+        min_size: Resources opened at startup and kept open when idle
+        max_size: Maximum number of open resources
+        acquire_timeout: Seconds a request waits for a resource, or None to wait indefinitely
+        idle_timeout: Seconds after which idle resources beyond `min_size` are closed, or None
+
+    Returns:
+        CompositeDependencySource for dependency injection
+
+    Raises:
+        ValueError: If the sizes are inconsistent
+    """
+    ResourcePool(create, min_size=min_size, max_size=max_size)
+    pool_type: object = ResourcePool[resource_type]  # type: ignore[valid-type]
+
+    async def pool_factory() -> AsyncIterator[ResourcePool[T]]:
+        pool = ResourcePool(
+            create,
+            close=close,
+            health_check=health_check,
+            min_size=min_size,
+            max_size=max_size,
+            acquire_timeout=acquire_timeout,
+            idle_timeout=idle_timeout,
+        )
+        await pool.start()
+        try:
+            yield pool
+        finally:
+            await pool.close()
+
+    async def lease_factory(pool: ResourcePool[T]) -> AsyncIterator[T]:
+        async with pool.lease() as resource:
+            yield resource
+
+    # The concrete pool type is only known now: annotate it for dishka
+    lease_factory.__annotations__ = {**lease_factory.__annotations__, "pool": pool_type}
+
+    pool_source = provide(source=staticmethod(pool_factory), scope=Scope.APP, provides=pool_type)
+    lease_source = provide(source=staticmethod(lease_factory), scope=Scope.REQUEST, provides=resource_type)
+
+    return _compose(pool_source, lease_source)
+
+
 class ProviderMeta(type):
     """Metaclass that collects routers and middlewares during Provider class creation."""
 
@@ -157,7 +448,7 @@ class ProviderMeta(type):
         return {}
 
     def __new__(cls, name: str, bases: tuple[type, ...], namespace: dict[str, object]) -> type:
-        global _current_class_routers, _current_class_middlewares, _inside_provider_class
+        global _inside_provider_class
 
         # Let the class be created normally first
         new_class = super().__new__(cls, name, bases, namespace)
@@ -165,10 +456,13 @@ class ProviderMeta(type):
         # Move accumulated routers and middlewares to this class
         new_class._provided_routers = _current_class_routers.copy()  # type: ignore[attr-defined]
         new_class._provided_middlewares = _current_class_middlewares.copy()  # type: ignore[attr-defined]
+        new_class._provided_middleware_filters = _current_class_middleware_filters.copy()  # type: ignore[attr-defined]
+        new_class._provided_components = _build_components(new_class)  # type: ignore[attr-defined]
 
         # Clear temporary storage for next class
         _current_class_routers.clear()
         _current_class_middlewares.clear()
+        _current_class_middleware_filters.clear()
 
         # Mark that we're no longer inside a Provider class definition
         _inside_provider_class = False
@@ -176,6 +470,25 @@ class ProviderMeta(type):
         return new_class
 
 
+def _build_components(provider_class: type) -> ProvidedComponents:
+    """Build the registry of a provider class from its own and its bases' declarations."""
+    components = ProvidedComponents()
+
+    for klass in reversed(provider_class.__mro__):
+        # Only the declarations made in each class body, so diamonds are visited once
+        declared: Mapping[str, object] = vars(klass)
+        routers = cast(list[APIRouter], declared.get("_provided_routers", []))
+        middlewares = cast(list[MiddlewareType], declared.get("_provided_middlewares", []))
+        filters = cast(dict[MiddlewareType, MiddlewareFilter], declared.get("_provided_middleware_filters", {}))
+
+        for router in routers:
+            components.add_router(router)
+        for middleware_class in middlewares:
+            components.add_middleware(middleware_class, filters.get(middleware_class))
+
+    return components
+
+
 class Provider(DishkaProvider, metaclass=ProviderMeta):
     """
     FastAPI-Dishka Provider with automatic router and middleware registration.
@@ -234,11 +547,11 @@ class MiddlewareCollectorProvider(DishkaProvider):
     scope = Scope.APP
     component = "middlewares"
 
-    def __init__(self, middlewares: list[Type[Middleware]]) -> None:
+    def __init__(self, middlewares: list[MiddlewareType]) -> None:
         super().__init__()
         self._middlewares = middlewares
 
-    def provide_middlewares(self) -> list[Type[Middleware]]:
+    def provide_middlewares(self) -> list[MiddlewareType]:
         """Provide the list of collected middleware classes."""
         return self._middlewares
 
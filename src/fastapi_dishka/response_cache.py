@@ -0,0 +1,276 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable, Iterable, Optional, Protocol, TypeVar
+from urllib.parse import parse_qsl
+
+from starlette.routing import BaseRoute, Match, Router
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fastapi_dishka.middleware import AppDependency, AsgiMiddleware
+from fastapi_dishka.routing import RouteIndex, get_route_path
+
+EndpointT = TypeVar("EndpointT")
+
+# Endpoint attribute holding the policy set by cache_response()
+POLICY_ATTRIBUTE = "__fastapi_dishka_response_cache__"
+
+
+@dataclass(frozen=True)
+class ResponseCachePolicy:
+    """
+    How the responses of a route are cached by `ResponseCacheMiddleware`.
+
+    Attributes:
+        ttl: Seconds a response is served from the cache
+        vary_headers: Request headers (lowercase) that are part of the cache key
+        vary_query: Query parameters that are part of the cache key; None means the whole query string
+        vary_path_params: Path parameters that are part of the cache key; None means all of them
+    """
+
+    ttl: float
+    vary_headers: tuple[str, ...] = ()
+    vary_query: Optional[tuple[str, ...]] = None
+    vary_path_params: Optional[tuple[str, ...]] = None
+
+
+def cache_response(
+    ttl: float,
+    *,
+    vary_headers: Iterable[str] = (),
+    vary_query: Optional[Iterable[str]] = None,
+    vary_path_params: Optional[Iterable[str]] = None,
+) -> Callable[[EndpointT], EndpointT]:
+    """
+    Mark a GET endpoint's responses as cacheable by `ResponseCacheMiddleware`.
+
+    Apply it below the route decorator:
+
+        @router.get("/products/{product_id}")
+        @cache_response(ttl=60, vary_headers=["accept-language"])
+        async def get_product(product_id: int, catalog: FromDishka[Catalog]): ...
+
+    Args:
+        ttl: Seconds a response is served from the cache
+        vary_headers: Request headers that are part of the cache key
+        vary_query: Query parameters that are part of the cache key (default: the whole query string)
+        vary_path_params: Path parameters that are part of the cache key (default: all of them)
+
+    Returns:
+        Decorator returning the endpoint unchanged, with the policy attached
+
+    Raises:
+        ValueError: If ttl is not positive
+    """
+    if ttl <= 0:
+        raise ValueError(f"ttl must be > 0, got {ttl}")
+
+    policy = ResponseCachePolicy(
+        ttl=ttl,
+        vary_headers=tuple(header.lower() for header in vary_headers),
+        vary_query=None if vary_query is None else tuple(vary_query),
+        vary_path_params=None if vary_path_params is None else tuple(vary_path_params),
+    )
+
+    def decorator(endpoint: EndpointT) -> EndpointT:
+        setattr(endpoint, POLICY_ATTRIBUTE, policy)
+        return endpoint
+
+    return decorator
+
+
+def get_response_cache_policy(route: BaseRoute) -> Optional[ResponseCachePolicy]:
+    """Return the cache policy of a route's endpoint, if it has one."""
+    endpoint: object = getattr(route, "endpoint", None)
+    # dishka wraps async endpoints; the policy is set on the original function
+    original: object = getattr(endpoint, "__dishka_orig_func__", endpoint)
+    for function in (endpoint, original):
+        policy: object = getattr(function, POLICY_ATTRIBUTE, None)
+        if isinstance(policy, ResponseCachePolicy):
+            return policy
+    return None
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A complete HTTP response as stored in a `ResponseCacheStore`."""
+
+    status: int
+    headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes
+
+
+class ResponseCacheStore(Protocol):
+    """
+    Storage backend of `ResponseCacheMiddleware`, resolved from the APP-scope container.
+
+    Provide another implementation (e.g. one shared through Redis) for this type to replace the
+    default `InMemoryResponseCacheStore`.
+    """
+
+    async def get(self, key: str) -> Optional[CachedResponse]: ...
+
+    async def set(self, key: str, response: CachedResponse, ttl: float) -> None: ...
+
+
+class InMemoryResponseCacheStore:
+    """Process-local LRU response store with per-entry expiry."""
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            max_size: Maximum number of cached responses
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    async def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        self._entries[key] = (monotonic() + ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class ResponseCacheMiddleware(AsgiMiddleware):
+    """
+    Serves GET responses of routes marked with `cache_response()` from a `ResponseCacheStore`.
+
+    Register it with `provide_middleware()`. The route is matched against an index of the cached
+    routes only, and a hit is answered right away: neither the REQUEST container nor the endpoint
+    run. Only complete 200 responses without `Set-Cookie` or `Cache-Control: no-store`/`private`
+    are stored.
+    """
+
+    store = AppDependency(ResponseCacheStore)  # type: ignore[type-abstract]
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The next ASGI application in the stack
+        """
+        super().__init__(app)
+        self._index: Optional[RouteIndex] = None
+        self._indexed_routes = -1
+
+    def _cached_routes(self, scope: Scope) -> RouteIndex:
+        """The index of cached routes, rebuilt if routes were added since it was built."""
+        router: Router = scope["app"].router
+        routes: list[BaseRoute] = router.routes
+        if self._index is None or self._indexed_routes != len(routes):
+            self._index = RouteIndex([route for route in routes if get_response_cache_policy(route) is not None])
+            self._indexed_routes = len(routes)
+        return self._index
+
+    def cache_key(
+        self, scope: Scope, route: BaseRoute, policy: ResponseCachePolicy, path_params: dict[str, str]
+    ) -> str:
+        """
+        Build the cache key of a request to a cached route.
+
+        Args:
+            scope: The ASGI connection scope
+            route: The matched route
+            policy: The route's cache policy
+            path_params: The path parameters of the match
+
+        Returns:
+            The key under which the response is stored
+        """
+        route_path: str = getattr(route, "path", "")
+        params: tuple[tuple[str, Optional[str]], ...]
+        if policy.vary_path_params is None:
+            params = tuple(sorted(path_params.items()))
+        else:
+            params = tuple((name, path_params.get(name)) for name in policy.vary_path_params)
+
+        query_string: bytes = scope.get("query_string", b"")
+        query: object = query_string
+        if policy.vary_query is not None:
+            pairs = parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)
+            query = tuple(sorted(pair for pair in pairs if pair[0] in policy.vary_query))
+
+        headers: tuple[object, ...] = ()
+        if policy.vary_headers:
+            raw_headers: list[tuple[bytes, bytes]] = scope["headers"]
+            values = {name.decode("latin-1"): value for name, value in raw_headers}
+            headers = tuple(values.get(name) for name in policy.vary_headers)
+
+        return repr((route_path, params, query, headers))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope_type: str = scope["type"]
+        method: Optional[str] = scope.get("method")
+        if scope_type != "http" or method != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        for route in self._cached_routes(scope).candidates(get_route_path(scope)):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                policy = get_response_cache_policy(route)
+                assert policy is not None
+                path_params: dict[str, str] = child_scope["path_params"]
+                await self._serve(scope, receive, send, self.cache_key(scope, route, policy, path_params), policy)
+                return
+
+        await self.app(scope, receive, send)
+
+    async def _serve(self, scope: Scope, receive: Receive, send: Send, key: str, policy: ResponseCachePolicy) -> None:
+        cached = await self.store.get(key)
+        if cached is not None:
+            start: Message = {"type": "http.response.start", "status": cached.status, "headers": cached.headers}
+            await send(start)
+            body_message: Message = {"type": "http.response.body", "body": cached.body}
+            await send(body_message)
+            return
+
+        status = 0
+        headers: tuple[tuple[bytes, bytes], ...] = ()
+        body: list[bytes] = []
+        complete = False
+
+        async def record(message: Message) -> None:
+            nonlocal status, headers, complete
+            message_type: str = message["type"]
+            if message_type == "http.response.start":
+                status = message["status"]
+                headers = tuple(message.get("headers", ()))
+            elif message_type == "http.response.body":
+                chunk: bytes = message.get("body", b"")
+                body.append(chunk)
+                more_body: bool = message.get("more_body", False)
+                complete = not more_body
+            await send(message)
+
+        await self.app(scope, receive, record)
+
+        if complete and status == 200 and _is_storable(headers):
+            await self.store.set(key, CachedResponse(status, headers, b"".join(body)), policy.ttl)
+
+
+def _is_storable(headers: Iterable[tuple[bytes, bytes]]) -> bool:
+    for name, value in headers:
+        lowered = name.lower()
+        if lowered == b"set-cookie":
+            return False
+        if lowered == b"cache-control" and (b"no-store" in value.lower() or b"private" in value.lower()):
+            return False
+    return True
@@ -1,22 +1,197 @@
-from typing import Any
+from concurrent.futures import Executor
+from inspect import signature
+from typing import Any, Callable, Iterable, Optional, TypeVar, cast, get_type_hints
+from weakref import WeakKeyDictionary
 
+from dishka import DEFAULT_COMPONENT, Component
+from dishka.integrations.base import default_parse_dependency
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter as FastAPIRouter
 
+from fastapi_dishka.threadpool import SyncThreadPool, ThreadPoolStats
+
+# A dishka dependency as (type hint, component)
+EndpointDependency = tuple[object, Component]
+
+EndpointT = TypeVar("EndpointT")
+
+# Endpoint attribute holding the request headers set by coalesce_requests()
+COALESCE_ATTRIBUTE = "__fastapi_dishka_coalesce__"
+
+# Dependencies of each endpoint, recorded before dishka rewrites its signature
+_endpoint_dependencies: "WeakKeyDictionary[object, tuple[EndpointDependency, ...]]" = WeakKeyDictionary()
+
+
+def get_endpoint_dependencies(endpoint: object) -> tuple[EndpointDependency, ...]:
+    """
+    Get the `FromDishka[...]` dependencies declared by an endpoint.
+
+    dishka rewrites sync endpoints in place when it injects them, so the result is
+    cached per endpoint the first time it is seen.
+
+    Args:
+        endpoint: The endpoint function (original or already injected by dishka)
+
+    Returns:
+        The (type hint, component) pairs declared by the endpoint
+    """
+    cached = _endpoint_dependencies.get(endpoint)
+    if cached is not None:
+        return cached
+
+    # Async endpoints are wrapped by dishka, which keeps a reference to the original function
+    func: object = getattr(endpoint, "__dishka_orig_func__", endpoint)
+    if not callable(func):
+        return ()
+    hints = cast(dict[str, object], get_type_hints(func, include_extras=True))
+
+    dependencies: list[EndpointDependency] = []
+    for name, parameter in signature(func).parameters.items():
+        dependency = default_parse_dependency(parameter, hints.get(name))  # type: ignore[misc]
+        if dependency is not None:  # type: ignore[misc]
+            component = dependency.component or DEFAULT_COMPONENT  # type: ignore[misc]
+            dependencies.append((cast(object, dependency.type_hint), component))  # type: ignore[misc]
+
+    result = tuple(dependencies)
+    try:
+        _endpoint_dependencies[endpoint] = result
+    except TypeError:
+        # Not weak-referenceable (e.g. some builtins); just skip caching
+        pass
+
+    return result
+
+
+def coalesce_requests(*, vary_headers: Iterable[str] = ()) -> Callable[[EndpointT], EndpointT]:
+    """
+    Let identical concurrent GET/HEAD requests to an endpoint share one execution.
+
+    Apply it below the route decorator of an `APIRouter`:
+
+        @router.get("/odds/{event_id}")
+        @coalesce_requests(vary_headers=["accept-language"])
+        async def get_odds(event_id: int, odds: FromDishka[OddsService]): ...
+
+    Requests with the same method, path, query string and `vary_headers` that arrive while a
+    previous one is being handled get its response (see `CoalescingMiddleware`).
+
+    Args:
+        vary_headers: Request headers that must match for requests to share a response
+
+    Returns:
+        Decorator returning the endpoint unchanged, with the coalescing marker attached
+    """
+    headers = tuple(vary_headers)
+
+    def decorator(endpoint: EndpointT) -> EndpointT:
+        setattr(endpoint, COALESCE_ATTRIBUTE, headers)
+        return endpoint
+
+    return decorator
+
+
+def get_coalesced_headers(endpoint: object) -> Optional[tuple[str, ...]]:
+    """Return the `vary_headers` of an endpoint marked with `coalesce_requests()`, or None."""
+    original: object = getattr(endpoint, "__dishka_orig_func__", endpoint)
+    for function in (endpoint, original):
+        headers: object = getattr(function, COALESCE_ATTRIBUTE, None)
+        if isinstance(headers, tuple):
+            return cast(tuple[str, ...], headers)
+    return None
+
+
+class APIRoute(DishkaRoute):
+    """
+    DishkaRoute that records which dishka dependencies its endpoint declares.
+
+    The recorded `dishka_dependencies` let the App decide at startup whether a route
+    needs a REQUEST-scope container at all.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:  # type: ignore[explicit-any]
+        """
+        Initialize the route.
+
+        Args:
+            path: The route path
+            endpoint: The endpoint function
+            **kwargs: Keyword arguments passed to DishkaRoute
+        """
+        original: object = endpoint
+        self.dishka_dependencies = get_endpoint_dependencies(original)
+        super().__init__(path, endpoint, **kwargs)  # type: ignore[misc]
+
+        # Async endpoints are replaced by an injected wrapper; remember its dependencies too
+        injected: object = self.endpoint
+        if injected is not original:
+            try:
+                _endpoint_dependencies[injected] = self.dishka_dependencies
+            except TypeError:
+                pass
+
+        coalesced_headers = get_coalesced_headers(original)
+        if coalesced_headers is not None:
+            from fastapi_dishka.coalescing import CoalescingMiddleware
+
+            self.app = CoalescingMiddleware(self.app, coalesced_headers, self.dishka_dependencies)
+
 
 class APIRouter(FastAPIRouter):
-    def __init__(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[explicit-any]
+    def __init__(  # type: ignore[explicit-any]
+        self,
+        *args: Any,
+        thread_limit: Optional[int] = None,
+        sync_executor: Optional[Executor] = None,
+        sync_executor_capacity: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
         """
-        Initialize APIRouter with DishkaRoute as the default route class.
+        Initialize APIRouter with APIRoute (a DishkaRoute) as the default route class.
+
+        By default sync endpoints run on anyio's global threadpool, shared with every other route.
+        With `thread_limit` or `sync_executor`, the sync endpoints of this router run on a
+        `SyncThreadPool` of their own instead, so slow ones can't starve the other routes.
 
         Args:
             *args: Positional arguments passed to FastAPI's APIRouter
+            thread_limit: Maximum number of sync endpoint calls of this router running at once
+            sync_executor: Executor running the sync endpoints of this router
+            sync_executor_capacity: Number of calls `sync_executor` runs at once (e.g. its max_workers),
+                reported in `thread_pool_stats`
             **kwargs: Keyword arguments passed to FastAPI's APIRouter,
-                     with route_class defaulting to DishkaRoute for dependency injection.
+                     with route_class defaulting to APIRoute for dependency injection.
+
+        Raises:
+            ValueError: If both thread_limit and sync_executor are given, sync_executor_capacity is given
+                without sync_executor, or thread_limit or sync_executor_capacity isn't positive
         """
-        # Set DishkaRoute as the default route class if not specified
+        # Set APIRoute as the default route class if not specified
         route_class_key: str = "route_class"
         if route_class_key not in kwargs:  # type: ignore[misc]
-            kwargs[route_class_key] = DishkaRoute  # type: ignore[misc]
+            kwargs[route_class_key] = APIRoute  # type: ignore[misc]
+
+        self.thread_pool: Optional[SyncThreadPool] = None
+        if thread_limit is not None or sync_executor is not None or sync_executor_capacity is not None:
+            self.thread_pool = SyncThreadPool(thread_limit, sync_executor, sync_executor_capacity)
 
         super().__init__(*args, **kwargs)  # type: ignore[misc]
+
+    @property
+    def thread_pool_stats(self) -> Optional[ThreadPoolStats]:
+        """Saturation of the router's own threadpool, or None if it uses the global one."""
+        return self.thread_pool.stats if self.thread_pool is not None else None
+
+    def add_api_route(  # type: ignore[explicit-any]
+        self, path: str, endpoint: Callable[..., Any], **kwargs: Any
+    ) -> None:
+        """
+        Add a route, running a sync endpoint on the router's threadpool if it has one.
+
+        Args:
+            path: The route path
+            endpoint: The endpoint function
+            **kwargs: Keyword arguments passed to FastAPI's add_api_route
+        """
+        if self.thread_pool is not None:
+            endpoint = self.thread_pool.wrap(endpoint)  # type: ignore[misc]
+        super().add_api_route(path, endpoint, **kwargs)  # type: ignore[misc]
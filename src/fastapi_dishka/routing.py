@@ -0,0 +1,193 @@
+from typing import Optional, Sequence
+
+from starlette.datastructures import URL
+from starlette.responses import RedirectResponse
+from starlette.routing import PARAM_REGEX, BaseRoute, Match, Route, Router, WebSocketRoute
+from starlette.types import Receive, Scope, Send
+
+
+def get_route_path(scope: Scope) -> str:
+    """
+    Return the path of a request relative to its root path, the one routes are matched against.
+
+    Same as Starlette's private `get_route_path()`: `scope["path"]` includes the root path of an
+    app mounted behind a prefix, which is stripped when the path starts with it.
+    """
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    if not root_path or not path.startswith(root_path):
+        return path
+    if path == root_path:
+        return ""
+    if path[len(root_path)] == "/":
+        return path[len(root_path) :]
+    return path
+
+
+class _TrieNode:
+    """One literal path segment of the parameterized-route trie."""
+
+    __slots__ = ("children", "positions")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.positions: list[int] = []
+
+
+class RouteIndex:
+    """
+    Finds the routes that can match a path without trying every route regex.
+
+    Routes without path parameters are indexed by their exact path in a dict. Parameterized routes
+    are stored in a trie keyed by the literal segments in front of their first parameter, so only
+    routes sharing the request's leading segments are tried. Other routes (`Mount`, `Host`, custom
+    `BaseRoute`s) can't be indexed and are always tried.
+
+    Candidates are returned in registration order, so running Starlette's usual matching over them
+    picks the same route as scanning the full list would.
+    """
+
+    def __init__(self, routes: Sequence[BaseRoute]) -> None:
+        """
+        Build the index.
+
+        Args:
+            routes: The routes of a router, in registration order
+        """
+        self.routes = list(routes)
+        self._static: dict[str, list[int]] = {}
+        self._trie = _TrieNode()
+        self._unindexed: list[int] = []
+
+        for position, route in enumerate(self.routes):
+            if not isinstance(route, (Route, WebSocketRoute)):  # type: ignore[misc]
+                self._unindexed.append(position)
+                continue
+
+            path: str = route.path
+            parameter = PARAM_REGEX.search(path)
+            if parameter is None:
+                self._static.setdefault(path, []).append(position)
+                continue
+
+            # Only whole segments: "/files/img-{id}" is filed under "files"
+            node = self._trie
+            for segment in path[: parameter.start()].split("/")[1:-1]:
+                node = node.children.setdefault(segment, _TrieNode())
+            node.positions.append(position)
+
+    def candidates(self, path: str) -> list[BaseRoute]:
+        """
+        Return the routes that may match the given route path, in registration order.
+
+        Args:
+            path: The path relative to the root path (see `get_route_path()`)
+
+        Returns:
+            Every route whose path could match; routes left out can't match it
+        """
+        positions = [*self._static.get(path, []), *self._unindexed]
+        if path.endswith("\n"):
+            # A regex "$" also matches in front of a trailing newline
+            positions.extend(self._static.get(path[:-1], []))
+
+        node: Optional[_TrieNode] = self._trie
+        segments = iter(path.split("/")[1:])
+        while node is not None:
+            positions.extend(node.positions)
+            node = node.children.get(next(segments, ""))
+
+        positions.sort()
+        return [self.routes[position] for position in positions]
+
+
+class FrozenRouter:
+    """
+    Dispatches requests for a Starlette router using a `RouteIndex`.
+
+    It replaces `Router.app` and keeps its semantics: the first full match wins, otherwise the
+    first partial match (e.g. 405 Method Not Allowed), then the trailing-slash redirect, then the
+    router's default (404). Routes added to the router later are indexed on the next request.
+    """
+
+    def __init__(self, router: Router) -> None:
+        """
+        Initialize the frozen router.
+
+        Args:
+            router: The router whose routes should be indexed
+        """
+        self.router = router
+        self._index = RouteIndex(self.routes)
+
+    @property
+    def routes(self) -> list[BaseRoute]:
+        """The routes of the frozen router."""
+        routes: list[BaseRoute] = self.router.routes
+        return routes
+
+    @property
+    def index(self) -> RouteIndex:
+        """The route index, rebuilt if routes were added since it was built."""
+        if len(self._index.routes) != len(self.routes):
+            self._index = RouteIndex(self.routes)
+        return self._index
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope_type: str = scope["type"]
+        if scope_type == "lifespan":
+            await self.router.app(scope, receive, send)
+            return
+
+        if "router" not in scope:
+            scope["router"] = self.router
+
+        index = self.index
+        route_path = get_route_path(scope)
+        partial: Optional[BaseRoute] = None
+        partial_scope: Scope = {}
+
+        for route in index.candidates(route_path):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                scope.update(child_scope)
+                await route.handle(scope, receive, send)
+                return
+            elif match == Match.PARTIAL and partial is None:
+                partial = route
+                partial_scope = child_scope
+
+        if partial is not None:
+            scope.update(partial_scope)
+            await partial.handle(scope, receive, send)
+            return
+
+        redirect_slashes: bool = self.router.redirect_slashes
+        if scope_type == "http" and redirect_slashes and route_path != "/":
+            path: str = scope["path"]
+            redirect_scope: Scope = dict(scope)
+            redirect_scope["path"] = path.rstrip("/") if route_path.endswith("/") else path + "/"
+
+            for route in index.candidates(get_route_path(redirect_scope)):
+                match, _ = route.matches(redirect_scope)
+                if match != Match.NONE:
+                    response = RedirectResponse(url=str(URL(scope=redirect_scope)))
+                    await response(scope, receive, send)
+                    return
+
+        await self.router.default(scope, receive, send)
+
+
+def freeze_routes(router: Router) -> FrozenRouter:
+    """
+    Make a router match requests through a `RouteIndex` instead of scanning all its routes.
+
+    Args:
+        router: The router to freeze, typically `FastAPI.router` once all routers were included
+
+    Returns:
+        The installed `FrozenRouter`
+    """
+    frozen = FrozenRouter(router)
+    router.middleware_stack = frozen
+    return frozen
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Literal, Optional, TypedDict, cast
+
+LoopType = Literal["auto", "asyncio", "uvloop"]
+HTTPType = Literal["auto", "h11", "httptools"]
+
+# Optional packages needed by explicitly selected implementations
+_REQUIRED_PACKAGES = {"uvloop": "uvloop", "httptools": "httptools"}
+
+
+class UvicornOptions(TypedDict, total=False):
+    """Keyword arguments passed on to `uvicorn.Config` / `uvicorn.run`."""
+
+    loop: LoopType
+    http: HTTPType
+    uds: str
+    fd: int
+    backlog: int
+    limit_concurrency: int
+    limit_max_requests: int
+    timeout_keep_alive: int
+    timeout_graceful_shutdown: int
+    h11_max_incomplete_event_size: int
+    access_log: bool
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """
+    Typed uvicorn tuning options used by `App.start`, `App.start_sync` and the non-blocking mode.
+
+    Every option left as None keeps uvicorn's own default. Values are range-checked on creation;
+    `check_available()` (called by `App` at construction) verifies that explicitly selected
+    implementations such as uvloop or httptools are installed.
+
+    Use the `high_throughput()` and `low_latency()` presets as a starting point:
+
+    Example:
+        ```python
+        app = App("My API", "1.0.0", MyProvider(), server_config=ServerConfig.high_throughput())
+        ```
+    """
+
+    loop: Optional[LoopType] = None
+    http: Optional[HTTPType] = None
+    uds: Optional[str] = None
+    fd: Optional[int] = None
+    backlog: Optional[int] = None
+    limit_concurrency: Optional[int] = None
+    limit_max_requests: Optional[int] = None
+    timeout_keep_alive: Optional[int] = None
+    timeout_graceful_shutdown: Optional[int] = None
+    h11_max_incomplete_event_size: Optional[int] = None
+    access_log: Optional[bool] = None
+
+    def __post_init__(self) -> None:
+        if self.loop is not None and self.loop not in ("auto", "asyncio", "uvloop"):
+            raise ValueError(f"Unknown event loop {self.loop!r}")
+        if self.http is not None and self.http not in ("auto", "h11", "httptools"):
+            raise ValueError(f"Unknown HTTP implementation {self.http!r}")
+        if self.uds is not None and self.fd is not None:
+            raise ValueError("uds and fd are mutually exclusive")
+        if self.fd is not None and self.fd < 0:
+            raise ValueError(f"fd must be a valid file descriptor, got {self.fd}")
+
+        positive = ("backlog", "limit_concurrency", "limit_max_requests", "h11_max_incomplete_event_size")
+        for name in positive:
+            value: Optional[int] = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be positive, got {value}")
+
+        for name in ("timeout_keep_alive", "timeout_graceful_shutdown"):
+            timeout: Optional[int] = getattr(self, name)
+            if timeout is not None and timeout < 0:
+                raise ValueError(f"{name} must not be negative, got {timeout}")
+
+    @classmethod
+    def high_throughput(cls) -> "ServerConfig":
+        """
+        Preset for maximum requests per second behind a load balancer.
+
+        Prefers uvloop and httptools when installed (`pip install uvicorn[standard]`), uses a deep
+        accept backlog, keeps connections alive for longer than typical load balancer idle
+        timeouts and disables the access log.
+        """
+        return cls(
+            loop="auto",
+            http="auto",
+            backlog=4096,
+            timeout_keep_alive=75,
+            access_log=False,
+        )
+
+    @classmethod
+    def low_latency(cls) -> "ServerConfig":
+        """
+        Preset for predictable tail latency.
+
+        Prefers uvloop and httptools when installed, bounds concurrency so overload is answered
+        with fast 503s instead of queueing, and releases idle connections quickly.
+        """
+        return cls(
+            loop="auto",
+            http="auto",
+            backlog=1024,
+            limit_concurrency=1000,
+            timeout_keep_alive=5,
+            timeout_graceful_shutdown=10,
+            access_log=False,
+        )
+
+    def check_available(self) -> None:
+        """
+        Verify that explicitly selected implementations are installed.
+
+        Raises:
+            ValueError: If a selected implementation cannot be imported
+        """
+        for selected in (self.loop, self.http):
+            package = _REQUIRED_PACKAGES.get(selected or "")
+            if package is not None and find_spec(package) is None:
+                raise ValueError(f"{selected} was selected but the {package!r} package is not installed")
+
+    def to_uvicorn_kwargs(self) -> UvicornOptions:
+        """
+        Build the keyword arguments for uvicorn, leaving out options that use uvicorn's default.
+
+        Returns:
+            The options that were set
+        """
+        options = UvicornOptions()
+        for name, value in cast(dict[str, object], vars(self)).items():
+            if value is not None:
+                options[name] = value  # type: ignore[literal-required]
+        return options
@@ -0,0 +1,171 @@
+"""
+Dedicated threadpools for the sync endpoints of an `APIRouter`.
+
+FastAPI runs sync endpoints on anyio's global threadpool (40 threads by default), shared by every
+route of the process: a slow sync endpoint can take all of its threads and starve unrelated routes.
+`SyncThreadPool` runs the sync endpoints of one router with their own capacity limit or their own
+executor, and counts what they are doing for monitoring.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial, wraps
+from typing import Callable, Optional, TypeVar
+
+from anyio import CapacityLimiter, to_thread
+
+T = TypeVar("T")
+
+# Endpoints of any signature
+Endpoint = Callable[..., object]  # type: ignore[explicit-any]
+
+
+@dataclass(frozen=True)
+class ThreadPoolStats:
+    """
+    Point-in-time statistics of a `SyncThreadPool`.
+
+    Attributes:
+        capacity: Maximum number of calls running at once, or None if unknown (executors given
+            without their capacity)
+        running: Calls running in a thread
+        waiting: Calls waiting for a thread
+        completed: Calls finished since the pool was created
+    """
+
+    capacity: Optional[int]
+    running: int
+    waiting: int
+    completed: int
+
+    @property
+    def saturation(self) -> Optional[float]:
+        """Fraction of the capacity in use (1.0 when full), or None if the capacity is unknown."""
+        if self.capacity is None:
+            return None
+        return self.running / self.capacity
+
+
+@dataclass
+class _Call:
+    """Progress of one call, updated under the pool's lock from both the loop and the thread."""
+
+    started: bool = False
+    abandoned: bool = False
+
+
+class SyncThreadPool:
+    """
+    Runs sync callables in threads, isolated from anyio's global threadpool.
+
+    - With `limit`, calls run on anyio worker threads but at most `limit` of them at once,
+      through a `CapacityLimiter` of their own.
+    - With `executor`, calls run on that executor (e.g. a `ThreadPoolExecutor` reserved for
+      report endpoints), whose `capacity` (its number of workers) can be given for the statistics.
+    """
+
+    def __init__(
+        self, limit: Optional[int] = None, executor: Optional[Executor] = None, capacity: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            limit: Maximum number of calls running at once
+            executor: Executor running the calls
+            capacity: Number of calls the executor runs at once, if known
+
+        Raises:
+            ValueError: If neither or both of limit and executor are given, capacity is given
+                without an executor, or limit or capacity isn't positive
+        """
+        if capacity is not None and executor is None:
+            raise ValueError("capacity is only needed with an executor")
+        if (limit is None) == (executor is None):
+            raise ValueError("Expected exactly one of limit and executor")
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be positive, got {limit}")
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        self.executor = executor
+        self.limiter: Optional[CapacityLimiter] = CapacityLimiter(limit) if limit is not None else None
+        self.capacity = limit if limit is not None else capacity
+
+        self._lock = threading.Lock()
+        self._running = 0
+        self._waiting = 0
+        self._completed = 0
+
+    @property
+    def stats(self) -> ThreadPoolStats:
+        """The current pool statistics, for monitoring."""
+        with self._lock:
+            return ThreadPoolStats(
+                capacity=self.capacity, running=self._running, waiting=self._waiting, completed=self._completed
+            )
+
+    async def run(self, function: Callable[[], T]) -> T:
+        """
+        Run a callable in a thread of the pool.
+
+        Args:
+            function: The callable, without arguments (use `functools.partial`)
+
+        Returns:
+            The callable's result
+        """
+        call = _Call()
+
+        def run_counted() -> T:
+            with self._lock:
+                call.started = True
+                if not call.abandoned:
+                    self._waiting -= 1
+                self._running += 1
+            try:
+                return function()
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        with self._lock:
+            self._waiting += 1
+        try:
+            if self.executor is None:
+                return await to_thread.run_sync(run_counted, limiter=self.limiter)
+            context = contextvars.copy_context()
+            return await asyncio.get_running_loop().run_in_executor(self.executor, context.run, run_counted)
+        finally:
+            # Cancelled before a thread picked the call up: it no longer waits
+            with self._lock:
+                if not call.started:
+                    call.abandoned = True
+                    self._waiting -= 1
+
+    def wrap(self, endpoint: Endpoint) -> Endpoint:
+        """
+        Turn a sync endpoint into an async one running it in this pool.
+
+        The wrapper keeps the endpoint's signature (through `__wrapped__`), so FastAPI and dishka
+        see the same parameters; async endpoints are returned unchanged.
+
+        Args:
+            endpoint: The endpoint function
+
+        Returns:
+            The endpoint to register
+        """
+        if inspect.iscoroutinefunction(endpoint):
+            return endpoint  # type: ignore[misc]
+
+        @wraps(endpoint)
+        async def run_endpoint(*args: object, **kwargs: object) -> object:
+            return await self.run(partial(endpoint, *args, **kwargs))
+
+        return run_endpoint
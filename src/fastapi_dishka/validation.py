@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+from typing import Iterator, Sequence
+
+from dishka import DEFAULT_COMPONENT, AsyncContainer, Component, DependencyKey
+from dishka.entities.factory_type import FactoryType
+from dishka.entities.marker import BoolMarker
+from dishka.registry import Registry
+from starlette.routing import BaseRoute
+
+from fastapi_dishka.middleware import MiddlewareType, get_app_dependencies
+from fastapi_dishka.router import APIRoute
+
+
+@dataclass(frozen=True)
+class DeclaredDependency:
+    """A dishka dependency declared by a route or middleware."""
+
+    owner: str
+    type_hint: object
+    component: Component = DEFAULT_COMPONENT
+
+    def __str__(self) -> str:
+        name: str = getattr(self.type_hint, "__qualname__", repr(self.type_hint))
+        if self.component != DEFAULT_COMPONENT:
+            name = f"{name} (component {self.component!r})"
+        return f"{name} required by {self.owner}"
+
+
+class DependencyValidationError(RuntimeError):
+    """Raised at startup when declared dependencies have no provider."""
+
+    def __init__(self, missing: Sequence[DeclaredDependency]) -> None:
+        self.missing = tuple(missing)
+        details = "\n".join(f"  - {dependency}" for dependency in self.missing)
+        super().__init__(f"{len(self.missing)} dependencies cannot be resolved by the container:\n{details}")
+
+
+def _registries(container: AsyncContainer) -> Iterator[Registry]:
+    """Iterate over the registries of every scope, from the root container down."""
+    root = container
+    while root.parent_container is not None:
+        root = root.parent_container
+
+    registry: "Registry | None" = root.registry
+    while registry is not None:
+        yield registry
+        registry = registry.child_registry
+
+
+def collect_route_dependencies(routes: Sequence[BaseRoute]) -> list[DeclaredDependency]:
+    """
+    Collect the `FromDishka[...]` dependencies of the given routes.
+
+    Only routes created by fastapi_dishka's `APIRoute` are inspected; their dependencies
+    are recorded from the endpoint signatures when the routes are created.
+
+    Args:
+        routes: The routes to inspect
+
+    Returns:
+        The declared dependencies
+    """
+    declared: list[DeclaredDependency] = []
+
+    for route in routes:
+        if not isinstance(route, APIRoute):  # type: ignore[misc]
+            continue
+
+        owner = f"route {','.join(sorted(route.methods))} {route.path}"
+        for type_hint, component in route.dishka_dependencies:
+            declared.append(DeclaredDependency(owner, type_hint, component))
+
+    return declared
+
+
+def collect_middleware_dependencies(middlewares: Sequence[MiddlewareType]) -> list[DeclaredDependency]:
+    """
+    Collect the dependencies declared by DI-aware middlewares.
+
+    These are the `AppDependency` attributes and the types listed in `dishka_dependencies`.
+
+    Args:
+        middlewares: The middleware classes to inspect
+
+    Returns:
+        The declared dependencies
+    """
+    declared: list[DeclaredDependency] = []
+
+    for middleware_class in middlewares:
+        owner = f"middleware {middleware_class.__qualname__}"
+        for declaration in get_app_dependencies(middleware_class).values():
+            declared.append(DeclaredDependency(owner, declaration.dependency_type, declaration.component))
+        for dependency_type in middleware_class.dishka_dependencies:
+            declared.append(DeclaredDependency(owner, dependency_type))
+
+    return declared
+
+
+def find_missing_dependencies(
+    container: AsyncContainer, dependencies: Sequence[DeclaredDependency]
+) -> list[DeclaredDependency]:
+    """
+    Check which declared dependencies no scope of the container can provide.
+
+    Args:
+        container: The app container
+        dependencies: The declared dependencies to check
+
+    Returns:
+        The dependencies without a provider
+    """
+    registries = list(_registries(container))
+
+    missing: list[DeclaredDependency] = []
+    for dependency in dependencies:
+        key = DependencyKey(dependency.type_hint, dependency.component)  # type: ignore[misc]
+        if all(registry.get_factory(key) is None for registry in registries):  # type: ignore[misc]
+            missing.append(dependency)
+
+    return missing
+
+
+def validate_dependencies(container: AsyncContainer, dependencies: Sequence[DeclaredDependency]) -> None:
+    """
+    Fail fast if any declared dependency has no provider.
+
+    Args:
+        container: The app container
+        dependencies: The declared dependencies to check
+
+    Raises:
+        DependencyValidationError: If any dependency cannot be resolved
+    """
+    missing = find_missing_dependencies(container, dependencies)
+    if missing:
+        raise DependencyValidationError(missing)
+
+
+async def warmup_container(container: AsyncContainer) -> int:
+    """
+    Prepare the container so the first request does not pay any one-off cost.
+
+    Every factory of every scope gets its resolver compiled, and every APP-scoped
+    dependency is instantiated (and cached by the app container).
+
+    Args:
+        container: The app container
+
+    Returns:
+        The number of APP-scoped dependencies instantiated
+    """
+    instantiated = 0
+
+    for registry in _registries(container):
+        for key, factory in list(registry.factories.items()):  # type: ignore[misc]
+            # Skip aliases registered for generic origins and decorated (inner) factories
+            if key != factory.provides or key.depth:  # type: ignore[misc]
+                continue
+            registry.get_compiled_async(key.as_compilation_key())  # type: ignore[misc]
+
+            # Context values are supplied from outside; conditional factories may be inactive
+            if registry is not container.registry or factory.type is FactoryType.CONTEXT:
+                continue
+            if factory.when_active != BoolMarker(True):
+                continue
+            await container.get(key.type_hint, component=key.component)  # type: ignore[misc]
+            instantiated += 1
+
+    return instantiated
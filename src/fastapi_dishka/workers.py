@@ -0,0 +1,190 @@
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+from typing import Callable, Optional
+
+logger = logging.getLogger("fastapi_dishka.workers")
+
+# Signals that make the supervisor shut its workers down
+HANDLED_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+WorkerTarget = Callable[[socket.socket], None]
+
+
+@dataclass
+class _WorkerSlot:
+    """One of the supervised worker positions: its current process and restart state."""
+
+    process: Optional[BaseProcess]
+    started: float
+    failures: int = 0
+    restart_at: float = 0.0
+
+
+class WorkerSupervisor:
+    """
+    Pre-fork supervisor serving one listening socket from several worker processes.
+
+    The parent binds the socket and forks the workers; it never touches the dishka
+    container, which is not fork-safe. Each worker runs `target(sock)`, which is expected to
+    build its own container and serve until it receives SIGTERM. Workers that die are
+    replaced until shutdown is requested.
+
+    A worker that dies within `min_uptime` seconds of its start is restarted after an
+    exponential backoff (`restart_delay`, doubled on every early death, up to `max_restart_delay`).
+    After `max_early_deaths` early deaths in a row (e.g. a startup that always fails), the
+    supervisor shuts the other workers down and raises.
+
+    Shutdown is requested by SIGINT/SIGTERM (when running in the main thread) or by
+    `shutdown()`. Every worker then receives SIGTERM so uvicorn shuts down gracefully and
+    runs the lifespan shutdown, which closes the worker's container. Workers that do not
+    exit within `graceful_timeout` seconds are killed.
+    """
+
+    def __init__(
+        self,
+        target: WorkerTarget,
+        sock: socket.socket,
+        workers: int,
+        graceful_timeout: float = 30.0,
+        min_uptime: float = 5.0,
+        restart_delay: float = 0.5,
+        max_restart_delay: float = 30.0,
+        max_early_deaths: int = 5,
+    ) -> None:
+        """
+        Initialize the supervisor.
+
+        Args:
+            target: Function run in every worker process with the listening socket
+            sock: The listening socket shared by all workers
+            workers: Number of worker processes
+            graceful_timeout: Seconds to wait for workers to exit before killing them
+            min_uptime: Seconds a worker must live for its death not to count as an early death
+            restart_delay: Delay before restarting a worker after its first early death
+            max_restart_delay: Upper bound of the restart delay
+            max_early_deaths: Early deaths in a row of one worker after which the supervisor gives up
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if max_early_deaths < 1:
+            raise ValueError(f"max_early_deaths must be at least 1, got {max_early_deaths}")
+
+        self.target = target
+        self.sock = sock
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.min_uptime = min_uptime
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.max_early_deaths = max_early_deaths
+        self._slots: list[_WorkerSlot] = []
+        self.should_exit = threading.Event()
+        self._context = multiprocessing.get_context("fork")
+
+    @property
+    def processes(self) -> list[BaseProcess]:
+        """The running worker processes."""
+        return [slot.process for slot in self._slots if slot.process is not None]
+
+    def shutdown(self) -> None:
+        """Request a graceful shutdown of all workers."""
+        self.should_exit.set()
+
+    def _handle_signal(self, sig: int, frame: Optional[FrameType]) -> None:
+        self.shutdown()
+
+    def _run_worker(self) -> None:
+        # Inherited supervisor handlers must not run in the worker; uvicorn installs its own
+        for sig in HANDLED_SIGNALS:
+            signal.signal(sig, signal.SIG_DFL)
+        self.target(self.sock)
+
+    def _spawn(self) -> BaseProcess:
+        process = self._context.Process(target=self._run_worker, name="fastapi-dishka-worker")
+        process.start()
+        logger.info("Started worker process [%s]", process.pid)
+        return process
+
+    def run(self) -> None:
+        """
+        Start the workers and supervise them until shutdown is requested.
+
+        Raises:
+            RuntimeError: If a worker keeps dying right after its start
+        """
+        in_main_thread = threading.current_thread() is threading.main_thread()
+        original_handlers = (
+            {sig: signal.signal(sig, self._handle_signal) for sig in HANDLED_SIGNALS} if in_main_thread else {}
+        )
+
+        try:
+            logger.info("Started supervisor process [%s] with %s workers", os.getpid(), self.workers)
+            self._slots = [_WorkerSlot(self._spawn(), time.monotonic()) for _ in range(self.workers)]
+
+            while not self.should_exit.is_set():
+                sentinels = [process.sentinel for process in self.processes]
+                wait(sentinels, timeout=self._wait_timeout())
+                if self.should_exit.is_set():
+                    break
+                for slot in self._slots:
+                    self._supervise(slot)
+        finally:
+            self._terminate_workers()
+            for sig, handler in original_handlers.items():
+                signal.signal(sig, handler)
+            self.sock.close()
+
+    def _wait_timeout(self) -> float:
+        """Seconds until the next scheduled restart, at most 0.5 so that shutdown is noticed quickly."""
+        pending = [slot.restart_at for slot in self._slots if slot.process is None]
+        if not pending:
+            return 0.5
+        return min(0.5, max(0.0, min(pending) - time.monotonic()))
+
+    def _supervise(self, slot: _WorkerSlot) -> None:
+        """Notice the death of a slot's worker and restart it once its backoff is over."""
+        now = time.monotonic()
+        process = slot.process
+        if process is not None:
+            if process.is_alive():
+                return
+            logger.warning("Worker process [%s] died with code %s", process.pid, process.exitcode)
+            slot.process = None
+            if now - slot.started >= self.min_uptime:
+                slot.failures = 0
+                slot.restart_at = now
+            else:
+                slot.failures += 1
+                if slot.failures >= self.max_early_deaths:
+                    raise RuntimeError(
+                        f"Worker processes keep dying within {self.min_uptime}s of their start "
+                        f"({slot.failures} times in a row); giving up"
+                    )
+                delay = min(self.restart_delay * (1 << (slot.failures - 1)), self.max_restart_delay)
+                logger.warning("Restarting the worker in %.1fs", delay)
+                slot.restart_at = now + delay
+
+        if now >= slot.restart_at:
+            slot.process = self._spawn()
+            slot.started = time.monotonic()
+
+    def _terminate_workers(self) -> None:
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+
+        for process in self.processes:
+            process.join(self.graceful_timeout)
+            if process.is_alive():
+                logger.warning("Worker process [%s] did not exit in time, killing it", process.pid)
+                process.kill()
+                process.join()
@@ -45,8 +45,8 @@ class TestContainerResolution:
 class TestStartSync:
     """Test start_sync method code paths."""
 
-    def test_start_sync_resolves_container_when_not_resolved(self):
-        """Test start_sync calls asyncio.run when container not resolved (lines 129-130)."""
+    def test_start_sync_leaves_container_to_the_serving_loop(self):
+        """Test start_sync registers routes but builds no container on a throwaway loop."""
         app = App("Test App", "0.1.0", ExampleProvider())
 
         # Ensure container is not resolved
@@ -59,8 +59,9 @@ class TestStartSync:
             # Should have called uvicorn.run (line 131+)
             mock_run.assert_called_once_with(app.app, host="localhost", port=9000)
 
-            # Container should now be resolved (hit lines 129-130)
-            assert app._container_resolved is True
+            # Routes are registered; the lifespan builds the container on uvicorn's loop
+            assert app._configured is True
+            assert app._container_resolved is False
 
     def test_start_sync_non_blocking_mode(self):
         """Test start_sync in non-blocking mode (line 131)."""
@@ -151,7 +152,8 @@ class TestNonBlockingServer:
             mock_thread.assert_called_once()
             mock_thread_instance.start.assert_called_once()
             assert app._thread is mock_thread_instance
-            assert app._container_resolved is True
+            assert app._configured is True
+            assert app._container_resolved is False
 
 
 class TestStopMethod:
@@ -245,9 +247,10 @@ class TestLifespanHandler:
         mock_app.state.container = mock_container
 
         # Test the lifespan context manager
-        async with default_lifespan(mock_app):
-            # During lifespan, nothing should happen
-            pass
+        with pytest.warns(DeprecationWarning, match="default_lifespan is deprecated"):
+            async with default_lifespan(mock_app):
+                # During lifespan, nothing should happen
+                pass
 
         # The close method should have been called (we can't easily assert this with async mock)
 
@@ -0,0 +1,157 @@
+"""Tests for APP-scope dependencies pre-resolved into middleware instances."""
+
+import pytest
+from dishka import Provider, Scope, provide
+from fastapi.testclient import TestClient
+
+from fastapi_dishka import APIRouter, App, AppDependency, AsgiMiddleware, Middleware, provide_middleware, provide_router
+from fastapi_dishka.middleware import AppDependencyBinder, get_app_dependencies
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+
+class Settings:
+    """APP-scoped settings resolved once at startup."""
+
+    instances = 0
+
+    def __init__(self):
+        Settings.instances += 1
+        self.banner = "hello"
+
+
+class Clock:
+    """Second APP-scoped dependency used by inherited declarations."""
+
+    def __init__(self):
+        self.now = "noon"
+
+
+bound_router = APIRouter(prefix="/bound")
+
+
+@bound_router.get("/")
+async def bound_endpoint():
+    return {"ok": True}
+
+
+class BannerMiddleware(Middleware):
+    settings = AppDependency(Settings)
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Banner"] = self.settings.banner
+        return response
+
+
+class ClockMiddleware(BannerMiddleware):
+    clock = AppDependency(Clock)
+
+    async def dispatch(self, request, call_next):
+        response = await super().dispatch(request, call_next)
+        response.headers["X-Clock"] = self.clock.now
+        return response
+
+
+class AsgiBannerMiddleware(AsgiMiddleware):
+    settings = AppDependency(Settings)
+
+    async def __call__(self, scope, receive, send):
+        banner = self.settings.banner.encode()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message["headers"], (b"x-asgi-banner", banner)]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def make_app(*middlewares, fuse: bool = False) -> App:
+    class BoundProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        settings = provide(Settings, scope=Scope.APP)
+        clock = provide(Clock, scope=Scope.APP)
+        router = provide_router(bound_router)
+        registered = tuple(provide_middleware(middleware) for middleware in middlewares)
+
+    return App("Bound Test", "1.0.0", BoundProvider(), fuse_middlewares=fuse)
+
+
+class TestAppDependencyDeclaration:
+    """Test the AppDependency descriptor itself."""
+
+    def test_class_access_returns_declaration(self):
+        """Test that accessing the attribute on the class returns the descriptor."""
+        declaration = BannerMiddleware.settings
+
+        assert isinstance(declaration, AppDependency)
+        assert declaration.dependency_type is Settings
+        assert declaration.name == "settings"
+
+    def test_unbound_instance_access_raises(self):
+        """Test that reading an unresolved declaration gives a helpful error."""
+        middleware = BannerMiddleware(None)
+
+        with pytest.raises(AttributeError, match="APP dependency 'settings' of BannerMiddleware is not bound"):
+            _ = middleware.settings
+
+    def test_declarations_are_inherited(self):
+        """Test that declarations of base classes are collected."""
+        assert set(get_app_dependencies(ClockMiddleware)) == {"settings", "clock"}
+        assert get_app_dependencies(Middleware) == {}
+
+    @pytest.mark.asyncio
+    async def test_binder_applies_values_to_late_instances(self):
+        """Test that instances registered after bind() receive their values immediately."""
+
+        class FakeContainer:
+            async def get(self, dependency_type, component=""):
+                return dependency_type()
+
+        binder = AppDependencyBinder()
+        early = binder.factory(BannerMiddleware)(None)
+        await binder.bind(FakeContainer(), [BannerMiddleware])
+        late = binder.factory(BannerMiddleware)(None)
+
+        assert early.settings.banner == "hello"
+        assert late.settings is early.settings
+
+
+class TestAppDependencyBinding:
+    """Test that the App binds declared dependencies onto middleware instances."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fuse", [False, True])
+    async def test_dependencies_are_bound_to_middlewares(self, fuse):
+        """Test that dispatch and ASGI middlewares read pre-resolved dependencies."""
+        app = make_app(ClockMiddleware, AsgiBannerMiddleware, fuse=fuse)
+        await app._resolve_container()
+
+        client = TestClient(app.app)
+        response = client.get("/bound/")
+
+        assert response.status_code == 200
+        assert response.headers["X-Banner"] == "hello"
+        assert response.headers["X-Clock"] == "noon"
+        assert response.headers["x-asgi-banner"] == "hello"
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_dependencies_are_resolved_once(self):
+        """Test that the APP-scoped instance is shared by all requests."""
+        Settings.instances = 0
+        app = make_app(BannerMiddleware)
+        await app._resolve_container()
+
+        client = TestClient(app.app)
+        for _ in range(3):
+            assert client.get("/bound/").headers["X-Banner"] == "hello"
+
+        assert Settings.instances == 1
+
+        await app.close()
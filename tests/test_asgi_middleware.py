@@ -0,0 +1,161 @@
+"""Tests for the pure ASGI AsgiMiddleware base class."""
+
+import pytest
+from dishka import FromDishka, Provider, Scope, provide
+from fastapi.testclient import TestClient
+from starlette.responses import StreamingResponse
+
+from fastapi_dishka import APIRouter, App, AsgiMiddleware, provide_middleware, provide_router
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+
+class Counter:
+    """APP-scoped service shared between the middleware and the endpoint."""
+
+    def __init__(self):
+        self.hits = 0
+
+
+class CountingAsgiMiddleware(AsgiMiddleware):
+    """Middleware that counts requests and adds a header with the current count."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = await self.get_dependency(scope, Counter)
+        counter.hits += 1
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message["headers"], (b"x-hits", str(counter.hits).encode())]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+asgi_router = APIRouter(prefix="/asgi")
+
+
+@asgi_router.get("/")
+async def asgi_endpoint(counter: FromDishka[Counter]):
+    return {"hits": counter.hits}
+
+
+@asgi_router.get("/stream")
+async def asgi_stream():
+    async def chunks():
+        for chunk in (b"a", b"b", b"c"):
+            yield chunk
+
+    return StreamingResponse(chunks())
+
+
+class TestAsgiMiddlewareRegistration:
+    """Test that AsgiMiddleware subclasses are registered like Middleware subclasses."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    async def test_provide_middleware_accepts_asgi_middleware(self):
+        """Test that provide_middleware collects AsgiMiddleware subclasses."""
+
+        class AsgiProvider(Provider, metaclass=ProviderMeta):
+            scope = Scope.APP
+            counter = provide(Counter, scope=Scope.APP)
+            router = provide_router(asgi_router)
+            middleware = provide_middleware(CountingAsgiMiddleware)
+
+        app = App("ASGI Test", "1.0.0", AsgiProvider())
+        await app._resolve_container()
+
+        assert app.middlewares == [CountingAsgiMiddleware]
+
+        client = TestClient(app.app)
+        first = client.get("/asgi/")
+        second = client.get("/asgi/")
+
+        assert first.status_code == 200
+        assert first.headers["x-hits"] == "1"
+        assert first.json() == {"hits": 1}
+        assert second.headers["x-hits"] == "2"
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_streaming_responses_pass_through(self):
+        """Test that streaming responses are forwarded by the pure ASGI middleware."""
+
+        class StreamProvider(Provider, metaclass=ProviderMeta):
+            scope = Scope.APP
+            counter = provide(Counter, scope=Scope.APP)
+            router = provide_router(asgi_router)
+            middleware = provide_middleware(CountingAsgiMiddleware)
+
+        app = App("ASGI Stream Test", "1.0.0", StreamProvider())
+        await app._resolve_container()
+
+        client = TestClient(app.app)
+        response = client.get("/asgi/stream")
+
+        assert response.status_code == 200
+        assert response.content == b"abc"
+        assert response.headers["x-hits"] == "1"
+
+        await app.close()
+
+
+class TestAsgiMiddlewareGetDependency:
+    """Test container lookup in AsgiMiddleware.get_dependency."""
+
+    @pytest.mark.asyncio
+    async def test_get_dependency_prefers_request_container(self):
+        """Test get_dependency uses the request container stored in the ASGI scope state."""
+        resolved = Counter()
+
+        class RequestContainer:
+            async def get(self, dependency_type, component=""):
+                return resolved
+
+        class AppState:
+            pass
+
+        class FakeApp:
+            state = AppState()
+
+        middleware = AsgiMiddleware(FakeApp())
+        scope = {"type": "http", "app": FakeApp(), "state": {"dishka_container": RequestContainer()}}
+
+        assert await middleware.get_dependency(scope, Counter) is resolved
+
+    @pytest.mark.asyncio
+    async def test_get_dependency_raises_error_when_no_container_available(self):
+        """Test get_dependency raises AttributeError when no container found."""
+
+        class AppState:
+            pass
+
+        class FakeApp:
+            state = AppState()
+
+        middleware = AsgiMiddleware(FakeApp())
+        scope = {"type": "http", "app": FakeApp()}
+
+        with pytest.raises(AttributeError, match="No dishka container found"):
+            await middleware.get_dependency(scope, Counter)
+
+    @pytest.mark.asyncio
+    async def test_default_call_passes_through(self):
+        """Test the default __call__ implementation forwards to the wrapped app."""
+        calls = []
+
+        async def inner(scope, receive, send):
+            calls.append(scope["type"])
+
+        middleware = AsgiMiddleware(inner)
+        await middleware({"type": "lifespan"}, None, None)
+
+        assert calls == ["lifespan"]
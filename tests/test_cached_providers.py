@@ -0,0 +1,347 @@
+"""Tests for TTL-cached provider factories."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+from dishka import FromDishka, Provider, Scope, provide
+
+from fastapi_dishka import APIRouter, App, provide_cached, provide_router, start_test, stop_test
+from fastapi_dishka.caching import TTLCache
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+
+@dataclass(frozen=True)
+class Tenant:
+    """REQUEST-scoped dependency of a cached factory, equal across requests."""
+
+    name: str
+
+
+class TenantConfig:
+    """Slowly changing value loaded per tenant."""
+
+    def __init__(self, tenant: str, version: int) -> None:
+        self.tenant = tenant
+        self.version = version
+
+
+class Session:
+    """REQUEST-scoped resource closed when the request ends; all sessions are equivalent cache keys."""
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Session)
+
+    def __hash__(self) -> int:
+        return hash(Session)
+
+
+class Report:
+    """Value loaded through a REQUEST-scoped resource."""
+
+    def __init__(self, session_closed: bool) -> None:
+        self.session_closed = session_closed
+
+
+class FeatureFlags:
+    """Slowly changing value loaded by a sync factory."""
+
+    def __init__(self, version: int) -> None:
+        self.version = version
+
+
+loads: list[str] = []
+
+
+async def load_tenant_config(tenant: Tenant) -> TenantConfig:
+    loads.append(tenant.name)
+    return TenantConfig(tenant.name, len(loads))
+
+
+async def load_report(session: Session) -> Report:
+    loads.append("report")
+    return Report(session.closed)
+
+
+def load_feature_flags() -> FeatureFlags:
+    loads.append("flags")
+    return FeatureFlags(len(loads))
+
+
+cached_router = APIRouter()
+
+
+@cached_router.get("/config")
+async def get_config(config: FromDishka[TenantConfig]):
+    return {"tenant": config.tenant, "version": config.version}
+
+
+@cached_router.get("/report")
+async def get_report(report: FromDishka[Report]):
+    return {"session_closed": report.session_closed}
+
+
+@cached_router.get("/flags")
+async def get_flags(flags: FromDishka[FeatureFlags]):
+    return {"version": flags.version}
+
+
+def make_app(ttl: float = 60) -> App:
+    class CachedProvider(Provider, metaclass=ProviderMeta):
+        routes = provide_router(cached_router)
+        config = provide_cached(load_tenant_config, ttl=ttl, max_size=2)
+        flags = provide_cached(load_feature_flags, ttl=ttl)
+        report = provide_cached(load_report, ttl=ttl)
+
+        @provide(scope=Scope.REQUEST)
+        def tenant(self) -> Tenant:
+            return Tenant("acme")
+
+        @provide(scope=Scope.REQUEST)
+        def session(self) -> Iterator[Session]:
+            session = Session()
+            yield session
+            session.closed = True
+
+    return App("Cached Test", "1.0.0", CachedProvider())
+
+
+class TestTTLCache:
+    """Test the cache behind provide_cached()."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        """Test that concurrent callers of a missing key await a single load."""
+        cache: TTLCache[int] = TTLCache(ttl=60)
+        calls = 0
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(cache.get("key", load) for _ in range(10)))
+
+        assert results == [42] * 10
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_value_is_refreshed_by_one_caller(self):
+        """Test that the first caller finding a value expired refreshes it while the others get the stale one."""
+        cache: TTLCache[int] = TTLCache(ttl=0)
+        refreshed = asyncio.Event()
+        calls = 0
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                await refreshed.wait()
+            return calls
+
+        assert await cache.get("key", load) == 1
+        refreshing = asyncio.create_task(cache.get("key", load))
+        await asyncio.sleep(0)
+        assert await asyncio.gather(*(cache.get("key", load) for _ in range(5))) == [1] * 5
+
+        refreshed.set()
+
+        assert await refreshing == 2
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_cancels_its_refresh(self):
+        """Test that a refresh never outlives the caller running it."""
+        cache: TTLCache[str] = TTLCache(ttl=0)
+        started = asyncio.Event()
+        finished = False
+
+        async def load() -> str:
+            return "stale"
+
+        async def slow() -> str:
+            nonlocal finished
+            started.set()
+            await asyncio.sleep(5)
+            finished = True
+            return "fresh"
+
+        await cache.get("key", load)
+        refreshing = asyncio.create_task(cache.get("key", slow))
+        await started.wait()
+        refreshing.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await refreshing
+        assert not finished
+        assert await cache.get("key", load) == "stale"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_cancels_its_load(self):
+        """Test that a first load runs in its caller's task and a waiter loads again when it is cancelled."""
+        cache: TTLCache[str] = TTLCache(ttl=60)
+        started = asyncio.Event()
+        loaders = []
+        finished = False
+
+        async def slow() -> str:
+            nonlocal finished
+            loaders.append(asyncio.current_task())
+            started.set()
+            await asyncio.sleep(5)
+            finished = True
+            return "abandoned"
+
+        async def load() -> str:
+            loaders.append(asyncio.current_task())
+            return "value"
+
+        first = asyncio.create_task(cache.get("key", slow))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get("key", load))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await waiter == "value"
+        assert not finished
+        assert loaders == [first, waiter]
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self, caplog):
+        """Test that a failing refresh is logged and the stale value kept."""
+        cache: TTLCache[str] = TTLCache(ttl=0)
+
+        async def load() -> str:
+            return "stale"
+
+        async def fail() -> str:
+            raise RuntimeError("backend down")
+
+        await cache.get("key", load)
+        assert await cache.get("key", fail) == "stale"
+        await asyncio.sleep(0)
+
+        assert await cache.get("key", load) == "stale"
+        assert "Refreshing cached value 'key' failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_raised_and_not_cached(self):
+        """Test that a failing first load raises to every waiter and is retried next time."""
+        cache: TTLCache[str] = TTLCache(ttl=60)
+
+        async def fail() -> str:
+            raise RuntimeError("backend down")
+
+        async def load() -> str:
+            return "value"
+
+        with pytest.raises(RuntimeError):
+            await cache.get("key", fail)
+
+        assert await cache.get("key", load) == "value"
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_key_is_evicted(self):
+        """Test that the cache keeps at most max_size keys, evicting the least recently used."""
+        cache: TTLCache[str] = TTLCache(ttl=60, max_size=2)
+
+        async def load() -> str:
+            return "value"
+
+        await cache.get("a", load)
+        await cache.get("b", load)
+        await cache.get("a", load)
+        await cache.get("c", load)
+
+        assert len(cache) == 2
+        assert list(cache._entries) == ["a", "c"]
+
+    def test_invalid_arguments(self):
+        """Test that a negative ttl or empty size is rejected."""
+        with pytest.raises(ValueError):
+            TTLCache(ttl=-1)
+        with pytest.raises(ValueError):
+            TTLCache(ttl=1, max_size=0)
+
+
+class TestProvideCached:
+    """Test cached factories registered in providers."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        loads.clear()
+
+    @pytest.mark.asyncio
+    async def test_values_are_cached_across_requests(self):
+        """Test that async and sync factories only run once while their value is fresh."""
+        app = await start_test(make_app(), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            assert (await client.get("/config")).json() == {"tenant": "acme", "version": 1}
+            assert (await client.get("/config")).json() == {"tenant": "acme", "version": 1}
+            assert (await client.get("/flags")).json() == {"version": 2}
+            assert (await client.get("/flags")).json() == {"version": 2}
+        await stop_test(app)
+
+        assert loads == ["acme", "flags"]
+
+    @pytest.mark.asyncio
+    async def test_expired_values_are_refreshed(self):
+        """Test that the request finding a value expired gets the refreshed one."""
+        app = await start_test(make_app(ttl=0), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            assert (await client.get("/flags")).json() == {"version": 1}
+            assert (await client.get("/flags")).json() == {"version": 2}
+        await stop_test(app)
+
+    @pytest.mark.asyncio
+    async def test_refresh_uses_the_dependencies_of_the_request(self):
+        """Test that refreshes run while the REQUEST-scoped arguments are still open."""
+        app = await start_test(make_app(ttl=0), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            responses = [await client.get("/report") for _ in range(3)]
+        await stop_test(app)
+
+        assert [response.json() for response in responses] == [{"session_closed": False}] * 3
+        assert loads == ["report"] * 3
+
+    @pytest.mark.asyncio
+    async def test_cache_lives_with_the_app_container(self):
+        """Test that the cache is APP-scoped: a new container starts with an empty one."""
+        app = make_app()
+        for _ in range(2):
+            await start_test(app, port=0)
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+                assert (await client.get("/flags")).status_code == 200
+                assert (await client.get("/flags")).status_code == 200
+            cache = await app.app.state.container.get(TTLCache[FeatureFlags])
+            assert len(cache) == 1
+            await stop_test(app)
+
+        assert loads == ["flags", "flags"]
+
+    def test_generator_factories_are_rejected(self):
+        """Test that factories needing finalization can't be cached."""
+
+        async def connection() -> AsyncIterator[Tenant]:
+            yield Tenant("acme")
+
+        with pytest.raises(TypeError, match="generator"):
+            provide_cached(connection, ttl=60)
+
+    def test_factories_need_a_provided_type(self):
+        """Test that the cache can only be keyed by a known provided type."""
+
+        def unannotated():
+            return Tenant("acme")
+
+        with pytest.raises(TypeError, match="return annotation"):
+            provide_cached(unannotated, ttl=60)
@@ -0,0 +1,182 @@
+"""Tests for coalescing identical concurrent requests."""
+
+import asyncio
+
+import httpx
+import pytest
+from dishka import FromDishka, Provider, Scope, provide
+
+from fastapi_dishka import APIRouter, App, provide_router, start_test, stop_test
+from fastapi_dishka.coalescing import CoalescingMiddleware
+from fastapi_dishka.instrumentation import Instrumentation, Timing
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+from fastapi_dishka.router import coalesce_requests
+
+
+class OddsService:
+    """REQUEST-scoped dependency counting the handler executions."""
+
+    created = 0
+
+    def __init__(self) -> None:
+        OddsService.created += 1
+
+
+odds_router = APIRouter()
+
+
+@odds_router.get("/odds/{event_id}")
+@coalesce_requests(vary_headers=["Accept-Language"])
+async def get_odds(event_id: int, odds: FromDishka[OddsService]):
+    await asyncio.sleep(0.2)
+    return {"event_id": event_id, "executions": OddsService.created}
+
+
+@odds_router.get("/live/{event_id}")
+async def get_live(event_id: int, odds: FromDishka[OddsService]):
+    await asyncio.sleep(0.2)
+    return {"event_id": event_id, "executions": OddsService.created}
+
+
+def make_app(**options) -> App:
+    class OddsProvider(Provider, metaclass=ProviderMeta):
+        routes = provide_router(odds_router)
+        odds = provide(OddsService, scope=Scope.REQUEST)
+
+    return App("Coalescing Test", "1.0.0", OddsProvider(), **options)
+
+
+class TestCoalescedRoutes:
+    """Test coalescing through a running server."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        OddsService.created = 0
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_execution(self):
+        """Test that a burst of identical GETs runs the handler and resolves dependencies once."""
+        app = await start_test(make_app(), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            responses = await asyncio.gather(*(client.get("/odds/7") for _ in range(10)))
+        await stop_test(app)
+
+        assert {response.status_code for response in responses} == {200}
+        assert {response.text for response in responses} == {'{"event_id":7,"executions":1}'}
+        assert OddsService.created == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_execution_is_instrumented(self):
+        """Test that the REQUEST container of the shared execution reports its timings."""
+        timings: list[Timing] = []
+        app = await start_test(
+            make_app(instrumentation=Instrumentation(timings.append), lazy_request_scope=True), port=0
+        )
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            await asyncio.gather(*(client.get("/odds/7") for _ in range(3)))
+        await stop_test(app)
+
+        recorded = [(timing.kind, timing.name, timing.scope) for timing in timings]
+        assert recorded.count(("resolve", "OddsService", "REQUEST")) == 1
+        # Only the shared execution opens a REQUEST container, not the requests waiting for it
+        assert recorded.count(("container_enter", "REQUEST", "REQUEST")) == 1
+        assert recorded.count(("container_exit", "REQUEST", "REQUEST")) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_requests_are_not_coalesced(self):
+        """Test that other paths, selected headers and routes without the marker run separately."""
+        app = await start_test(make_app(), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            await asyncio.gather(
+                client.get("/odds/7"),
+                client.get("/odds/8"),
+                client.get("/odds/7", headers={"Accept-Language": "pt-BR"}),
+                client.get("/live/7"),
+                client.get("/live/7"),
+            )
+        await stop_test(app)
+
+        assert OddsService.created == 5
+
+
+class TestCoalescingMiddleware:
+    """Test cancellation handling of the coalescing layer."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    async def run_layer(self, app: App, calls: list[str], release: asyncio.Event):
+        async def route(scope, receive, send):
+            calls.append("started")
+            await release.wait()
+            calls.append("finished")
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"shared"})
+
+        layer = CoalescingMiddleware(route, dependencies=())
+        scope = {"type": "http", "method": "GET", "path": "/odds", "query_string": b"", "headers": [], "app": app.app}
+
+        async def request(sent: list[bytes]):
+            async def send(message):
+                if message["type"] == "http.response.body":
+                    sent.append(message["body"])
+
+            await layer(dict(scope, state={}), None, send)
+
+        return request
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that followers still get the response when the leader is cancelled."""
+        app = App("Coalescing Test", "1.0.0")
+        await app._resolve_container()
+        calls: list[str] = []
+        release = asyncio.Event()
+        request = await self.run_layer(app, calls, release)
+
+        leader_sent: list[bytes] = []
+        follower_sent: list[bytes] = []
+        leader = asyncio.create_task(request(leader_sent))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(request(follower_sent))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        release.set()
+        await follower
+
+        assert leader.cancelled()
+        assert leader_sent == []
+        assert follower_sent == [b"shared"]
+        assert calls == ["started", "finished"]
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_execution_is_cancelled(self):
+        """Test that the shared execution stops when its only waiter is cancelled."""
+        app = App("Coalescing Test", "1.0.0")
+        await app._resolve_container()
+        calls: list[str] = []
+        release = asyncio.Event()
+        request = await self.run_layer(app, calls, release)
+
+        leader = asyncio.create_task(request([]))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert calls == ["started"]
+
+        # The next request starts a new execution
+        sent: list[bytes] = []
+        await request(sent)
+
+        assert sent == [b"shared"]
+        assert calls == ["started", "started", "finished"]
+
+        await app.close()
@@ -0,0 +1,146 @@
+"""Tests for the graceful draining shutdown."""
+
+import asyncio
+import signal
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from dishka import FromDishka, Scope, provide
+
+from fastapi_dishka import APIRouter, App, Provider, provide_router, start_test
+from fastapi_dishka.draining import DrainConfig, DrainReport
+from fastapi_dishka.providers import _clear_all_registries
+
+
+class SlowResource:
+    """APP-scoped resource whose finalizer hangs."""
+
+
+drain_router = APIRouter()
+
+
+@drain_router.get("/work/{seconds}")
+async def work(seconds: float):
+    await asyncio.sleep(seconds)
+    return {"slept": seconds}
+
+
+@drain_router.get("/resource")
+async def get_resource(resource: FromDishka[SlowResource]):
+    return {"ok": True}
+
+
+class DrainProvider(Provider):
+    routes = provide_router(drain_router)
+
+    @provide(scope=Scope.APP)
+    async def slow_resource(self) -> AsyncIterator[SlowResource]:
+        yield SlowResource()
+        await asyncio.sleep(5)
+
+
+def make_app(**options) -> App:
+    return App("Drain Test", "1.0.0", DrainProvider(), drain=DrainConfig(**options))
+
+
+async def wait_until_idle(app: App) -> None:
+    """Wait for the drain controller to see no request in flight."""
+    while app.drain_controller.in_flight:
+        await asyncio.sleep(0.01)
+
+
+class TestDraining:
+    """Test draining shutdowns of a running server."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    async def test_readiness_flips_and_in_flight_requests_complete(self):
+        """Test that readiness fails first, requests keep being served, then in-flight ones complete."""
+        app = await start_test(make_app(readiness_delay=0.3, timeout=5), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            ready = await client.get("/ready")
+            in_flight = asyncio.create_task(client.get("/work/0.5"))
+            await asyncio.sleep(0.1)
+
+            stopping = asyncio.create_task(asyncio.to_thread(app.stop))
+            await asyncio.sleep(0.1)
+            draining = await client.get("/ready")
+            during_delay = await client.get("/work/0")
+
+            assert (await in_flight).json() == {"slept": 0.5}
+            report = await stopping
+
+        assert ready.status_code == 200
+        assert ready.json() == {"status": "ready"}
+        assert draining.status_code == 503
+        assert draining.json() == {"status": "draining"}
+        assert during_delay.status_code == 200
+        assert report == DrainReport(drained=2, cut_off=0, finalized=True)
+
+    @pytest.mark.asyncio
+    async def test_requests_past_the_deadline_are_cut_off(self):
+        """Test that requests still running after the drain timeout are cancelled and reported."""
+        app = await start_test(make_app(timeout=0.2), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            in_flight = asyncio.create_task(client.get("/work/5"))
+            await asyncio.sleep(0.1)
+            report = await asyncio.to_thread(app.stop)
+            response = await asyncio.gather(in_flight, return_exceptions=True)
+
+        assert report == DrainReport(drained=0, cut_off=1, finalized=True)
+        assert isinstance(response[0], httpx.HTTPError) or response[0].status_code == 500
+
+    @pytest.mark.asyncio
+    async def test_server_timeout_is_restored(self):
+        """Test that the drain timeout only applies to the draining shutdown, not to the server config."""
+        app = await start_test(make_app(timeout=0.2), port=0)
+        config = app._server.config
+        original = config.timeout_graceful_shutdown
+
+        report = await asyncio.to_thread(app.stop)
+
+        assert report == DrainReport(drained=0, cut_off=0, finalized=True)
+        assert config.timeout_graceful_shutdown == original
+
+    @pytest.mark.asyncio
+    async def test_finalizers_are_bounded(self):
+        """Test that hanging container finalizers are abandoned after finalize_timeout."""
+        app = await start_test(make_app(finalize_timeout=0.1), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            assert (await client.get("/resource")).status_code == 200
+        # The response can arrive before the middleware counts the request as finished
+        await asyncio.wait_for(wait_until_idle(app), 5)
+
+        report = await asyncio.wait_for(asyncio.to_thread(app.stop), 3)
+
+        assert report == DrainReport(drained=0, cut_off=0, finalized=False)
+
+    @pytest.mark.asyncio
+    async def test_signal_starts_draining(self):
+        """Test that the server's exit signal handler drains instead of stopping right away."""
+        app = await start_test(make_app(readiness_delay=0.2), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            assert app._server is not None
+            app._server.handle_exit(signal.SIGTERM, None)
+            await asyncio.sleep(0.05)
+
+            assert app.drain_controller.draining
+            assert (await client.get("/ready")).status_code == 503
+
+        await asyncio.to_thread(app._thread.join, 5)
+        assert not app._thread.is_alive()
+        assert app._server._captured_signals == [signal.SIGTERM]
+
+    def test_stop_without_drain_config_reports_nothing(self):
+        """Test that apps without DrainConfig keep the plain stop."""
+        assert App("No Drain", "1.0.0").stop() is None
+
+    def test_invalid_config(self):
+        """Test that negative durations are rejected."""
+        with pytest.raises(ValueError):
+            DrainConfig(timeout=-1)
+        assert DrainConfig(readiness_delay=1, timeout=2, finalize_timeout=None).max_duration == 3
@@ -0,0 +1,125 @@
+"""Tests for the thread and process pool executors."""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+import httpx
+import pytest
+from dishka import FromDishka, Scope, make_async_container, provide
+from dishka.provider import Provider as DishkaProvider
+
+from fastapi_dishka import APIRouter, App, Provider, provide_router, start_test, stop_test
+from fastapi_dishka.executors import (
+    ExecutorConfig,
+    ExecutorProvider,
+    get_worker_container,
+    run_in_executor,
+    run_in_process,
+)
+from fastapi_dishka.providers import _clear_all_registries
+
+
+class PricingModel:
+    """Expensive dependency built once per worker process."""
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self.margin = 3
+
+
+class PricingModelProvider(DishkaProvider):
+    """Provider instantiated in each worker process."""
+
+    model = provide(PricingModel, scope=Scope.APP)
+
+
+def price(amount: int, model: FromDishka[PricingModel]) -> dict[str, int]:
+    return {"price": amount * model.margin, "pid": model.pid}
+
+
+def thread_name() -> str:
+    return threading.current_thread().name
+
+
+executor_router = APIRouter()
+
+
+@executor_router.get("/price/{amount}")
+async def get_price(amount: int, pool: FromDishka[ProcessPoolExecutor]):
+    return await run_in_process(pool, price, amount)
+
+
+@executor_router.get("/thread")
+async def get_thread(pool: FromDishka[ThreadPoolExecutor]):
+    return {"thread": await run_in_executor(pool, partial(thread_name))}
+
+
+class TestExecutorProvider:
+    """Test executors provided to routes."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    async def test_executors_run_work_and_shut_down_with_the_app(self):
+        """Test that work runs in the pools, with injection in workers, and pools close at shutdown."""
+
+        class PricingProvider(Provider):
+            routes = provide_router(executor_router)
+
+        config = ExecutorConfig(thread_workers=2, process_workers=1, thread_name_prefix="pricing", start_method="fork")
+        app = await start_test(
+            App("Executor Test", "1.0.0", PricingProvider(), ExecutorProvider(config, [PricingModelProvider])), port=0
+        )
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            first = (await client.get("/price/5")).json()
+            second = (await client.get("/price/7")).json()
+            thread = (await client.get("/thread")).json()
+        thread_pool = await app.app.state.container.get(ThreadPoolExecutor)
+        process_pool = await app.app.state.container.get(ProcessPoolExecutor)
+        await stop_test(app)
+
+        assert first["price"] == 15
+        assert second["price"] == 21
+        assert first["pid"] == second["pid"] != os.getpid()
+        assert thread["thread"].startswith("pricing")
+        assert thread_pool._shutdown
+        assert process_pool._shutdown_thread
+
+    @pytest.mark.asyncio
+    async def test_shutdown_does_not_block_the_event_loop(self):
+        """Test that waiting for running work at shutdown leaves the event loop free."""
+        container = make_async_container(ExecutorProvider(ExecutorConfig(thread_workers=1)))
+        pool = await container.get(ThreadPoolExecutor)
+        job = pool.submit(time.sleep, 0.3)
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await container.close()
+        ticker.cancel()
+
+        assert job.done()
+        assert ticks > 5
+
+    def test_invalid_config(self):
+        """Test that executor sizes and start methods are checked."""
+        with pytest.raises(ValueError):
+            ExecutorConfig(process_workers=0)
+        with pytest.raises(ValueError):
+            ExecutorConfig(start_method="teleport")
+
+    def test_worker_container_outside_workers(self):
+        """Test that the worker container is only available in worker processes."""
+        with pytest.raises(RuntimeError):
+            get_worker_container()
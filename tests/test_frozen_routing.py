@@ -0,0 +1,187 @@
+"""Tests for the frozen routing index."""
+
+import pytest
+from dishka import Provider, Scope
+from fastapi import WebSocket
+from fastapi.testclient import TestClient
+from starlette.responses import PlainTextResponse
+from starlette.routing import Mount
+
+from fastapi_dishka import APIRouter, App, provide_router
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+from fastapi_dishka.routing import FrozenRouter, RouteIndex, get_route_path
+
+items_router = APIRouter(prefix="/items")
+
+
+@items_router.get("/")
+async def list_items():
+    return {"route": "list"}
+
+
+@items_router.get("/special")
+async def special_item():
+    return {"route": "special"}
+
+
+@items_router.get("/{item_id:int}")
+async def get_item(item_id: int):
+    return {"route": "int", "item_id": item_id}
+
+
+@items_router.get("/{name}")
+async def get_named_item(name: str):
+    return {"route": "name", "name": name}
+
+
+@items_router.post("/upload")
+async def upload():
+    return {"route": "upload"}
+
+
+@items_router.get("/img-{image}")
+async def get_image(image: str):
+    return {"route": "image"}
+
+
+files_router = APIRouter()
+
+
+@files_router.get("/files/{file_path:path}")
+async def get_file(file_path: str):
+    return {"route": "file", "path": file_path}
+
+
+@files_router.get("/{anything}/details")
+async def details(anything: str):
+    return {"route": "details", "anything": anything}
+
+
+@files_router.get("/no-slash")
+async def no_slash():
+    return {"route": "no-slash"}
+
+
+@files_router.websocket("/ws/{room}")
+async def room(websocket: WebSocket, room: str):
+    await websocket.accept()
+    await websocket.send_text(room)
+    await websocket.close()
+
+
+PATHS = [
+    "/items/",
+    "/items",
+    "/items/special",
+    "/items/42",
+    "/items/widget",
+    "/items/img-cat",
+    "/items/upload",
+    "/files/a/b/c.txt",
+    "/whatever/details",
+    "/items/details",
+    "/no-slash/",
+    "/mounted/inside",
+    "/missing",
+    "/",
+]
+
+
+def make_app(**options) -> App:
+    class RoutingProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        items = provide_router(items_router)
+        files = provide_router(files_router)
+
+    app = App("Routing Test", "1.0.0", RoutingProvider(), **options)
+    app.app.router.routes.insert(0, Mount("/mounted", app=PlainTextResponse("mounted")))
+    return app
+
+
+def snapshot(client: TestClient, path: str) -> tuple[int, str, str]:
+    response = client.get(path, follow_redirects=False)
+    return response.status_code, response.text, response.headers.get("location", "")
+
+
+class TestFrozenRouting:
+    """Test that frozen routing matches exactly like Starlette's linear scan."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    async def test_same_responses_as_linear_scan(self):
+        """Test static, parameterized, partial (405), redirect, mount and 404 cases."""
+        regular = make_app()
+        frozen = make_app(frozen_routing=True)
+        await regular._resolve_container()
+        await frozen._resolve_container()
+
+        assert isinstance(frozen.app.router.middleware_stack, FrozenRouter)
+        regular_client, frozen_client = TestClient(regular.app), TestClient(frozen.app)
+        for path in PATHS:
+            assert snapshot(frozen_client, path) == snapshot(regular_client, path), path
+
+        await regular.close()
+        await frozen.close()
+
+    @pytest.mark.asyncio
+    async def test_root_path_and_websockets(self):
+        """Test that the index uses the path relative to the root path and serves websockets."""
+        app = make_app(frozen_routing=True)
+        await app._resolve_container()
+
+        client = TestClient(app.app, root_path="/api")
+        assert client.get("/api/items/7").json() == {"route": "int", "item_id": 7}
+        with client.websocket_connect("/api/ws/lobby") as websocket:
+            assert websocket.receive_text() == "lobby"
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_routes_added_later_are_indexed(self):
+        """Test that routes added after freezing are still served."""
+        app = make_app(frozen_routing=True)
+        await app._resolve_container()
+        client = TestClient(app.app)
+        client.get("/items/1")
+
+        app.app.add_route("/metrics", PlainTextResponse("metrics"))
+
+        assert client.get("/metrics").text == "metrics"
+
+        await app.close()
+
+
+class TestRouteIndex:
+    """Test candidate selection."""
+
+    def test_candidates_keep_registration_order(self):
+        """Test that only routes able to match are returned, in registration order."""
+        routes = [*items_router.routes, *files_router.routes]
+        index = RouteIndex(routes)
+
+        paths = [route.path for route in index.candidates("/items/special")]
+
+        assert paths == [
+            "/items/special",
+            "/items/{item_id:int}",
+            "/items/{name}",
+            "/items/img-{image}",
+            "/{anything}/details",
+        ]
+
+    @pytest.mark.parametrize(
+        ("path", "root_path", "expected"),
+        [
+            ("/items/7", "", "/items/7"),
+            ("/api/items/7", "/api", "/items/7"),
+            ("/api", "/api", ""),
+            ("/apis/items", "/api", "/apis/items"),
+            ("/items/7", "/api", "/items/7"),
+        ],
+    )
+    def test_route_path_strips_the_root_path(self, path, root_path, expected):
+        """Test that only a whole-segment root path prefix is stripped."""
+        assert get_route_path({"path": path, "root_path": root_path}) == expected
@@ -0,0 +1,121 @@
+"""Tests for the fused middleware chain mode."""
+
+import pytest
+from dishka import Provider, Scope
+from fastapi.testclient import TestClient
+from starlette.responses import JSONResponse
+
+from fastapi_dishka import APIRouter, App, AsgiMiddleware, Middleware, provide_middleware, provide_router
+from fastapi_dishka.container import RequestContainerMiddleware
+from fastapi_dishka.middleware import FusedMiddleware
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+fused_router = APIRouter(prefix="/fused")
+
+
+@fused_router.get("/")
+async def fused_endpoint():
+    return {"ok": True}
+
+
+class FirstMiddleware(Middleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Order"] = response.headers.get("X-Order", "") + "first,"
+        return response
+
+
+class SecondMiddleware(Middleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Order"] = response.headers.get("X-Order", "") + "second,"
+        return response
+
+
+class ShortCircuitMiddleware(Middleware):
+    async def dispatch(self, request, call_next):
+        if request.headers.get("X-Block"):
+            return JSONResponse({"blocked": True}, status_code=403)
+        return await call_next(request)
+
+
+class OrderAsgiMiddleware(AsgiMiddleware):
+    """ASGI middleware appending to X-Order, so that its position between fused middlewares shows."""
+
+    async def __call__(self, scope, receive, send):
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = dict(message["headers"])
+                order = headers.get(b"x-order", b"") + b"asgi,"
+                message["headers"] = [*[(k, v) for k, v in message["headers"] if k != b"x-order"], (b"x-order", order)]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def make_app(fuse: bool) -> App:
+    class FusedProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        router = provide_router(fused_router)
+        first = provide_middleware(FirstMiddleware)
+        asgi = provide_middleware(OrderAsgiMiddleware)
+        second = provide_middleware(SecondMiddleware)
+        short_circuit = provide_middleware(ShortCircuitMiddleware)
+
+    return App("Fused Test", "1.0.0", FusedProvider(), fuse_middlewares=fuse)
+
+
+class TestFusedMiddlewareChain:
+    """Test that the fused chain behaves like the regular middleware onion."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    async def test_fused_mode_registers_one_layer_per_contiguous_run(self):
+        """Test that Middleware subclasses separated by an ASGI middleware end up in separate fused layers."""
+        app = make_app(fuse=True)
+        await app._resolve_container()
+
+        registered = [
+            middleware.cls for middleware in app.app.user_middleware if middleware.cls is not RequestContainerMiddleware
+        ]
+
+        # Outermost first: (ShortCircuit, Second), Asgi, (First)
+        assert registered == [FusedMiddleware, OrderAsgiMiddleware, FusedMiddleware]
+        assert FirstMiddleware not in registered
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_fused_mode_preserves_ordering(self):
+        """Test that the fused chain produces the same result as separate layers."""
+        regular = make_app(fuse=False)
+        fused = make_app(fuse=True)
+        await regular._resolve_container()
+        await fused._resolve_container()
+
+        regular_response = TestClient(regular.app).get("/fused/")
+        fused_response = TestClient(fused.app).get("/fused/")
+
+        assert fused_response.status_code == 200
+        assert fused_response.json() == {"ok": True}
+        assert fused_response.headers["X-Order"] == regular_response.headers["X-Order"] == "first,asgi,second,"
+
+        await regular.close()
+        await fused.close()
+
+    @pytest.mark.asyncio
+    async def test_fused_mode_allows_short_circuit(self):
+        """Test that a fused middleware can return a response without calling the next one."""
+        app = make_app(fuse=True)
+        await app._resolve_container()
+
+        response = TestClient(app.app).get("/fused/", headers={"X-Block": "1"})
+
+        assert response.status_code == 403
+        assert response.json() == {"blocked": True}
+        assert "X-Order" not in response.headers
+
+        await app.close()
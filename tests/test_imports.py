@@ -0,0 +1,45 @@
+"""Tests that importing the package stays cheap."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import fastapi_dishka
+
+
+def imported_modules(statement: str) -> set[str]:
+    """Run an import statement in a fresh interpreter and return the top-level modules it loaded."""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    # Same import path as this interpreter, whether or not the package is installed
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env).stdout
+    return {module.split(".")[0] for module in output.split()}
+
+
+class TestLazyImports:
+    """Test that heavy dependencies are only imported when needed."""
+
+    def test_package_import_loads_no_framework(self):
+        """Test that `import fastapi_dishka` imports neither FastAPI, dishka nor uvicorn."""
+        modules = imported_modules("import fastapi_dishka")
+
+        assert not modules & {"fastapi", "dishka", "uvicorn", "starlette"}
+
+    @pytest.mark.parametrize("name", ["Provider", "App", "APIRouter", "Middleware"])
+    def test_uvicorn_is_only_imported_to_serve(self, name):
+        """Test that defining providers and apps doesn't import uvicorn or multiprocessing."""
+        modules = imported_modules(f"from fastapi_dishka import {name}")
+
+        assert "uvicorn" not in modules
+        assert "multiprocessing" not in modules
+
+    def test_public_names_resolve(self):
+        """Test that every exported name is reachable and listed by dir()."""
+        for name in fastapi_dishka.__all__:
+            assert getattr(fastapi_dishka, name) is not None
+            assert name in dir(fastapi_dishka)
+
+        with pytest.raises(AttributeError):
+            fastapi_dishka.missing  # noqa: B018
@@ -0,0 +1,239 @@
+"""Tests for the DI timing instrumentation."""
+
+from unittest.mock import Mock
+
+import pytest
+from dishka import FromDishka, Provider, Scope, make_async_container, provide
+from fastapi.testclient import TestClient
+
+from fastapi_dishka import (
+    APIRouter,
+    App,
+    AppDependency,
+    AsgiMiddleware,
+    Middleware,
+    provide_middleware,
+    provide_router,
+)
+from fastapi_dishka.instrumentation import HistogramSink, Instrumentation, StructlogSink, Timing
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+
+class Settings:
+    """APP-scoped dependency."""
+
+
+class RequestService:
+    """REQUEST-scoped dependency."""
+
+
+instrumented_router = APIRouter()
+
+
+@instrumented_router.get("/work")
+async def work_endpoint(settings: FromDishka[Settings], service: FromDishka[RequestService]):
+    return {"ok": True}
+
+
+@instrumented_router.get("/settings")
+async def settings_endpoint(settings: FromDishka[Settings]):
+    return {"ok": True}
+
+
+@instrumented_router.get("/healthz")
+async def healthz():
+    return {"ok": True}
+
+
+class ResolvingMiddleware(Middleware):
+    async def dispatch(self, request, call_next):
+        await self.get_dependency(request, Settings)
+        return await call_next(request)
+
+
+class PassThroughMiddleware(AsgiMiddleware):
+    settings = AppDependency(Settings)
+
+
+def make_app(*sinks, **options) -> App:
+    class InstrumentedProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        settings = provide(Settings, scope=Scope.APP)
+        service = provide(RequestService, scope=Scope.REQUEST)
+        router = provide_router(instrumented_router)
+        resolving = provide_middleware(ResolvingMiddleware)
+        pass_through = provide_middleware(PassThroughMiddleware)
+
+    return App("Instrumented", "1.0.0", InstrumentedProvider(), instrumentation=Instrumentation(*sinks), **options)
+
+
+class TestInstrumentation:
+    """Test that the App reports DI timings to the sinks."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    async def test_records_resolutions_containers_and_middlewares(self):
+        """Test that every kind of timing is recorded for a request."""
+        timings: list[Timing] = []
+        app = make_app(timings.append)
+        await app._resolve_container()
+
+        assert TestClient(app.app).get("/work").status_code == 200
+
+        recorded = {(timing.kind, timing.name, timing.scope) for timing in timings}
+        assert ("resolve", "Settings", "APP") in recorded
+        assert ("resolve", "RequestService", "REQUEST") in recorded
+        assert ("container_enter", "REQUEST", "REQUEST") in recorded
+        assert ("container_exit", "REQUEST", "REQUEST") in recorded
+        assert ("middleware", "ResolvingMiddleware", "") in recorded
+        assert ("middleware", "PassThroughMiddleware", "") in recorded
+        assert all(timing.seconds >= 0 for timing in timings)
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_lazy_scope_skips_container_timings_for_plain_routes(self):
+        """Test that lazy routes without dependencies record no container timings."""
+        timings: list[Timing] = []
+        app = make_app(timings.append, lazy_request_scope=True)
+        await app._resolve_container()
+
+        TestClient(app.app).get("/healthz")
+
+        assert not [timing for timing in timings if timing.kind.startswith("container")]
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_app_container_resolutions_are_timed(self):
+        """Test that AppDependency binds and routes served by the app container are timed."""
+        timings: list[Timing] = []
+        app = make_app(timings.append, lazy_request_scope=True)
+        await app._resolve_container()
+
+        assert [(timing.kind, timing.name, timing.scope) for timing in timings] == [("resolve", "Settings", "APP")]
+
+        timings.clear()
+        TestClient(app.app).get("/settings")
+
+        recorded = {(timing.kind, timing.name, timing.scope) for timing in timings}
+        assert ("resolve", "Settings", "APP") in recorded
+        assert not [timing for timing in timings if timing.kind.startswith("container")]
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_child_containers_entered_through_the_proxy_are_timed(self):
+        """Test that entering a child scope from a wrapped container keeps timing it."""
+        timings: list[Timing] = []
+        provider = Provider(scope=Scope.REQUEST)
+        provider.provide(RequestService)
+        container = Instrumentation(timings.append).wrap_container(make_async_container(provider))
+
+        async with container() as request_container:
+            assert isinstance(await request_container.get(RequestService), RequestService)
+
+        assert [(timing.kind, timing.name, timing.scope) for timing in timings] == [
+            ("container_enter", "REQUEST", "REQUEST"),
+            ("resolve", "RequestService", "REQUEST"),
+            ("container_exit", "REQUEST", "REQUEST"),
+        ]
+        await container.close()
+
+    @pytest.mark.asyncio
+    async def test_fused_middlewares_are_timed_as_one_layer(self):
+        """Test that a fused chain is reported as a single middleware."""
+        timings: list[Timing] = []
+        app = make_app(timings.append, fuse_middlewares=True)
+        await app._resolve_container()
+
+        TestClient(app.app).get("/work")
+
+        middlewares = {timing.name for timing in timings if timing.kind == "middleware"}
+        assert middlewares == {"FusedMiddleware", "PassThroughMiddleware"}
+
+        await app.close()
+
+
+class TestHistogramSink:
+    """Test the in-memory histogram and its Prometheus rendering."""
+
+    def test_observations_are_bucketed(self):
+        """Test that observations land in the first bucket they fit."""
+        histogram = HistogramSink(buckets=(0.1, 1.0))
+        histogram(Timing("resolve", "Settings", "APP", 0.05))
+        histogram(Timing("resolve", "Settings", "APP", 0.5))
+        histogram(Timing("resolve", "Settings", "APP", 5.0))
+
+        series = histogram.snapshot()[("resolve", "Settings", "APP")]
+
+        assert series.counts == [1, 1]
+        assert series.count == 3
+        assert series.total == pytest.approx(5.55)
+
+    def test_prometheus_text(self):
+        """Test the Prometheus exposition output."""
+        histogram = HistogramSink(buckets=(0.1,))
+        histogram(Timing("resolve", "Settings", "APP", 0.05))
+        histogram(Timing("middleware", "Auth", "", 0.2))
+
+        text = histogram.render_prometheus()
+
+        assert "# TYPE fastapi_dishka_resolve_seconds histogram" in text
+        assert 'fastapi_dishka_resolve_seconds_bucket{dependency="Settings",scope="APP",le="0.1"} 1' in text
+        assert 'fastapi_dishka_middleware_seconds_bucket{middleware="Auth",le="0.1"} 0' in text
+        assert 'fastapi_dishka_middleware_seconds_count{middleware="Auth"} 1' in text
+        assert "container_enter" not in text
+
+    @pytest.mark.asyncio
+    async def test_prometheus_endpoint(self):
+        """Test that the histogram can be served as a metrics route."""
+        _clear_all_registries()
+        histogram = HistogramSink()
+        app = make_app(histogram)
+        await app._resolve_container()
+        app.app.add_route("/metrics", histogram.prometheus_endpoint)
+        client = TestClient(app.app)
+
+        client.get("/work")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert 'dependency="RequestService",scope="REQUEST"' in response.text
+
+        await app.close()
+
+    def test_reset(self):
+        """Test that reset forgets all series."""
+        histogram = HistogramSink()
+        histogram(Timing("resolve", "Settings", "APP", 0.05))
+        histogram.reset()
+
+        assert histogram.snapshot() == {}
+        assert histogram.render_prometheus() == "\n"
+
+
+class TestStructlogSink:
+    """Test the structlog emitter."""
+
+    def test_emits_event(self):
+        """Test that each timing becomes one debug event."""
+        logger = Mock()
+        sink = StructlogSink(logger)
+
+        sink(Timing("container_enter", "REQUEST", "REQUEST", 0.001))
+
+        logger.debug.assert_called_once_with(
+            "dishka.timing", kind="container_enter", name="REQUEST", scope="REQUEST", seconds=0.001
+        )
+
+    def test_defaults_to_structlog_logger(self):
+        """Test that a structlog logger is created when none is given."""
+        sink = StructlogSink()
+
+        sink(Timing("resolve", "Settings", "APP", 0.001))
+
+        assert sink.event == "dishka.timing"
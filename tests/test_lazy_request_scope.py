@@ -0,0 +1,147 @@
+"""Tests for lazy REQUEST-scope container creation."""
+
+import pytest
+from dishka import FromDishka, Provider, Scope, provide
+from fastapi import Request
+from fastapi.testclient import TestClient
+
+from fastapi_dishka import APIRouter, App, Middleware, provide_middleware, provide_router
+from fastapi_dishka.container import RequestContainerMiddleware, route_needs_request_container
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+
+class Settings:
+    """APP-scoped dependency."""
+
+    name = "settings"
+
+
+class RequestService:
+    """REQUEST-scoped dependency."""
+
+    created = 0
+
+    def __init__(self) -> None:
+        RequestService.created += 1
+
+
+lazy_router = APIRouter()
+
+
+@lazy_router.get("/healthz")
+async def healthz(request: Request):
+    return {"container": "dishka_container" in request.state._state}
+
+
+@lazy_router.get("/settings")
+async def settings_endpoint(request: Request, settings: FromDishka[Settings]):
+    return {"name": settings.name, "app_container": request.state.dishka_container is request.app.state.container}
+
+
+@lazy_router.get("/request")
+async def request_endpoint(service: FromDishka[RequestService]):
+    return {"created": RequestService.created}
+
+
+@lazy_router.get("/sync")
+def sync_endpoint(service: FromDishka[RequestService]):
+    return {"created": RequestService.created}
+
+
+class RequestScopedMiddleware(Middleware):
+    needs_request_container = True
+
+    async def dispatch(self, request, call_next):
+        await self.get_dependency(request, RequestService)
+        return await call_next(request)
+
+
+def make_app(lazy: bool, *middlewares) -> App:
+    class LazyProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        settings = provide(Settings, scope=Scope.APP)
+        service = provide(RequestService, scope=Scope.REQUEST)
+        router = provide_router(lazy_router)
+        middleware_providers = tuple(provide_middleware(middleware) for middleware in middlewares)
+
+    return App("Lazy Test", "1.0.0", LazyProvider(), lazy_request_scope=lazy)
+
+
+class TestLazyRequestScope:
+    """Test that the REQUEST scope is only entered where it is needed."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        RequestService.created = 0
+
+    @pytest.mark.asyncio
+    async def test_default_mode_opens_container_for_every_request(self):
+        """Test that without lazy mode every request gets a container."""
+        app = make_app(lazy=False)
+        await app._resolve_container()
+
+        assert TestClient(app.app).get("/healthz").json() == {"container": True}
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_route_without_dependencies_opens_no_container(self):
+        """Test that a health check route never enters the REQUEST scope."""
+        app = make_app(lazy=True)
+        await app._resolve_container()
+
+        response = TestClient(app.app).get("/healthz")
+
+        assert response.status_code == 200
+        assert response.json() == {"container": False}
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_app_scoped_route_uses_app_container(self):
+        """Test that routes with only APP-scoped dependencies are served from the app container."""
+        app = make_app(lazy=True)
+        await app._resolve_container()
+
+        response = TestClient(app.app).get("/settings")
+
+        assert response.json() == {"name": "settings", "app_container": True}
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_request_scoped_routes_get_request_container(self):
+        """Test that async and sync routes with REQUEST-scoped dependencies still work."""
+        app = make_app(lazy=True)
+        await app._resolve_container()
+        client = TestClient(app.app)
+
+        assert client.get("/request").json() == {"created": 1}
+        assert client.get("/sync").json() == {"created": 2}
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_request_scoped_middleware_gets_container(self):
+        """Test that a middleware flagged with needs_request_container can resolve REQUEST dependencies."""
+        app = make_app(True, RequestScopedMiddleware)
+        await app._resolve_container()
+
+        registered = [middleware.cls for middleware in app.app.user_middleware]
+        assert registered.index(RequestContainerMiddleware) < registered.index(RequestScopedMiddleware)
+
+        # The route reuses the container opened around the middleware
+        response = TestClient(app.app).get("/request")
+
+        assert response.json() == {"created": 1}
+
+        await app.close()
+
+    def test_route_analysis(self):
+        """Test the startup analysis of individual routes."""
+        routes = {route.path: route for route in lazy_router.routes}
+
+        assert not route_needs_request_container(routes["/healthz"])
+        assert route_needs_request_container(routes["/request"])
+        assert route_needs_request_container(routes["/sync"])
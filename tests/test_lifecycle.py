@@ -0,0 +1,239 @@
+"""Tests for the concurrent container lifecycle."""
+
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from dishka import FromDishka, Scope, make_async_container, provide
+from dishka.provider import Provider as DishkaProvider
+
+from fastapi_dishka import (
+    APIRouter,
+    App,
+    HistogramSink,
+    Instrumentation,
+    Provider,
+    provide_router,
+    start_test,
+    stop_test,
+)
+from fastapi_dishka.lifecycle import ContainerLifecycle, dependency_levels
+from fastapi_dishka.providers import _clear_all_registries
+
+
+class Config:
+    pass
+
+
+class Cache:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Client:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Metrics:
+    pass
+
+
+class Service:
+    def __init__(self, cache: Cache, client: Client) -> None:
+        self.cache = cache
+        self.client = client
+
+
+class Session:
+    """Uncached APP-scoped dependency, created on demand after startup."""
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+class Tracker:
+    """Records the builds and finalizations, and how many builds overlapped."""
+
+    def __init__(self) -> None:
+        self.events: list[str] = []
+        self.active = 0
+        self.peak: dict[str, int] = {}
+
+    async def step(self, phase: str, name: str) -> None:
+        self.active += 1
+        self.peak[phase] = max(self.peak.get(phase, 0), self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        self.events.append(f"{phase} {name}")
+
+
+class LifecycleProvider(DishkaProvider):
+    scope = Scope.APP
+
+    def __init__(self, tracker: Tracker) -> None:
+        super().__init__()
+        self.tracker = tracker
+
+    async def managed(self, value: object) -> AsyncIterator[object]:
+        name = type(value).__name__
+        await self.tracker.step("build", name)
+        yield value
+        await self.tracker.step("finalize", name)
+
+    @provide
+    async def config(self) -> AsyncIterator[Config]:
+        async for value in self.managed(Config()):
+            yield value
+
+    @provide
+    async def metrics(self) -> AsyncIterator[Metrics]:
+        async for value in self.managed(Metrics()):
+            yield value
+
+    @provide
+    async def cache(self, config: Config) -> AsyncIterator[Cache]:
+        async for value in self.managed(Cache(config)):
+            yield value
+
+    @provide
+    async def client(self, config: Config) -> AsyncIterator[Client]:
+        async for value in self.managed(Client(config)):
+            yield value
+
+    service = provide(Service)
+
+    @provide(cache=False)
+    async def session(self, client: Client) -> AsyncIterator[Session]:
+        yield Session(client)
+        self.tracker.events.append("finalize Session")
+
+
+class TestContainerLifecycle:
+    """Test building and finalizing along the dependency graph."""
+
+    def test_dependency_levels(self):
+        """Test that dependencies are grouped after everything they depend on."""
+        container = make_async_container(LifecycleProvider(Tracker()))
+
+        levels = [{key.type_hint for key in level} for level in dependency_levels(container.registry)]
+
+        assert levels == [{Config, Metrics}, {Cache, Client}, {Service}]
+
+    @pytest.mark.asyncio
+    async def test_levels_are_built_concurrently(self):
+        """Test that independent dependencies overlap and that dishka finalizes them in reverse order."""
+        tracker = Tracker()
+        histogram = HistogramSink()
+        container = make_async_container(LifecycleProvider(tracker), lock_factory=None)
+        lifecycle = ContainerLifecycle(container, Instrumentation(histogram))
+
+        assert await lifecycle.start() == 5
+        service = await container.get(Service)
+        session = await container.get(Session)
+        await lifecycle.close()
+
+        assert service.cache.config is service.client.config is session.client.config
+        assert tracker.peak == {"build": 2, "finalize": 1}
+        # The session was created after startup from a built dependency: it is finalized first
+        assert tracker.events[4] == "finalize Session"
+        assert set(tracker.events[5:7]) == {"finalize Cache", "finalize Client"}
+        assert set(tracker.events[7:]) == {"finalize Config", "finalize Metrics"}
+
+        report = lifecycle.report
+        assert [(timing.name, timing.level) for timing in report.build[:2]] == [("Config", 0), ("Metrics", 0)]
+        assert report.finalize_seconds > 0
+        assert {kind for kind, _, _ in histogram.snapshot()} == {"build", "finalize"}
+
+    @pytest.mark.asyncio
+    async def test_container_lock_serializes_builds(self):
+        """Test that a container with dishka's lock still gets built, one dependency at a time."""
+        tracker = Tracker()
+        lifecycle = ContainerLifecycle(make_async_container(LifecycleProvider(tracker)))
+
+        assert await lifecycle.start() == 5
+        await lifecycle.close()
+
+        assert tracker.peak == {"build": 1, "finalize": 1}
+
+    @pytest.mark.asyncio
+    async def test_build_error_is_raised(self):
+        """Test that a failing factory fails the startup."""
+
+        class BrokenProvider(DishkaProvider):
+            scope = Scope.APP
+
+            @provide
+            async def config(self) -> Config:
+                raise RuntimeError("config unavailable")
+
+        lifecycle = ContainerLifecycle(make_async_container(BrokenProvider()))
+
+        with pytest.raises(RuntimeError, match="config unavailable"):
+            await lifecycle.start()
+
+    @pytest.mark.asyncio
+    async def test_build_error_finalizes_built_dependencies(self):
+        """Test that the dependencies built before a failing factory are finalized once."""
+        finalized: list[str] = []
+
+        class HalfBrokenProvider(DishkaProvider):
+            scope = Scope.APP
+
+            @provide
+            async def config(self) -> AsyncIterator[Config]:
+                yield Config()
+                finalized.append("Config")
+
+            @provide
+            async def cache(self, config: Config) -> Cache:
+                raise RuntimeError("cache unavailable")
+
+        lifecycle = ContainerLifecycle(make_async_container(HalfBrokenProvider(), lock_factory=None))
+
+        with pytest.raises(RuntimeError, match="cache unavailable"):
+            await lifecycle.start()
+        assert finalized == ["Config"]
+
+        await lifecycle.close()
+        assert finalized == ["Config"]
+
+
+lifecycle_router = APIRouter()
+
+
+@lifecycle_router.get("/service")
+async def get_service(service: FromDishka[Service]):
+    return {"shared": service.cache.config is service.client.config}
+
+
+class TestAppLifecycle:
+    """Test the lifecycle in the App's startup and shutdown."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    async def test_app_builds_and_finalizes_concurrently(self):
+        """Test that the App builds APP-scoped dependencies at startup and finalizes them at shutdown."""
+        tracker = Tracker()
+
+        class RoutesProvider(Provider):
+            routes = provide_router(lifecycle_router)
+
+        app = await start_test(
+            App("Lifecycle Test", "1.0.0", RoutesProvider(), LifecycleProvider(tracker), concurrent_lifecycle=True),
+            port=0,
+        )
+        built = list(tracker.events)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            assert (await client.get("/service")).json() == {"shared": True}
+        await stop_test(app)
+
+        assert len(built) == 4
+        assert tracker.peak["build"] == 2
+        assert app.lifecycle is not None
+        assert app.lifecycle.report.finalize_seconds > 0
+        assert tracker.events[-1] in ("finalize Config", "finalize Metrics")
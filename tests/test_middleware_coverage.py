@@ -3,9 +3,11 @@
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from dishka import DEFAULT_COMPONENT
+from starlette.requests import Request
 from starlette.responses import Response
 
-from fastapi_dishka import Middleware
+from fastapi_dishka import AsgiMiddleware, Middleware
 
 
 class ServiceForMiddleware:
@@ -15,6 +17,11 @@ class ServiceForMiddleware:
         self.value = "test_value"
 
 
+def make_request(app, **state) -> Request:
+    """Create a real request whose ASGI scope points at the given app and state."""
+    return Request({"type": "http", "app": app, "state": state})
+
+
 class SimpleTestMiddleware(Middleware):
     """Test middleware for testing default dispatch."""
 
@@ -29,17 +36,15 @@ class TestGetDependencyErrorHandling:
         """Test get_dependency raises AttributeError when no container found (lines 64-69)."""
         middleware = Middleware(Mock())
 
-        # Create mock request and app without any container
-        mock_request = Mock()
+        # Create request and app without any container
         mock_app = Mock()
 
         # Use simple objects without container attributes
         class SimpleState:
             pass
 
-        mock_request.app = mock_app
-        mock_request.state = SimpleState()
         mock_app.state = SimpleState()
+        mock_request = make_request(mock_app)
 
         # Verify hasattr returns False for both containers
         assert not hasattr(mock_request.state, "dishka_container")
@@ -54,21 +59,15 @@ class TestGetDependencyErrorHandling:
         """Test get_dependency falls back to app container when request container unavailable (line 81)."""
         middleware = Middleware(Mock())
 
-        # Create mock request without request container but with app container
-        mock_request = Mock()
+        # Create request without request container but with app container
         mock_app = Mock()
 
-        # Use simple classes for state objects
-        class RequestState:
-            pass  # No dishka_container attribute
-
         class AppState:
             def __init__(self):
                 self.container = AsyncMock()
 
-        mock_request.app = mock_app
-        mock_request.state = RequestState()
         mock_app.state = AppState()
+        mock_request = make_request(mock_app)  # No dishka_container in request state
 
         # Set up app container response
         test_service = ServiceForMiddleware()
@@ -82,7 +81,7 @@ class TestGetDependencyErrorHandling:
         result = await middleware.get_dependency(mock_request, ServiceForMiddleware)
 
         assert result is test_service
-        mock_app.state.container.get.assert_called_once_with(ServiceForMiddleware)
+        mock_app.state.container.get.assert_called_once_with(ServiceForMiddleware, component=DEFAULT_COMPONENT)
 
 
 class TestDefaultDispatchBehavior:
@@ -114,20 +113,14 @@ class TestContainerAssertions:
         """Test container assertion when container is None."""
         middleware = Middleware(Mock())
 
-        # Create mock with container attribute but set to None
-        mock_request = Mock()
+        # Create request with container attribute but set to None
         mock_app = Mock()
 
-        class RequestStateWithNone:
-            def __init__(self):
-                self.dishka_container = None
-
         class AppState:
             pass
 
-        mock_request.app = mock_app
-        mock_request.state = RequestStateWithNone()
         mock_app.state = AppState()
+        mock_request = make_request(mock_app, dishka_container=None)
 
         # Should raise AssertionError due to None container
         with pytest.raises(AssertionError):
@@ -138,21 +131,86 @@ class TestContainerAssertions:
         """Test app container assertion when it's None."""
         middleware = Middleware(Mock())
 
-        # Create mock without request container but app container is None
-        mock_request = Mock()
+        # Create request without request container but app container is None
         mock_app = Mock()
 
-        class RequestState:
-            pass  # No dishka_container
-
         class AppStateWithNone:
             def __init__(self):
                 self.container = None
 
-        mock_request.app = mock_app
-        mock_request.state = RequestState()
         mock_app.state = AppStateWithNone()
+        mock_request = make_request(mock_app)  # No dishka_container
 
         # Should raise AssertionError due to None app container
         with pytest.raises(AssertionError):
             await middleware.get_dependency(mock_request, ServiceForMiddleware)
+
+
+class TestRequestResolutionCache:
+    """Test the per-request resolution cache shared by DI-aware middlewares."""
+
+    def make_app_with_container(self):
+        mock_app = Mock()
+
+        class AppState:
+            def __init__(self):
+                self.container = AsyncMock()
+
+        mock_app.state = AppState()
+        mock_app.state.container.get.side_effect = lambda dependency_type, component: dependency_type()
+        return mock_app
+
+    @pytest.mark.asyncio
+    async def test_same_dependency_is_resolved_once_per_request(self):
+        """Test that middlewares handling one request share resolved instances."""
+        mock_app = self.make_app_with_container()
+        request = make_request(mock_app)
+
+        first = await Middleware(Mock()).get_dependency(request, ServiceForMiddleware)
+        second = await AsgiMiddleware(Mock()).get_dependency(request.scope, ServiceForMiddleware)
+
+        assert first is second
+        mock_app.state.container.get.assert_called_once_with(ServiceForMiddleware, component=DEFAULT_COMPONENT)
+
+    @pytest.mark.asyncio
+    async def test_cache_is_not_shared_between_requests(self):
+        """Test that each request gets its own resolution cache."""
+        mock_app = self.make_app_with_container()
+        middleware = Middleware(Mock())
+
+        first = await middleware.get_dependency(make_request(mock_app), ServiceForMiddleware)
+        second = await middleware.get_dependency(make_request(mock_app), ServiceForMiddleware)
+
+        assert first is not second
+        assert mock_app.state.container.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_component(self):
+        """Test that the same type from different components is resolved separately."""
+        mock_app = self.make_app_with_container()
+        request = make_request(mock_app)
+        middleware = Middleware(Mock())
+
+        default = await middleware.get_dependency(request, ServiceForMiddleware)
+        other = await middleware.get_dependency(request, ServiceForMiddleware, component="other")
+
+        assert default is not other
+        assert mock_app.state.container.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_dependencies_resolves_in_one_pass(self):
+        """Test that get_dependencies returns instances in order and reuses cached ones."""
+
+        class OtherService:
+            pass
+
+        mock_app = self.make_app_with_container()
+        request = make_request(mock_app)
+        middleware = Middleware(Mock())
+
+        cached = await middleware.get_dependency(request, ServiceForMiddleware)
+        service, other = await middleware.get_dependencies(request, ServiceForMiddleware, OtherService)
+
+        assert service is cached
+        assert isinstance(other, OtherService)
+        assert mock_app.state.container.get.call_count == 2
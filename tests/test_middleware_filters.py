@@ -0,0 +1,167 @@
+"""Tests for path, method and tag scoped middlewares."""
+
+import pytest
+from dishka import Provider, Scope, provide
+from fastapi.testclient import TestClient
+
+from fastapi_dishka import APIRouter, App, AsgiMiddleware, Middleware, provide_middleware, provide_router
+from fastapi_dishka.filtering import MiddlewareFilter, PathPrefixTrie
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+
+class Settings:
+    """APP-scoped dependency."""
+
+
+filter_router = APIRouter()
+
+
+@filter_router.get("/healthz")
+async def healthz():
+    return {"ok": True}
+
+
+@filter_router.get("/api/users", tags=["users"])
+async def list_users():
+    return {"ok": True}
+
+
+@filter_router.post("/api/users", tags=["users"])
+async def create_user():
+    return {"ok": True}
+
+
+@filter_router.get("/api/orders/{order_id}", tags=["orders"])
+async def get_order(order_id: int):
+    return {"ok": True}
+
+
+calls: list[str] = []
+
+
+class RecordingMiddleware(Middleware):
+    needs_request_container = True
+
+    async def dispatch(self, request, call_next):
+        await self.get_dependency(request, Settings)
+        calls.append(f"dispatch {request.method} {request.url.path}")
+        return await call_next(request)
+
+
+class RecordingAsgiMiddleware(AsgiMiddleware):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            calls.append(f"asgi {scope['method']} {scope['path']}")
+        await self.app(scope, receive, send)
+
+
+class TaggedMiddleware(Middleware):
+    async def dispatch(self, request, call_next):
+        calls.append(f"tagged {request.url.path}")
+        return await call_next(request)
+
+
+async def make_app(**options) -> App:
+    class FilterProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        settings = provide(Settings, scope=Scope.APP)
+        router = provide_router(filter_router)
+        recording = provide_middleware(RecordingMiddleware, include=["/api"], exclude=["/api/orders"])
+        asgi = provide_middleware(RecordingAsgiMiddleware, methods=["post"])
+        tagged = provide_middleware(TaggedMiddleware, tags=["orders"])
+
+    app = App("Filter Test", "1.0.0", FilterProvider(), **options)
+    await app._resolve_container()
+    return app
+
+
+class TestMiddlewareFilters:
+    """Test that filtered middlewares only run for the selected requests."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        calls.clear()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("options", [{}, {"fuse_middlewares": True, "lazy_request_scope": True}])
+    async def test_requests_outside_the_filters_skip_the_middleware(self, options):
+        """Test prefix, method and tag filters, alone and with fusing and the lazy scope."""
+        app = await make_app(**options)
+        client = TestClient(app.app)
+
+        assert client.get("/healthz").status_code == 200
+        assert calls == []
+
+        assert client.get("/api/users").status_code == 200
+        assert calls == ["dispatch GET /api/users"]
+
+        calls.clear()
+        assert client.post("/api/users").status_code == 200
+        assert calls == ["asgi POST /api/users", "dispatch POST /api/users"]
+
+        calls.clear()
+        assert client.get("/api/orders/1").status_code == 200
+        assert calls == ["tagged /api/orders/1"]
+
+        calls.clear()
+        assert client.get("/api/orders/1/items").status_code == 404
+        assert calls == []
+
+        await app.close()
+
+    def test_conflicting_filters_are_rejected(self):
+        """Test that a middleware registered again with other filters is an error, not silently ignored."""
+        with pytest.raises(ValueError, match="conflicting filters"):
+
+            class TwiceProvider(Provider, metaclass=ProviderMeta):
+                first = provide_middleware(RecordingMiddleware, include=["/api"])
+                second = provide_middleware(RecordingMiddleware, include=["/admin"])
+
+        _clear_all_registries()
+
+        class FilteredProvider(Provider, metaclass=ProviderMeta):
+            recording = provide_middleware(RecordingMiddleware, include=["/api"])
+
+        class UnfilteredProvider(Provider, metaclass=ProviderMeta):
+            recording = provide_middleware(RecordingMiddleware)
+
+        class SameFilterProvider(Provider, metaclass=ProviderMeta):
+            recording = provide_middleware(RecordingMiddleware, include=["/api"])
+
+        with pytest.raises(ValueError, match="RecordingMiddleware is registered with conflicting filters"):
+            App("Filter Test", "1.0.0", FilteredProvider(), UnfilteredProvider())
+
+        app = App("Filter Test", "1.0.0", FilteredProvider(), SameFilterProvider())
+        assert app.middleware_filters == {RecordingMiddleware: MiddlewareFilter(include=("/api",))}
+
+    def test_prefixes_must_be_absolute(self):
+        """Test that relative prefixes are rejected."""
+        with pytest.raises(ValueError, match="must start with '/'"):
+            MiddlewareFilter(exclude=("healthz",))
+
+
+class TestPathPrefixTrie:
+    """Test segment-wise prefix matching."""
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/static", True),
+            ("/static/", True),
+            ("/static/css/app.css", True),
+            ("/statics", False),
+            ("/api/v1/users", True),
+            ("/api/v2/users", False),
+            ("/", False),
+        ],
+    )
+    def test_matches_whole_segments(self, path, expected):
+        """Test that prefixes match themselves and everything below them."""
+        trie = PathPrefixTrie(["/static/", "/api/v1"])
+
+        assert trie.matches(path) is expected
+
+    def test_root_prefix_matches_everything(self):
+        """Test that "/" selects every path."""
+        assert PathPrefixTrie(["/"]).matches("/anything/at/all")
@@ -0,0 +1,158 @@
+"""Tests for the precomputed OpenAPI schema."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from dishka import Provider, Scope
+from fastapi.openapi.utils import get_openapi
+from fastapi.testclient import TestClient
+
+from fastapi_dishka import APIRouter, App, provide_router
+from fastapi_dishka.__main__ import main as cli_main
+from fastapi_dishka.openapi import dump_openapi
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+openapi_router = APIRouter(prefix="/pets", tags=["pets"])
+
+
+@openapi_router.get("/{pet_id}")
+async def get_pet(pet_id: int):
+    return {"id": pet_id}
+
+
+def make_app(**options) -> App:
+    class OpenAPIProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        router = provide_router(openapi_router)
+
+    return App("Pets", "1.0.0", OpenAPIProvider(), **options)
+
+
+APP_MODULE = """
+from dishka import Provider, Scope
+from fastapi_dishka import App, provide_router
+from fastapi_dishka.providers import ProviderMeta
+from tests.test_openapi import openapi_router
+
+class CliProvider(Provider, metaclass=ProviderMeta):
+    scope = Scope.APP
+    router = provide_router(openapi_router)
+
+app = App("Pets", "1.0.0", CliProvider())
+"""
+
+
+class TestPrecomputedOpenAPI:
+    """Test the eagerly built, pre-encoded OpenAPI document."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    async def test_schema_is_built_at_startup(self):
+        """Test that the schema is computed once, before the first request, and is unchanged."""
+        lazy = make_app()
+        await lazy._resolve_container()
+        expected = TestClient(lazy.app).get("/openapi.json").json()
+
+        app = make_app(precompute_openapi=True)
+        with patch("fastapi.applications.get_openapi", wraps=get_openapi) as spy:
+            await app._resolve_container()
+            assert spy.call_count == 1
+
+            response = TestClient(app.app).get("/openapi.json")
+            assert spy.call_count == 1
+
+        assert response.json() == expected
+        assert response.headers["content-type"] == "application/json"
+
+        await lazy.close()
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_etag_revalidation(self):
+        """Test that a matching If-None-Match gets an empty 304."""
+        app = make_app(precompute_openapi=True)
+        await app._resolve_container()
+        client = TestClient(app.app)
+
+        etag = client.get("/openapi.json").headers["etag"]
+        cached = client.get("/openapi.json", headers={"If-None-Match": f'"other", W/{etag}'})
+        changed = client.get("/openapi.json", headers={"If-None-Match": '"other"'})
+
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert changed.status_code == 200
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_root_path_is_listed_in_servers(self):
+        """Test that the served document lists the request's root path, as FastAPI's route does."""
+        lazy = make_app()
+        await lazy._resolve_container()
+        expected = TestClient(lazy.app, root_path="/api").get("/openapi.json").json()
+
+        app = make_app(precompute_openapi=True)
+        await app._resolve_container()
+        mounted = TestClient(app.app, root_path="/api").get("/openapi.json")
+        plain = TestClient(app.app).get("/openapi.json")
+
+        assert mounted.json() == expected
+        assert mounted.json()["servers"] == [{"url": "/api"}]
+        assert "servers" not in plain.json()
+        assert mounted.headers["etag"] != plain.headers["etag"]
+
+        await lazy.close()
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_dump_and_load(self, tmp_path):
+        """Test that a dumped schema is served as is, without introspecting routes."""
+        path = tmp_path / "openapi.json"
+        document = dump_openapi(make_app(), path)
+
+        _clear_all_registries()
+        app = make_app(openapi_file=path)
+        await app._resolve_container()
+        response = TestClient(app.app).get("/openapi.json")
+
+        assert response.content == path.read_bytes()
+        assert response.headers["etag"] == document.etag
+        assert "/pets/{pet_id}" in response.json()["paths"]
+
+        await app.close()
+
+    def test_dump_ignores_the_served_file(self, tmp_path):
+        """Test that an App serving a dumped file can dump its schema, fresh from its routes."""
+        path = tmp_path / "openapi.json"
+
+        # Clean build: the file the App serves doesn't exist yet
+        document = dump_openapi(make_app(openapi_file=path), path)
+        assert "/pets/{pet_id}" in document.schema["paths"]
+
+        # Stale file: the routes win over its contents
+        path.write_text(json.dumps({"openapi": "3.1.0", "info": {}, "paths": {"/stale": {}}}))
+        _clear_all_registries()
+        document = dump_openapi(make_app(openapi_file=path), path)
+
+        assert list(json.loads(path.read_bytes())["paths"]) == ["/pets/{pet_id}"]
+        assert document.body == path.read_bytes()
+
+    def test_cli_dumps_schema(self, tmp_path, monkeypatch, capsys):
+        """Test `python -m fastapi_dishka openapi module:attribute output`."""
+        (tmp_path / "pets_service.py").write_text(APP_MODULE)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        output = tmp_path / "openapi.json"
+
+        assert cli_main(["openapi", "pets_service:app", str(output)]) == 0
+
+        assert json.loads(output.read_bytes())["info"]["title"] == "Pets"
+        assert "Wrote" in capsys.readouterr().out
+
+    def test_cli_rejects_unknown_commands(self, capsys):
+        """Test that an unknown command prints the usage."""
+        assert cli_main(["unknown"]) == 2
+        assert "usage" in capsys.readouterr().err
@@ -0,0 +1,181 @@
+"""Tests for managed resource pools."""
+
+import asyncio
+
+import httpx
+import pytest
+from dishka import FromDishka
+
+from fastapi_dishka import APIRouter, App, Provider, provide_pool, provide_router, start_test, stop_test
+from fastapi_dishka.pooling import PoolClosedError, PoolStats, PoolTimeoutError, ResourcePool
+from fastapi_dishka.providers import _clear_all_registries
+
+
+class FakeConnection:
+    """In-process stand-in for a database connection."""
+
+    opened = 0
+
+    def __init__(self) -> None:
+        FakeConnection.opened += 1
+        self.number = FakeConnection.opened
+        self.closed = False
+        self.healthy = True
+
+
+async def open_connection() -> FakeConnection:
+    return FakeConnection()
+
+
+async def close_connection(connection: FakeConnection) -> None:
+    connection.closed = True
+
+
+async def check_connection(connection: FakeConnection) -> bool:
+    return connection.healthy
+
+
+def make_pool(**options) -> ResourcePool[FakeConnection]:
+    return ResourcePool(open_connection, close=close_connection, health_check=check_connection, **options)
+
+
+pool_router = APIRouter()
+
+
+@pool_router.get("/connection")
+async def get_connection(connection: FromDishka[FakeConnection]):
+    return {"number": connection.number}
+
+
+@pool_router.get("/stats")
+async def get_stats(pool: FromDishka[ResourcePool[FakeConnection]]):
+    return pool.stats.__dict__
+
+
+class TestResourcePool:
+    """Test the pool itself."""
+
+    def setup_method(self):
+        FakeConnection.opened = 0
+
+    @pytest.mark.asyncio
+    async def test_resources_are_reused(self):
+        """Test that a released resource is handed out again instead of opening a new one."""
+        pool = make_pool(idle_timeout=None)
+
+        async with pool.lease() as first:
+            assert pool.stats.in_use == 1
+        async with pool.lease() as second:
+            pass
+
+        assert first is second
+        assert pool.stats == PoolStats(
+            size=1, idle=1, in_use=0, waiting=0, max_size=10, created=1, closed=0, acquire_timeouts=0
+        )
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_a_release_then_times_out(self):
+        """Test that a full pool makes callers wait, up to the acquire timeout."""
+        pool = make_pool(max_size=1, acquire_timeout=0.05, idle_timeout=None)
+        connection = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert pool.stats.waiting == 1
+        await pool.release(connection)
+        assert await waiter is connection
+
+        with pytest.raises(PoolTimeoutError):
+            await pool.acquire()
+        assert pool.stats.acquire_timeouts == 1
+        assert pool.stats.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_resources_are_replaced(self):
+        """Test that an idle resource failing its health check is closed and replaced."""
+        pool = make_pool(idle_timeout=None)
+        connection = await pool.acquire()
+        await pool.release(connection)
+
+        connection.healthy = False
+        replacement = await pool.acquire()
+
+        assert replacement is not connection
+        assert connection.closed
+        assert pool.stats.size == 1
+        assert pool.stats.closed == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_resources_are_reaped_down_to_min_size(self):
+        """Test that resources idle for too long are closed, keeping min_size open."""
+        pool = make_pool(min_size=1, idle_timeout=0.01)
+        await pool.start()
+        connections = [await pool.acquire() for _ in range(3)]
+        for connection in connections:
+            await pool.release(connection)
+
+        await asyncio.sleep(0.05)
+
+        assert pool.stats.size == 1
+        assert pool.stats.closed == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_idle_and_returned_resources(self):
+        """Test that closing the pool closes idle resources now and leased ones on release."""
+        pool = make_pool(min_size=2, idle_timeout=None)
+        await pool.start()
+        leased = await pool.acquire()
+
+        await pool.close()
+        assert pool.stats.size == 1
+
+        await pool.release(leased)
+        assert leased.closed
+        assert pool.stats.size == 0
+        assert pool.stats.closed == 2
+
+        with pytest.raises(PoolClosedError):
+            await pool.acquire()
+
+    def test_invalid_sizes(self):
+        """Test that inconsistent sizes are rejected."""
+        with pytest.raises(ValueError):
+            make_pool(min_size=2, max_size=1)
+        with pytest.raises(ValueError):
+            make_pool(max_size=0)
+
+
+class TestProvidePool:
+    """Test pools declared in providers."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        FakeConnection.opened = 0
+
+    @pytest.mark.asyncio
+    async def test_requests_lease_from_the_app_pool(self):
+        """Test that each request leases a pooled resource that is returned when it ends."""
+
+        class DatabaseProvider(Provider):
+            routes = provide_router(pool_router)
+            connections = provide_pool(FakeConnection, open_connection, close=close_connection, min_size=1)
+
+        app = await start_test(App("Pool Test", "1.0.0", DatabaseProvider()), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            assert (await client.get("/connection")).json() == {"number": 1}
+            assert (await client.get("/connection")).json() == {"number": 1}
+            stats = (await client.get("/stats")).json()
+        pool = await app.app.state.container.get(ResourcePool[FakeConnection])
+        await stop_test(app)
+
+        assert stats["created"] == 1
+        assert stats["in_use"] == 0
+        assert pool.stats.size == 0
+        assert pool.stats.closed == 1
+
+    def test_invalid_sizes_fail_at_declaration(self):
+        """Test that the pool options are checked when the provider is declared."""
+        with pytest.raises(ValueError):
+            provide_pool(FakeConnection, open_connection, min_size=3, max_size=2)
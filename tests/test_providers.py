@@ -8,6 +8,7 @@ from fastapi_dishka import APIRouter, Middleware, provide_middleware, provide_ro
 from fastapi_dishka.app import App
 from fastapi_dishka.providers import (
     MiddlewareCollectorProvider,
+    ProvidedComponents,
     ProviderMeta,
     RouterCollectorProvider,
     _clear_all_registries,
@@ -165,6 +166,56 @@ class TestMiddlewareCollectorProvider:
         assert TestMiddleware1 in middlewares
         assert TestMiddleware2 in middlewares
 
+    def test_inherited_declarations_are_collected(self):
+        """Test that routers and middlewares declared on base providers are collected, bases first."""
+        base_router = APIRouter(prefix="/base")
+        mixin_router = APIRouter(prefix="/mixin")
+        child_router = APIRouter(prefix="/child")
+
+        class BaseMiddleware(Middleware):
+            pass
+
+        class ChildMiddleware(Middleware):
+            pass
+
+        class BaseProvider(Provider, metaclass=ProviderMeta):
+            scope = Scope.APP
+            base = provide_router(base_router)
+            base_middleware = provide_middleware(BaseMiddleware, exclude=["/healthz"])
+
+        class MixinProvider(BaseProvider):
+            mixin = provide_router(mixin_router)
+
+        class ChildProvider(MixinProvider, BaseProvider):
+            child = provide_router(child_router)
+            child_middleware = provide_middleware(ChildMiddleware)
+
+        components = ProvidedComponents.of_providers((ChildProvider(), BaseProvider()))
+
+        assert [router.prefix for router in components.routers] == ["/base", "/mixin", "/child"]
+        assert components.middlewares == [BaseMiddleware, ChildMiddleware]
+        assert components.middleware_filters[BaseMiddleware].exclude == ("/healthz",)
+        assert ChildMiddleware not in components.middleware_filters
+        # Own declarations are unchanged
+        assert ChildProvider._provided_routers == [child_router]  # type: ignore[attr-defined]
+
+    def test_routers_are_deduplicated_by_identity(self):
+        """Test that each router object is collected once, in first-declaration order."""
+        routers = [APIRouter(prefix=f"/r{index}") for index in range(300)]
+        provider_classes = []
+        for index in range(300):
+            # Every provider shares the first router and declares its own
+            namespace = {"scope": Scope.APP}
+            ProviderMeta.__prepare__(f"Generated{index}", (Provider,))
+            namespace["shared"] = provide_router(routers[0])
+            namespace["own"] = provide_router(routers[index])
+            provider_classes.append(ProviderMeta(f"Generated{index}", (Provider,), namespace))
+
+        collected = _collect_routers_from_providers(tuple(provider_class() for provider_class in provider_classes))
+
+        assert len(collected) == 300
+        assert all(router is expected for router, expected in zip(collected, routers))
+
     def test_provide_middlewares_with_empty_list(self):
         """Test that provide_middlewares returns empty list when given empty list."""
         provider = MiddlewareCollectorProvider([])
@@ -0,0 +1,88 @@
+"""Tests for readiness signalling and ephemeral ports in non-blocking mode."""
+
+import asyncio
+import socket
+
+import httpx
+import pytest
+from dishka import Provider, Scope
+
+from fastapi_dishka import APIRouter, App, provide_router, start_test, stop_test
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+readiness_router = APIRouter()
+
+
+@readiness_router.get("/ping")
+async def ping():
+    return {"pong": True}
+
+
+def make_app() -> App:
+    class ReadinessProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        router = provide_router(readiness_router)
+
+    return App("Readiness Test", "1.0.0", ReadinessProvider())
+
+
+class TestReadiness:
+    """Test that non-blocking start reports when the server is ready."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    @pytest.mark.asyncio
+    async def test_start_test_waits_for_ephemeral_port(self):
+        """Test that start_test returns once the server serves on an OS-picked port."""
+        app = await start_test(make_app(), port=0)
+
+        assert app.port
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"http://127.0.0.1:{app.port}/ping")
+        assert response.json() == {"pong": True}
+
+        await stop_test(app)
+
+        assert not app._thread.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_apps_get_distinct_ports(self):
+        """Test that several apps can run side by side without port clashes."""
+        first, second = await asyncio.gather(start_test(make_app(), port=0), start_test(make_app(), port=0))
+
+        assert first.port != second.port
+
+        await asyncio.gather(stop_test(first), stop_test(second))
+
+    def test_start_sync_returns_ready_future(self):
+        """Test that the sync non-blocking start returns a future with the bound port."""
+        app = make_app()
+
+        ready = app.start_sync(blocking=False, port=0)
+
+        port = ready.result(timeout=10)
+        assert port == app.port
+        assert ready is app.ready
+        assert httpx.get(f"http://127.0.0.1:{port}/ping").status_code == 200
+
+        app.stop()
+
+        with pytest.raises(httpx.ConnectError):
+            httpx.get(f"http://127.0.0.1:{port}/ping")
+
+    def test_ready_fails_when_server_cannot_start(self):
+        """Test that the future fails instead of hanging when the port is taken."""
+        with socket.socket() as taken:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen()
+            port = taken.getsockname()[1]
+
+            app = make_app()
+            ready = app.start_sync(blocking=False, port=port)
+
+            with pytest.raises(RuntimeError, match="exited before it started"):
+                ready.result(timeout=10)
+
+            app.stop()
@@ -0,0 +1,166 @@
+"""Tests for the DI-aware response cache middleware."""
+
+import pytest
+from dishka import FromDishka, Provider, Scope, provide
+from fastapi import Response
+from fastapi.testclient import TestClient
+
+from fastapi_dishka import APIRouter, App, provide_middleware, provide_router
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+from fastapi_dishka.response_cache import (
+    CachedResponse,
+    InMemoryResponseCacheStore,
+    ResponseCacheMiddleware,
+    ResponseCacheStore,
+    cache_response,
+)
+
+
+class Catalog:
+    """REQUEST-scoped dependency counting the handler runs."""
+
+    created = 0
+
+    def __init__(self) -> None:
+        Catalog.created += 1
+
+
+catalog_router = APIRouter(prefix="/catalog")
+
+
+@catalog_router.get("/products/{product_id}")
+@cache_response(ttl=60, vary_headers=["Accept-Language"], vary_query=["fields"])
+async def get_product(product_id: int, catalog: FromDishka[Catalog], fields: str = "", page: int = 0):
+    return {"product_id": product_id, "handled": Catalog.created, "fields": fields}
+
+
+@catalog_router.get("/session")
+@cache_response(ttl=60)
+async def get_session(response: Response, catalog: FromDishka[Catalog]):
+    response.set_cookie("session", "secret")
+    return {"handled": Catalog.created}
+
+
+@catalog_router.get("/live")
+async def get_live(catalog: FromDishka[Catalog]):
+    return {"handled": Catalog.created}
+
+
+def make_app(*extra: Provider) -> App:
+    class CacheProvider(Provider, metaclass=ProviderMeta):
+        routes = provide_router(catalog_router)
+        cache = provide_middleware(ResponseCacheMiddleware)
+        catalog = provide(Catalog, scope=Scope.REQUEST)
+
+    return App("Response Cache Test", "1.0.0", CacheProvider(), *extra)
+
+
+class TestResponseCache:
+    """Test that opted-in routes are served from the store."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        Catalog.created = 0
+
+    @pytest.mark.asyncio
+    async def test_hits_skip_the_request_scope_and_handler(self):
+        """Test that a cached response is served without creating REQUEST dependencies."""
+        app = make_app()
+        await app._resolve_container()
+        client = TestClient(app.app)
+
+        first = client.get("/catalog/products/1")
+        second = client.get("/catalog/products/1")
+
+        assert first.json() == second.json() == {"product_id": 1, "handled": 1, "fields": ""}
+        assert second.headers["content-type"] == "application/json"
+        assert Catalog.created == 1
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_key_varies_by_path_params_query_and_headers(self):
+        """Test that the declared path params, query params and headers select the cache entry."""
+        app = make_app()
+        await app._resolve_container()
+        client = TestClient(app.app)
+
+        client.get("/catalog/products/1")
+        client.get("/catalog/products/2")
+        client.get("/catalog/products/1?fields=name")
+        client.get("/catalog/products/1", headers={"Accept-Language": "pt-BR"})
+        assert Catalog.created == 4
+
+        # Undeclared query parameters don't split the cache
+        assert client.get("/catalog/products/1?page=3").json()["handled"] == 1
+        assert Catalog.created == 4
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_responses_and_routes_are_not_stored(self):
+        """Test that responses setting cookies and routes without a policy always run."""
+        app = make_app()
+        await app._resolve_container()
+        client = TestClient(app.app)
+
+        client.get("/catalog/session")
+        client.get("/catalog/session")
+        client.get("/catalog/live")
+        client.get("/catalog/live")
+        client.get("/catalog/products/404a")
+        client.get("/catalog/products/404a")
+
+        assert Catalog.created == 4
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_store_can_be_replaced(self):
+        """Test that a provider of ResponseCacheStore replaces the in-memory default."""
+        shared = InMemoryResponseCacheStore(max_size=10)
+
+        class StoreProvider(Provider):
+            @provide(scope=Scope.APP)
+            def store(self) -> ResponseCacheStore:
+                return shared
+
+        app = make_app(StoreProvider())
+        await app._resolve_container()
+        client = TestClient(app.app)
+
+        client.get("/catalog/products/1")
+
+        assert len(shared) == 1
+
+        await app.close()
+
+
+class TestInMemoryResponseCacheStore:
+    """Test the default store."""
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_are_evicted_least_recently_used(self):
+        """Test expiry and LRU eviction."""
+        store = InMemoryResponseCacheStore(max_size=2)
+        response = CachedResponse(200, (), b"{}")
+
+        await store.set("a", response, ttl=60)
+        await store.set("b", response, ttl=60)
+        await store.get("a")
+        await store.set("c", response, ttl=60)
+
+        assert await store.get("a") is response
+        assert await store.get("b") is None
+        assert len(store) == 2
+
+        await store.set("expired", response, ttl=-1)
+
+        assert await store.get("expired") is None
+        assert len(store) == 1
+
+    def test_ttl_must_be_positive(self):
+        """Test that cache_response() rejects a non-positive ttl."""
+        with pytest.raises(ValueError):
+            cache_response(ttl=0)
@@ -0,0 +1,170 @@
+"""Tests for per-router threadpools of sync endpoints."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+import httpx
+import pytest
+from dishka import FromDishka, Provider, Scope, provide
+
+from fastapi_dishka import APIRouter, App, provide_router, start_test, stop_test
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+from fastapi_dishka.threadpool import SyncThreadPool, ThreadPoolStats
+
+
+class ReportService:
+    """Dependency of the sync endpoints, tracking how many of them run at once."""
+
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def render(self) -> str:
+        with ReportService.lock:
+            ReportService.running += 1
+            ReportService.peak = max(ReportService.peak, ReportService.running)
+        time.sleep(0.1)
+        with ReportService.lock:
+            ReportService.running -= 1
+        return threading.current_thread().name
+
+
+report_router = APIRouter(prefix="/reports", thread_limit=2)
+
+
+@report_router.get("/{report_id}")
+def get_report(report_id: int, reports: FromDishka[ReportService]):
+    return {"report_id": report_id, "thread": reports.render()}
+
+
+@report_router.get("/async/status")
+async def get_status():
+    return {"status": "ok"}
+
+
+def get_export(export_id: int, reports: FromDishka[ReportService]):
+    return {"export_id": export_id, "thread": reports.render()}
+
+
+def make_export_router(executor: ThreadPoolExecutor) -> APIRouter:
+    router = APIRouter(prefix="/exports", sync_executor=executor, sync_executor_capacity=1)
+    router.get("/{export_id}")(get_export)
+    return router
+
+
+def make_app(export_router: Optional[APIRouter] = None) -> App:
+    class ReportProvider(Provider, metaclass=ProviderMeta):
+        reports = provide_router(report_router)
+        exports = provide_router(export_router or APIRouter())
+        service = provide(ReportService, scope=Scope.REQUEST)
+
+    return App("Threadpool Test", "1.0.0", ReportProvider())
+
+
+@pytest.fixture
+def export_executor() -> Iterator[ThreadPoolExecutor]:
+    """A one-thread executor for the export endpoints, shut down after the test."""
+    executor = ThreadPoolExecutor(1, thread_name_prefix="exports")
+    yield executor
+    executor.shutdown()
+
+
+async def wait_for_stats(running: int, waiting: int) -> ThreadPoolStats:
+    """Poll the report router's threadpool until it runs and queues the given number of calls."""
+    stats = report_router.thread_pool_stats
+    while (stats.running, stats.waiting) != (running, waiting):
+        await asyncio.sleep(0.01)
+        stats = report_router.thread_pool_stats
+    return stats
+
+
+class TestRouterThreadpool:
+    """Test sync endpoints running on their router's threadpool."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        ReportService.running = ReportService.peak = 0
+
+    @pytest.mark.asyncio
+    async def test_thread_limit_caps_concurrent_sync_endpoints(self):
+        """Test that a router's thread limit caps its sync endpoints, which still get injected."""
+        completed_before = report_router.thread_pool_stats.completed
+        app = await start_test(make_app(), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            responses = asyncio.gather(*(client.get(f"/reports/{report_id}") for report_id in range(6)))
+            # Two calls run while the other four wait for a thread
+            during = await asyncio.wait_for(wait_for_stats(running=2, waiting=4), timeout=5)
+            status = await client.get("/reports/async/status")
+            results = await responses
+        await stop_test(app)
+
+        assert [response.json()["report_id"] for response in results] == list(range(6))
+        assert status.json() == {"status": "ok"}
+        assert ReportService.peak == 2
+        assert during.saturation == 1.0
+        assert report_router.thread_pool_stats.completed == completed_before + 6
+        assert report_router.thread_pool_stats.running == 0
+
+    @pytest.mark.asyncio
+    async def test_sync_executor_runs_sync_endpoints(self, export_executor):
+        """Test that a router's executor runs its sync endpoints."""
+        export_router = make_export_router(export_executor)
+        app = await start_test(make_app(export_router), port=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app.port}") as client:
+            results = await asyncio.gather(client.get("/exports/1"), client.get("/exports/2"))
+        await stop_test(app)
+
+        assert all(response.json()["thread"].startswith("exports") for response in results)
+        assert ReportService.peak == 1
+        assert export_router.thread_pool_stats.capacity == 1
+
+    def test_routers_without_limit_use_the_global_threadpool(self):
+        """Test that routers have no threadpool of their own by default."""
+        router = APIRouter()
+
+        assert router.thread_pool is None
+        assert router.thread_pool_stats is None
+
+
+class TestSyncThreadPool:
+    """Test the pool itself."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiting_call_is_not_counted(self):
+        """Test that a call cancelled while waiting for a thread leaves the statistics consistent."""
+        pool = SyncThreadPool(limit=1)
+        release = threading.Event()
+
+        blocking = asyncio.create_task(pool.run(release.wait))
+        waiting = asyncio.create_task(pool.run(lambda: True))
+        await asyncio.sleep(0.05)
+        assert pool.stats == ThreadPoolStats(capacity=1, running=1, waiting=1, completed=0)
+
+        waiting.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        await blocking
+
+        assert pool.stats == ThreadPoolStats(capacity=1, running=0, waiting=0, completed=1)
+
+    def test_invalid_options(self, export_executor):
+        """Test that exactly one positive limit or executor is required, and a capacity only with an executor."""
+        with pytest.raises(ValueError):
+            SyncThreadPool()
+        with pytest.raises(ValueError):
+            SyncThreadPool(limit=0)
+        with pytest.raises(ValueError):
+            APIRouter(thread_limit=1, sync_executor=export_executor)
+        with pytest.raises(ValueError):
+            APIRouter(thread_limit=1, sync_executor_capacity=1)
+        with pytest.raises(ValueError):
+            SyncThreadPool(executor=export_executor, capacity=0)
+
+    def test_executor_capacity_is_unknown_unless_given(self, export_executor):
+        """Test that the capacity of an executor isn't guessed from its internals."""
+        assert SyncThreadPool(executor=export_executor).stats.capacity is None
+        assert SyncThreadPool(executor=export_executor).stats.saturation is None
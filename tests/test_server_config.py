@@ -0,0 +1,109 @@
+"""Tests for the uvicorn server configuration."""
+
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from fastapi_dishka import App, ServerConfig
+
+
+class TestServerConfig:
+    """Test validation and conversion of server options."""
+
+    def test_default_config_passes_nothing_to_uvicorn(self):
+        """Test that unset options keep uvicorn's defaults."""
+        assert ServerConfig().to_uvicorn_kwargs() == {}
+
+    def test_set_options_are_passed_to_uvicorn(self):
+        """Test that only explicitly set options are emitted."""
+        config = ServerConfig(http="h11", backlog=512, access_log=False)
+
+        assert config.to_uvicorn_kwargs() == {"http": "h11", "backlog": 512, "access_log": False}
+
+    @pytest.mark.parametrize("preset", [ServerConfig.high_throughput, ServerConfig.low_latency])
+    def test_presets_are_valid(self, preset):
+        """Test that presets work without optional packages installed."""
+        config = preset()
+        config.check_available()
+
+        assert config.to_uvicorn_kwargs()["access_log"] is False
+
+    @pytest.mark.parametrize(
+        ("options", "message"),
+        [
+            ({"loop": "trio"}, "Unknown event loop"),
+            ({"http": "h3"}, "Unknown HTTP implementation"),
+            ({"uds": "/tmp/app.sock", "fd": 3}, "mutually exclusive"),
+            ({"fd": -1}, "valid file descriptor"),
+            ({"backlog": 0}, "backlog must be positive"),
+            ({"limit_concurrency": -5}, "limit_concurrency must be positive"),
+            ({"timeout_keep_alive": -1}, "timeout_keep_alive must not be negative"),
+        ],
+    )
+    def test_invalid_options_are_rejected(self, options, message):
+        """Test that out-of-range values fail on creation."""
+        with pytest.raises(ValueError, match=message):
+            ServerConfig(**options)
+
+    def test_app_rejects_unavailable_implementation(self):
+        """Test that the App validates the configuration at construction time."""
+        with (
+            patch("fastapi_dishka.server.find_spec", return_value=None),
+            pytest.raises(ValueError, match="'uvloop' package is not installed"),
+        ):
+            App("Test App", server_config=ServerConfig(loop="uvloop"))
+
+
+class TestStartWithServerConfig:
+    """Test that every start path forwards the server options."""
+
+    def test_start_sync_blocking(self):
+        """Test that uvicorn.run receives the App's options."""
+        app = App("Test App", server_config=ServerConfig(backlog=256))
+
+        with patch("fastapi_dishka.app.uvicorn.run") as mock_run:
+            app.start_sync(host="localhost", port=9100)
+
+        mock_run.assert_called_once_with(app.app, host="localhost", port=9100, backlog=256)
+
+    def test_start_sync_override(self):
+        """Test that a per-call configuration replaces the App's one."""
+        app = App("Test App", server_config=ServerConfig(backlog=256))
+
+        with patch("fastapi_dishka.app.uvicorn.run") as mock_run:
+            app.start_sync(host="localhost", port=9101, server_config=ServerConfig(limit_concurrency=10))
+
+        mock_run.assert_called_once_with(app.app, host="localhost", port=9101, limit_concurrency=10)
+
+    @pytest.mark.asyncio
+    async def test_start_blocking(self):
+        """Test that the async blocking mode builds uvicorn.Config with the options."""
+        app = App("Test App", server_config=ServerConfig(timeout_keep_alive=30))
+
+        with (
+            patch("fastapi_dishka.app.uvicorn.Config") as mock_config,
+            patch("fastapi_dishka.app.uvicorn.Server") as mock_server,
+        ):
+            mock_server.return_value.serve = AsyncMock()
+            await app.start(host="localhost", port=9102)
+
+        mock_config.assert_called_once_with(app.app, host="localhost", port=9102, timeout_keep_alive=30)
+
+        await app.close()
+
+    def test_non_blocking(self):
+        """Test that the threaded mode builds uvicorn.Config with the options."""
+        app = App("Test App", server_config=ServerConfig(http="h11"))
+
+        with (
+            patch("fastapi_dishka.app.uvicorn.Config") as mock_config,
+            patch("fastapi_dishka.app.uvicorn.Server"),
+            patch("asyncio.new_event_loop"),
+            patch("asyncio.set_event_loop"),
+            patch.object(threading, "Thread") as mock_thread,
+        ):
+            app._start_non_blocking("localhost", 9103)
+            mock_thread.call_args[1]["target"]()
+
+        mock_config.assert_called_once_with(app.app, host="localhost", port=9103, http="h11")
@@ -0,0 +1,110 @@
+"""Tests that the container is built on the event loop serving the requests."""
+
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from dishka import FromDishka, Provider, Scope, provide
+from fastapi.testclient import TestClient
+
+from fastapi_dishka import APIRouter, App, DependencyValidationError, provide_router, start_test, stop_test
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+
+
+class LoopBoundPool:
+    """Stands in for a connection pool: only usable on the loop that created it."""
+
+    closed = 0
+
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+
+
+class Unprovided:
+    """Dependency without a provider."""
+
+
+loop_router = APIRouter()
+
+
+@loop_router.get("/same-loop")
+async def same_loop(pool: FromDishka[LoopBoundPool]):
+    return {"same_loop": pool.loop is asyncio.get_running_loop()}
+
+
+broken_router = APIRouter()
+
+
+@broken_router.get("/broken")
+async def broken(dependency: FromDishka[Unprovided]):
+    return {}
+
+
+def make_app(router: APIRouter = loop_router, **options) -> App:
+    class LoopProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        routes = provide_router(router)
+
+        @provide(scope=Scope.APP)
+        async def pool(self) -> AsyncIterator[LoopBoundPool]:
+            yield LoopBoundPool()
+            LoopBoundPool.closed += 1
+
+    return App("Serving Loop Test", "1.0.0", LoopProvider(), warmup=True, **options)
+
+
+class TestServingLoop:
+    """Test that APP-scope resources belong to the serving loop."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        LoopBoundPool.closed = 0
+
+    def test_start_sync_builds_container_on_uvicorn_loop(self):
+        """Test that a resource created at startup is used on the same loop by requests."""
+        app = make_app()
+
+        port = app.start_sync(blocking=False, port=0).result(timeout=10)
+
+        assert app._container_resolved
+        assert httpx.get(f"http://127.0.0.1:{port}/same-loop").json() == {"same_loop": True}
+
+        app.stop()
+
+        assert LoopBoundPool.closed == 1
+
+    @pytest.mark.asyncio
+    async def test_restart_builds_a_new_container(self):
+        """Test that stopping closes the container and a new start builds a fresh one."""
+        app = await start_test(make_app(), port=0)
+        await stop_test(app)
+
+        await start_test(app, port=0)
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"http://127.0.0.1:{app.port}/same-loop")
+        await stop_test(app)
+
+        assert response.json() == {"same_loop": True}
+        assert LoopBoundPool.closed == 2
+
+    def test_startup_error_fails_ready_future(self):
+        """Test that a validation error at startup is reported through the ready future."""
+        app = make_app(broken_router, validate=True)
+
+        ready = app.start_sync(blocking=False, port=0)
+
+        with pytest.raises(DependencyValidationError):
+            ready.result(timeout=10)
+
+        app.stop()
+
+    def test_test_client_starts_an_unresolved_app(self):
+        """Test that the lifespan of a TestClient builds the container of an App that was never started."""
+        app = make_app()
+
+        with TestClient(app.app) as client:
+            assert client.get("/same-loop").json() == {"same_loop": True}
+
+        assert LoopBoundPool.closed == 1
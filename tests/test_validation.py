@@ -0,0 +1,184 @@
+"""Tests for startup dependency validation and container warmup."""
+
+from typing import Iterator
+
+import pytest
+from dishka import FromDishka, Provider, Scope, provide
+from fastapi.testclient import TestClient
+
+from fastapi_dishka import APIRouter, App, AppDependency, Middleware, provide_middleware, provide_router
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+from fastapi_dishka.validation import DependencyValidationError
+
+
+class Settings:
+    """APP-scoped dependency."""
+
+    created = 0
+
+    def __init__(self) -> None:
+        Settings.created += 1
+
+
+class RequestService:
+    """REQUEST-scoped dependency."""
+
+
+class MissingService:
+    """Dependency without a provider."""
+
+
+valid_router = APIRouter(prefix="/valid")
+
+
+@valid_router.get("/")
+async def valid_endpoint(settings: FromDishka[Settings], service: FromDishka[RequestService]):
+    return {"created": Settings.created}
+
+
+broken_router = APIRouter(prefix="/broken")
+
+
+@broken_router.get("/")
+async def broken_endpoint(missing: FromDishka[MissingService]):
+    return {}
+
+
+class MissingAppDependencyMiddleware(Middleware):
+    missing = AppDependency(MissingService)
+
+
+class DeclaredMissingMiddleware(Middleware):
+    dishka_dependencies = (MissingService,)
+
+
+def make_app(*routers_and_middlewares, **options) -> App:
+    class ValidationProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        settings = provide(Settings, scope=Scope.APP)
+        service = provide(RequestService, scope=Scope.REQUEST)
+        providers = tuple(
+            provide_router(item) if isinstance(item, APIRouter) else provide_middleware(item)
+            for item in routers_and_middlewares
+        )
+
+    return App("Validation Test", "1.0.0", ValidationProvider(), **options)
+
+
+class TestValidation:
+    """Test that missing providers are reported at startup."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        Settings.created = 0
+
+    @pytest.mark.asyncio
+    async def test_valid_graph_passes(self):
+        """Test that an app whose dependencies all have providers starts."""
+        app = make_app(valid_router, validate=True)
+        await app._resolve_container()
+
+        assert TestClient(app.app).get("/valid/").status_code == 200
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_route_dependency_is_reported(self):
+        """Test that a FromDishka type without a provider fails startup."""
+        app = make_app(valid_router, broken_router, validate=True)
+
+        with pytest.raises(DependencyValidationError, match="MissingService required by route GET /broken/") as info:
+            await app._resolve_container()
+
+        assert [dependency.type_hint for dependency in info.value.missing] == [MissingService]
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_middleware_dependencies_are_reported(self):
+        """Test that AppDependency and dishka_dependencies declarations are validated."""
+        app = make_app(MissingAppDependencyMiddleware, DeclaredMissingMiddleware, validate=True)
+
+        with pytest.raises(DependencyValidationError) as info:
+            await app._resolve_container()
+
+        owners = {dependency.owner for dependency in info.value.missing}
+        assert owners == {
+            "middleware MissingAppDependencyMiddleware",
+            "middleware DeclaredMissingMiddleware",
+        }
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_validation_is_opt_in(self):
+        """Test that without validate=True the app still starts lazily."""
+        app = make_app(broken_router)
+        await app._resolve_container()
+
+        assert app._container_resolved
+
+        await app.close()
+
+
+class TestWarmup:
+    """Test eager instantiation of APP-scoped dependencies."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+        Settings.created = 0
+
+    @pytest.mark.asyncio
+    async def test_warmup_instantiates_app_dependencies(self):
+        """Test that APP-scoped factories run before the first request."""
+        app = make_app(valid_router, warmup=True)
+        await app._resolve_container()
+
+        assert Settings.created == 1
+        assert TestClient(app.app).get("/valid/").json() == {"created": 1}
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_without_warmup_dependencies_are_lazy(self):
+        """Test that APP-scoped factories are not run by default."""
+        app = make_app(valid_router)
+        await app._resolve_container()
+
+        assert Settings.created == 0
+
+        await app.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_warmup_releases_built_resources(self):
+        """Test that the APP resources built before a startup error are finalized."""
+        events: list[str] = []
+
+        class Pool:
+            pass
+
+        class Client:
+            pass
+
+        class FailingProvider(Provider, metaclass=ProviderMeta):
+            scope = Scope.APP
+
+            @provide
+            def pool(self) -> Iterator[Pool]:
+                events.append("opened")
+                yield Pool()
+                events.append("closed")
+
+            @provide
+            def client(self, pool: Pool) -> Client:
+                raise RuntimeError("client unavailable")
+
+        app = App("Failing Warmup", "1.0.0", FailingProvider(), warmup=True)
+
+        with pytest.raises(RuntimeError, match="client unavailable"):
+            await app._resolve_container()
+
+        assert events == ["opened", "closed"]
+        assert not app._container_resolved
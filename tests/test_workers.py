@@ -0,0 +1,137 @@
+"""Tests for multi-process serving."""
+
+import os
+import socket
+import threading
+import time
+from typing import Iterator
+
+import httpx
+import pytest
+from dishka import Provider, Scope, provide
+
+from fastapi_dishka import APIRouter, App, provide_router
+from fastapi_dishka.providers import ProviderMeta, _clear_all_registries
+from fastapi_dishka.workers import WorkerSupervisor
+
+workers_router = APIRouter()
+
+
+@workers_router.get("/pid")
+async def pid_endpoint():
+    return {"pid": os.getpid()}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_app(closed_dir) -> App:
+    class WorkerResource:
+        """APP-scoped resource recording its finalization per process."""
+
+    class WorkersProvider(Provider, metaclass=ProviderMeta):
+        scope = Scope.APP
+        router = provide_router(workers_router)
+
+        @provide(scope=Scope.APP)
+        def resource(self) -> Iterator[WorkerResource]:
+            (closed_dir / f"opened-{os.getpid()}").touch()
+            yield WorkerResource()
+            (closed_dir / f"closed-{os.getpid()}").touch()
+
+    return App("Workers Test", "1.0.0", WorkersProvider(), warmup=True)
+
+
+def wait_until(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestWorkers:
+    """Test the pre-fork worker mode."""
+
+    def setup_method(self):
+        """Clear all registries before each test."""
+        _clear_all_registries()
+
+    def test_workers_build_and_close_their_own_containers(self, tmp_path):
+        """Test that every worker resolves its own container and closes it on shutdown."""
+        app = make_app(tmp_path)
+        port = free_port()
+
+        thread = threading.Thread(target=app.start_sync, kwargs={"port": port, "workers": 2}, daemon=True)
+        thread.start()
+
+        assert wait_until(lambda: len(list(tmp_path.glob("opened-*"))) == 2)
+        # The supervisor never builds a container
+        assert not app._container_resolved
+
+        def served() -> bool:
+            try:
+                return httpx.get(f"http://127.0.0.1:{port}/pid").status_code == 200
+            except httpx.TransportError:
+                return False
+
+        assert wait_until(served)
+
+        app.stop()
+        thread.join(timeout=15)
+
+        assert not thread.is_alive()
+        opened = {path.name.split("-")[1] for path in tmp_path.glob("opened-*")}
+        closed = {path.name.split("-")[1] for path in tmp_path.glob("closed-*")}
+        assert opened == closed
+        assert str(os.getpid()) not in opened
+
+    def test_workers_require_blocking_mode(self):
+        """Test that forked workers cannot be combined with the non-blocking thread mode."""
+        app = App("Workers Test")
+
+        with pytest.raises(ValueError, match="blocking mode"):
+            app.start_sync(blocking=False, workers=2)
+
+    @pytest.mark.asyncio
+    async def test_workers_require_unresolved_container(self):
+        """Test that the parent refuses to fork after building a container."""
+        app = App("Workers Test")
+        await app._resolve_container()
+
+        with pytest.raises(RuntimeError, match="Cannot start worker processes"):
+            app.start_sync(workers=2)
+
+        await app.close()
+
+    def test_supervisor_rejects_invalid_worker_count(self):
+        """Test that at least one worker is required."""
+        with pytest.raises(ValueError, match="at least 1"):
+            WorkerSupervisor(lambda sock: None, socket.socket(), workers=0)
+
+    @pytest.mark.asyncio
+    async def test_async_start_refuses_workers(self):
+        """Test that the async start refuses to supervise workers off the main thread."""
+        app = App("Workers Test")
+
+        with pytest.raises(ValueError, match="start_sync"):
+            await app.start(workers=2)
+
+    def test_supervisor_gives_up_on_workers_dying_at_startup(self):
+        """Test that workers dying right after their start are restarted with a backoff, then given up on."""
+        started = time.monotonic()
+        with socket.socket() as sock:
+            supervisor = WorkerSupervisor(
+                lambda sock: os._exit(3), sock, workers=1, restart_delay=0.1, max_early_deaths=3
+            )
+
+            with pytest.raises(RuntimeError, match="3 times in a row"):
+                supervisor.run()
+
+        # Restarted after 0.1s, then after 0.2s
+        assert time.monotonic() - started >= 0.3
+        assert supervisor.processes == []